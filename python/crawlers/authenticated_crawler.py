@@ -6,7 +6,7 @@ This crawler demonstrates production techniques for authenticated crawling:
 - Multi-domain authentication token management
 - Redirect detection without following (prevents auth loops)
 - Rate limiting with lockout prevention
-- Session pooling with keep-alive
+- Concurrent async fetching with pooled keep-alive connections
 - Document relationship mapping
 - Download handling for embedded documents
 
@@ -19,17 +19,41 @@ Security considerations:
 Author: Scott Allen
 """
 
+import asyncio
 import json
 import os
+import queue
+import re
+import sqlite3
+import sys
+import threading
 import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from urllib.parse import urljoin, urlparse
+from typing import DefaultDict, Deque, Dict, List, Optional, Set, Tuple
+from urllib.parse import urljoin, urlparse, urlsplit, urlunsplit
 
+import aiohttp
 import html2text
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
+
+# Prefer the lxml parser (much faster); fall back to the stdlib parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Faster JSON serialization when available
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 # Import document utilities (optional, for cross-referencing)
 try:
@@ -39,6 +63,147 @@ except ImportError:
     HAS_MAPPER = False
 
 
+@lru_cache(maxsize=8192)
+def _netloc(url: str) -> str:
+    """
+    Return a URL's network location.
+
+    Memoized because the same URLs recur constantly, and interned so the
+    per-domain dicts share one string object per domain.
+    """
+    return sys.intern(urlparse(url).netloc)
+
+
+@lru_cache(maxsize=8192)
+def _normalize_url(url: str) -> str:
+    """
+    Canonicalize a URL for deduplication in a single split/unsplit pass:
+    lowercase scheme and host, drop the fragment, and use '/' for an
+    empty path (so 'HTTP://Foo' and 'http://foo/#top' compare equal).
+    """
+    parts = urlsplit(url)
+    return urlunsplit((
+        parts.scheme.lower(),
+        parts.netloc.lower(),
+        parts.path or '/',
+        parts.query,
+        ''
+    ))
+
+
+class SqliteUrlStore:
+    """
+    URL -> depth mapping persisted in one SQLite table.
+
+    Supports the operations the crawler uses on its in-memory visited
+    set and enqueued dict (``in``, ``store[url] = depth``, ``add(url)``,
+    ``len()``), so it can stand in for either. Membership checks hit the
+    primary-key index, so memory stays flat however many URLs a crawl
+    discovers; new URLs are buffered and inserted in batches.
+    """
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        table: str,
+        lock: threading.Lock,
+        batch_size: int = 100
+    ):
+        self._conn = conn
+        self._table = table
+        self._lock = lock
+        self._batch_size = batch_size
+        self._pending: Dict[str, int] = {}
+
+        with self._lock:
+            self._conn.execute(
+                f'CREATE TABLE IF NOT EXISTS {table} '
+                '(url TEXT PRIMARY KEY, depth INTEGER NOT NULL DEFAULT 0)'
+            )
+
+    def __contains__(self, url: str) -> bool:
+        if url in self._pending:
+            return True
+        with self._lock:
+            row = self._conn.execute(
+                f'SELECT 1 FROM {self._table} WHERE url = ?', (url,)
+            ).fetchone()
+        return row is not None
+
+    def __setitem__(self, url: str, depth: int) -> None:
+        self._pending[url] = depth
+        if len(self._pending) >= self._batch_size:
+            self.flush()
+
+    def add(self, url: str) -> None:
+        self[url] = 0
+
+    def __len__(self) -> int:
+        self.flush()
+        with self._lock:
+            return self._conn.execute(f'SELECT COUNT(*) FROM {self._table}').fetchone()[0]
+
+    def flush(self) -> None:
+        """Insert buffered URLs in a single transaction."""
+        if not self._pending:
+            return
+        with self._lock:
+            self._conn.executemany(
+                f'INSERT OR IGNORE INTO {self._table} (url, depth) VALUES (?, ?)',
+                list(self._pending.items())
+            )
+            self._conn.commit()
+        self._pending.clear()
+
+
+class CrawlState:
+    """
+    On-disk visited/enqueued stores for large or resumable crawls.
+
+    URLs that were queued but never fetched are the crawl frontier;
+    reopening the same database picks the crawl up from there.
+    """
+
+    def __init__(self, db_path: Path):
+        """
+        Open (or create) the state database.
+
+        Args:
+            db_path: Path to the SQLite file
+        """
+        # Parse threads check membership too, so share one locked connection
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._lock = threading.Lock()
+
+        self.visited = SqliteUrlStore(self._conn, 'visited', self._lock)
+        self.enqueued = SqliteUrlStore(self._conn, 'enqueued', self._lock)
+
+    def pending(self) -> List[Tuple[str, int]]:
+        """Return (url, depth) for every queued URL not yet visited."""
+        self.flush()
+        with self._lock:
+            return self._conn.execute(
+                'SELECT e.url, e.depth FROM enqueued e '
+                'WHERE NOT EXISTS (SELECT 1 FROM visited v WHERE v.url = e.url) '
+                'ORDER BY e.depth'
+            ).fetchall()
+
+    def flush(self) -> None:
+        """Write all buffered URLs to disk."""
+        if self._conn:
+            self.visited.flush()
+            self.enqueued.flush()
+
+    def close(self) -> None:
+        """Flush and close the database (safe to call more than once)."""
+        if self._conn:
+            self.flush()
+            self._conn.close()
+            self._conn = None
+
+
 class AuthenticatedCrawler:
     """
     A production-grade crawler for authenticated websites.
@@ -49,7 +214,7 @@ class AuthenticatedCrawler:
     - Per-domain auth failure tracking (prevents lockout)
     - Document link extraction and downloading
     - Relationship metadata generation
-    - Connection pooling for efficiency
+    - Bounded pool of asyncio workers sharing one aiohttp session
 
     This is designed for enterprise intranets where:
     - Different subdomains may require different tokens
@@ -57,6 +222,12 @@ class AuthenticatedCrawler:
     - Rate limits must be strictly respected
     """
 
+    # Maximum HTML body read per page (5MB); larger pages are truncated
+    MAX_PAGE_BYTES = 5 * 1024 * 1024
+
+    # Read size when streaming response bodies
+    READ_CHUNK_SIZE = 64 * 1024
+
     def __init__(
         self,
         start_url: str,
@@ -66,7 +237,10 @@ class AuthenticatedCrawler:
         max_pages: int = 500,
         max_depth: int = 10,
         crawl_delay: float = 2.0,
-        max_auth_failures: int = 5
+        max_auth_failures: int = 5,
+        concurrency: int = 16,
+        parse_workers: int = 4,
+        persist_state: bool = False
     ):
         """
         Initialize the authenticated crawler.
@@ -78,35 +252,81 @@ class AuthenticatedCrawler:
             allowed_domains: List of domains allowed to crawl
             max_pages: Maximum pages to crawl
             max_depth: Maximum link depth
-            crawl_delay: Seconds between requests
+            crawl_delay: Minimum seconds between requests to the same domain
             max_auth_failures: Max auth failures before blocking domain
+            concurrency: Number of concurrent fetch workers
+            parse_workers: Threads for HTML parsing/markdown conversion
+            persist_state: Keep visited/queued URLs in output_dir/crawl_state.db
+                           instead of RAM; rerunning resumes from the saved frontier
+                           and appends to files.jsonl
         """
         self.start_url = start_url
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
         # Authentication configuration
-        self.auth_tokens = auth_tokens or {}
+        self.auth_tokens = {
+            sys.intern(domain.lower()): token
+            for domain, token in (auth_tokens or {}).items()
+        }
         self.auth_header = 'X-Crawl-Token'  # Custom header for token
 
-        # Domains
+        # Domains (hosts compare case-insensitively; URLs are normalized to lowercase)
         base_domain = urlparse(start_url).netloc
-        self.allowed_domains = allowed_domains or [base_domain]
+        self.allowed_domains = [d.lower() for d in (allowed_domains or [base_domain])]
 
         # Crawl settings
         self.max_pages = max_pages
         self.max_depth = max_depth
         self.crawl_delay = crawl_delay
         self.max_auth_failures = max_auth_failures
+        self.concurrency = concurrency
+        self.parse_workers = parse_workers
+
+        # State tracking: visited = URLs whose outcome is final (saved, or
+        # rejected as too short / not HTML); enqueued = URL -> depth for
+        # every URL ever queued (a superset of visited). Fetch failures and
+        # pages dropped at max_pages stay pending for a resumed crawl.
+        self._state: Optional[CrawlState] = None
+        pending: List[Tuple[str, int]] = []
+        state_path = self.output_dir / 'crawl_state.db'
+        # Continuing an earlier persisted crawl: files.jsonl is appended to
+        self._continuing = persist_state and state_path.exists()
+        if persist_state:
+            self._state = CrawlState(state_path)
+            self.visited = self._state.visited
+            self.enqueued = self._state.enqueued
+            pending = self._state.pending()
+        else:
+            self.visited = set()
+            self.enqueued = {}
+
+        self._resuming = bool(pending)
+        self.queue: Deque[Tuple[str, int]] = deque(pending)
+
+        seed_url = _normalize_url(start_url)
+        if seed_url not in self.enqueued:
+            self.enqueued[seed_url] = 0
+            self.queue.append((seed_url, 0))
 
-        # State tracking
-        self.visited = set()
-        self.queue: List[Tuple[str, int]] = [(start_url, 0)]
         self.pages_crawled = 0
-        self.saved_files: List[Dict] = []
+        self.files_saved = 0
+
+        # Saved-file records are streamed here as JSON Lines, one per page
+        self.files_index = self.output_dir / 'files.jsonl'
+        self._files_fp = None
+        self._previous_files = 0  # Records left in files.jsonl by earlier runs
+
+        # Background writer thread (keeps disk I/O off the crawl loop)
+        self._write_queue: queue.Queue = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._claimed_paths: Set[Path] = set()
 
         # Auth failure tracking (prevents account lockout)
-        self.auth_failures: Dict[str, int] = {}
+        self.auth_failures: DefaultDict[str, int] = defaultdict(int)
+
+        # Per-domain rate limiting: monotonic time of the next free request slot
+        self._domain_next_ok: Dict[str, float] = {}
 
         # Document mapper for cross-referencing (optional)
         self.doc_mapper = None
@@ -117,28 +337,12 @@ class AuthenticatedCrawler:
             except:
                 pass
 
-        # HTTP session with connection pooling
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'IntranetCrawler/1.0 (Authenticated)'
-        })
-
-        # Connection pooling for efficiency
-        adapter = requests.adapters.HTTPAdapter(
-            pool_connections=10,
-            pool_maxsize=20,
-            max_retries=3,
-            pool_block=False
-        )
-        self.session.mount('http://', adapter)
-        self.session.mount('https://', adapter)
+        # HTTP session and parse pool (created per crawl)
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._parse_pool: Optional[ThreadPoolExecutor] = None
 
-        # HTML to Markdown converter
-        self.h2t = html2text.HTML2Text()
-        self.h2t.ignore_links = False
-        self.h2t.ignore_images = False
-        self.h2t.ignore_emphasis = False
-        self.h2t.body_width = 0
+        # HTML to Markdown converters (HTML2Text is stateful: one per parse thread)
+        self._h2t_local = threading.local()
 
         # Skip patterns
         self.skip_patterns = [
@@ -155,12 +359,50 @@ class AuthenticatedCrawler:
             '.xls', '.xlsx', '.ppt', '.pptx'
         ]
 
+        # Document link patterns (PDFs, Office files, cloud storage)
+        self.doc_patterns = [
+            r'\.pdf$',
+            r'\.docx?$',
+            r'\.xlsx?$',
+            r'\.pptx?$',
+            r'dropbox\.com',
+            r'drive\.google\.com',
+            r'sharepoint\.com'
+        ]
+
+        # Redirect targets that indicate a login page
+        self.login_redirect_indicators = ['login', 'signin', 'sso', 'auth', 'oauth']
+
+        # Login form markers (auth bypassed but failed)
+        self.login_form_indicators = [
+            '<form name="loginform"',
+            'class="login-form"',
+            'id="loginform"',
+            'type="password"'
+        ]
+
+        # Compile each pattern list into a single case-insensitive alternation,
+        # so matching is one pass with no lowercased copy of the URL or page
+        self._skip_re = re.compile(
+            '|'.join(re.escape(p) for p in self.skip_patterns), re.IGNORECASE
+        )
+        self._doc_re = re.compile('|'.join(self.doc_patterns), re.IGNORECASE)
+        self._login_redirect_re = re.compile(
+            '|'.join(re.escape(ind) for ind in self.login_redirect_indicators), re.IGNORECASE
+        )
+        self._login_re = re.compile(
+            '|'.join(re.escape(ind) for ind in self.login_form_indicators), re.IGNORECASE
+        )
+
         print(f"Authenticated Crawler Initialized")
         print(f"  Start URL: {start_url}")
         print(f"  Allowed domains: {self.allowed_domains}")
         print(f"  Auth tokens configured: {len(self.auth_tokens)} domains")
         print(f"  Max pages: {max_pages}")
         print(f"  Crawl delay: {crawl_delay}s")
+        print(f"  Concurrency: {concurrency} workers, {parse_workers} parse threads")
+        if self._resuming:
+            print(f"  Resuming: {len(pending)} URLs pending from previous run")
         print("-" * 60)
 
     def get_token_for_domain(self, url: str) -> Optional[str]:
@@ -173,13 +415,13 @@ class AuthenticatedCrawler:
         Returns:
             Auth token or None
         """
-        domain = urlparse(url).netloc
+        domain = _netloc(url)
         return self.auth_tokens.get(domain)
 
     def is_allowed_domain(self, url: str) -> bool:
         """Check if URL is within allowed domains."""
         try:
-            domain = urlparse(url).netloc
+            domain = _netloc(url)
             return any(
                 domain == d or domain.endswith(f'.{d}')
                 for d in self.allowed_domains
@@ -189,32 +431,58 @@ class AuthenticatedCrawler:
 
     def should_crawl(self, url: str) -> bool:
         """Check if URL should be crawled."""
-        if url in self.visited:
+        if url in self.enqueued:
             return False
 
         if not self.is_allowed_domain(url):
             return False
 
-        return not any(p in url.lower() for p in self.skip_patterns)
+        return not self._skip_re.search(url)
 
     def is_domain_blocked(self, url: str) -> bool:
         """Check if domain has too many auth failures."""
-        domain = urlparse(url).netloc
+        domain = _netloc(url)
         failures = self.auth_failures.get(domain, 0)
         return failures >= self.max_auth_failures
 
     def record_auth_failure(self, url: str) -> None:
         """Record an authentication failure for a domain."""
-        domain = urlparse(url).netloc
-
-        if domain not in self.auth_failures:
-            self.auth_failures[domain] = 0
+        domain = _netloc(url)
         self.auth_failures[domain] += 1
 
-        if self.auth_failures[domain] >= self.max_auth_failures:
-            print(f"  [CRITICAL] Domain {domain} blocked after {self.auth_failures[domain]} failures")
+        failures = self.auth_failures[domain]
+        if failures >= self.max_auth_failures:
+            print(f"  [CRITICAL] Domain {domain} blocked after {failures} failures")
+
+    async def wait_for_domain(self, url: str) -> None:
+        """
+        Reserve the next request slot for a URL's domain and wait for it.
 
-    def fetch_page(self, url: str, redirect_count: int = 0) -> Optional[str]:
+        Slots are spaced crawl_delay apart per domain, so workers hitting
+        different hosts never wait on each other.
+        """
+        domain = _netloc(url)
+        now = time.monotonic()
+        slot = max(self._domain_next_ok.get(domain, 0.0), now)
+        self._domain_next_ok[domain] = slot + self.crawl_delay
+
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    def defer_domain(self, url: str, retry_after: str) -> None:
+        """Push back a domain's next slot based on a Retry-After header."""
+        try:
+            seconds = float(retry_after)
+        except ValueError:
+            return  # HTTP-date form not supported; keep the normal delay
+
+        domain = _netloc(url)
+        next_ok = time.monotonic() + seconds
+        if next_ok > self._domain_next_ok.get(domain, 0.0):
+            self._domain_next_ok[domain] = next_ok
+            print(f"  [INFO] Backing off {domain} for {seconds:.0f}s (Retry-After)")
+
+    async def fetch_page(self, url: str) -> Optional[str]:
         """
         Fetch page with authentication and redirect handling.
 
@@ -224,136 +492,168 @@ class AuthenticatedCrawler:
         - Tracks auth failures per domain
         - Prevents lockout from repeated failures
 
+        Same-domain redirects are followed iteratively (at most
+        MAX_REDIRECTS hops). Every request, including redirect hops,
+        waits for its domain's rate-limit slot.
+
         Args:
             url: URL to fetch
-            redirect_count: Current redirect count (prevents loops)
 
         Returns:
             HTML content or None if failed/blocked
         """
         MAX_REDIRECTS = 3
+        requested_url = url
 
-        if redirect_count > MAX_REDIRECTS:
-            print(f"  [ERROR] Too many redirects ({redirect_count})")
-            return None
+        try:
+            for redirect_count in range(MAX_REDIRECTS + 1):
+                domain = _netloc(url)
 
-        # Check if domain is blocked
-        if self.is_domain_blocked(url):
-            domain = urlparse(url).netloc
-            print(f"  [BLOCKED] Domain {domain} - too many auth failures")
-            return None
+                # Check if domain is blocked
+                if self.is_domain_blocked(url):
+                    print(f"  [BLOCKED] Domain {domain} - too many auth failures")
+                    return None
 
-        try:
-            # Get token for this domain
-            token = self.get_token_for_domain(url)
+                await self.wait_for_domain(url)
 
-            # Prepare headers
-            headers = {
-                'User-Agent': 'IntranetCrawler/1.0 (Authenticated)'
-            }
-            if token:
-                headers[self.auth_header] = token
+                # Get token for this domain
+                token = self.get_token_for_domain(url)
 
-            print(f"\nFetching: {url}")
+                # Prepare headers
+                headers = {}
+                if token:
+                    headers[self.auth_header] = token
 
-            # CRITICAL: Don't follow redirects - detect them
-            response = self.session.get(
-                url,
-                headers=headers,
-                timeout=30,
-                allow_redirects=False  # Key for security
-            )
+                print(f"\nFetching: {url}")
 
-            print(f"  Status: {response.status_code}")
+                # CRITICAL: Don't follow redirects - detect them
+                async with self.session.get(
+                    url,
+                    headers=headers,
+                    allow_redirects=False  # Key for security
+                ) as response:
+                    status = response.status
+                    print(f"  Status: {status}")
 
-            # Handle redirects manually
-            if response.status_code in [301, 302, 303, 307, 308]:
-                redirect_location = response.headers.get('Location', '')
+                    redirect_location = response.headers.get('Location', '')
+                    retry_after = response.headers.get('Retry-After')
+                    html = await self._read_html(response) if status == 200 else None
 
+                if retry_after:
+                    self.defer_domain(url, retry_after)
+
+                if status not in [301, 302, 303, 307, 308]:
+                    break
+
+                # Handle redirects manually
                 # Make absolute if relative
                 if redirect_location.startswith('/'):
-                    parsed = urlparse(url)
-                    redirect_location = f"{parsed.scheme}://{parsed.netloc}{redirect_location}"
+                    scheme = url.split('://', 1)[0]
+                    redirect_location = f"{scheme}://{domain}{redirect_location}"
 
                 print(f"  [REDIRECT] To: {redirect_location}")
 
                 # Block redirects to login pages
-                login_indicators = ['login', 'signin', 'sso', 'auth', 'oauth']
-                if any(ind in redirect_location.lower() for ind in login_indicators):
+                if self._login_redirect_re.search(redirect_location):
                     print(f"  [ERROR] Redirect to login detected - NOT FOLLOWING")
                     print(f"  [ERROR] This prevents account lockout from failed attempts")
                     self.record_auth_failure(url)
                     return None
 
                 # Follow safe same-domain redirects
-                redirect_domain = urlparse(redirect_location).netloc
-                original_domain = urlparse(url).netloc
-
-                if redirect_domain == original_domain:
-                    print(f"  [INFO] Following same-domain redirect...")
-                    time.sleep(1)
-                    return self.fetch_page(redirect_location, redirect_count + 1)
-                else:
+                if _netloc(redirect_location) != domain:
                     print(f"  [WARNING] Cross-domain redirect blocked")
                     return None
 
+                print(f"  [INFO] Following same-domain redirect...")
+                url = redirect_location
+            else:
+                print(f"  [ERROR] Too many redirects ({MAX_REDIRECTS + 1})")
+                return None
+
             # Check for access denied
-            if response.status_code in [401, 403]:
-                print(f"  [ERROR] Access denied (HTTP {response.status_code})")
+            if status in [401, 403]:
+                print(f"  [ERROR] Access denied (HTTP {status})")
                 self.record_auth_failure(url)
                 return None
 
-            if response.status_code != 200:
-                print(f"  [ERROR] HTTP {response.status_code}")
+            if status != 200:
+                print(f"  [ERROR] HTTP {status}")
+                return None
+
+            if html is None:
+                # Not HTML: final, so a resumed crawl won't refetch it
+                self.visited.add(requested_url)
                 return None
 
             # Check for login form in content (auth bypassed but failed)
-            login_indicators = [
-                '<form name="loginform"',
-                'class="login-form"',
-                'id="loginform"',
-                'type="password"'
-            ]
-            if any(ind in response.text.lower() for ind in login_indicators):
+            if self._login_re.search(html):
                 print(f"  [ERROR] Got login form - authentication failed")
                 self.record_auth_failure(url)
                 return None
 
-            return response.text
+            return html
 
-        except requests.exceptions.Timeout:
+        except asyncio.TimeoutError:
             print(f"  [ERROR] Request timeout")
             return None
-        except requests.exceptions.ConnectionError as e:
+        except aiohttp.ClientConnectionError as e:
             print(f"  [ERROR] Connection error: {e}")
             return None
         except Exception as e:
             print(f"  [ERROR] Unexpected: {e}")
             return None
 
-    def clean_content(self, soup: BeautifulSoup) -> BeautifulSoup:
-        """Remove navigation and non-content elements."""
-        for selector in [
-            'nav', 'header', 'footer',
-            '.nav', '.menu', '.navigation', '.sidebar',
-            '.breadcrumb', '.comments', '#comments',
-            '.social-share', 'script', 'style'
-        ]:
-            for element in soup.select(selector):
-                element.decompose()
+    async def _read_html(self, response: aiohttp.ClientResponse) -> Optional[str]:
+        """
+        Stream an HTML response body, capped at MAX_PAGE_BYTES.
+
+        Non-HTML responses are skipped before the body is downloaded, and
+        oversized pages are truncated instead of being read whole.
+
+        Args:
+            response: Open aiohttp response
+
+        Returns:
+            Decoded HTML or None if the response is not HTML
+        """
+        content_type = response.headers.get('Content-Type', '')
+        if content_type and 'html' not in content_type.lower():
+            print(f"  [SKIP] Not HTML ({content_type})")
+            return None
+
+        chunks = []
+        total = 0
+        async for chunk in response.content.iter_chunked(self.READ_CHUNK_SIZE):
+            chunks.append(chunk)
+            total += len(chunk)
+            if total >= self.MAX_PAGE_BYTES:
+                print(f"  [WARNING] Page larger than {self.MAX_PAGE_BYTES // 1024 // 1024} MB, truncating")
+                break
+
+        body = b''.join(chunks)[:self.MAX_PAGE_BYTES]
+        try:
+            return body.decode(response.charset or 'utf-8', errors='replace')
+        except LookupError:
+            # Unknown charset declared by the server
+            return body.decode('utf-8', errors='replace')
+
+    def clean_content(self, soup: Tag) -> Tag:
+        """Remove navigation and non-content elements from a soup or subtree."""
+        # One combined selector walks the tree once instead of once per selector
+        for element in soup.select(
+            'nav, header, footer, '
+            '.nav, .menu, .navigation, .sidebar, '
+            '.breadcrumb, .comments, #comments, '
+            '.social-share, script, style'
+        ):
+            element.decompose()
         return soup
 
     def extract_links(self, soup: BeautifulSoup, base_url: str) -> List[str]:
         """Extract all valid internal links."""
-        links = []
-        for a_tag in soup.find_all('a', href=True):
-            href = a_tag['href']
-            absolute_url = urljoin(base_url, href).split('#')[0]
-
-            if self.should_crawl(absolute_url):
-                links.append(absolute_url)
-
-        return list(set(links))
+        links, _ = self._extract_anchor_data(soup, base_url)
+        return links
 
     def extract_document_links(self, soup: BeautifulSoup) -> List[Dict]:
         """
@@ -362,26 +662,13 @@ class AuthenticatedCrawler:
         Returns:
             List of document link dictionaries
         """
-        doc_patterns = [
-            r'\.pdf$',
-            r'\.docx?$',
-            r'\.xlsx?$',
-            r'\.pptx?$',
-            r'dropbox\.com',
-            r'drive\.google\.com',
-            r'sharepoint\.com'
-        ]
-
         documents = []
-        import re
 
         for a_tag in soup.find_all('a', href=True):
             href = a_tag['href']
             text = a_tag.get_text(strip=True)
 
-            is_doc = any(re.search(p, href, re.IGNORECASE) for p in doc_patterns)
-
-            if is_doc:
+            if self._doc_re.search(href):
                 documents.append({
                     'url': href,
                     'text': text
@@ -389,6 +676,40 @@ class AuthenticatedCrawler:
 
         return documents
 
+    def _extract_anchor_data(
+        self,
+        soup: BeautifulSoup,
+        base_url: str
+    ) -> Tuple[List[str], List[Dict]]:
+        """
+        Walk the page's anchors once, collecting crawlable links and
+        document links together.
+
+        Returns:
+            Tuple of (crawlable absolute URLs, document link dictionaries)
+        """
+        links = []
+        documents = []
+        seen = set()
+
+        for a_tag in soup.find_all('a', href=True):
+            href = a_tag['href']
+
+            # Dedupe in page order before running the (costlier) crawl filters
+            absolute_url = _normalize_url(urljoin(base_url, href))
+            if absolute_url not in seen:
+                seen.add(absolute_url)
+                if self.should_crawl(absolute_url):
+                    links.append(absolute_url)
+
+            if self._doc_re.search(href):
+                documents.append({
+                    'url': href,
+                    'text': a_tag.get_text(strip=True)
+                })
+
+        return links, documents
+
     def extract_content(self, html: str, url: str) -> Tuple[str, str, List[str], Dict]:
         """
         Extract content, links, and document relationships.
@@ -396,17 +717,14 @@ class AuthenticatedCrawler:
         Returns:
             Tuple of (title, markdown, links, relationship_metadata)
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, HTML_PARSER)
 
         # Get title
         title_elem = soup.find('title')
         title = title_elem.get_text(strip=True) if title_elem else urlparse(url).path
 
-        # Extract links BEFORE cleaning
-        links = self.extract_links(soup, url)
-
-        # Extract document links
-        doc_links = self.extract_document_links(soup)
+        # Extract page and document links BEFORE cleaning (one anchor pass)
+        links, doc_links = self._extract_anchor_data(soup, url)
 
         # Generate relationship metadata
         relationship_metadata = {
@@ -415,28 +733,46 @@ class AuthenticatedCrawler:
             'page_type': 'navigation' if len(doc_links) >= 3 else 'content'
         }
 
-        # Now clean for markdown extraction
-        soup_clean = BeautifulSoup(html, 'html.parser')
-        soup_clean = self.clean_content(soup_clean)
+        # Links are already extracted, so clean the same soup in place
+        # before choosing the main content (a .content inside a header is
+        # removed, never selected)
+        self.clean_content(soup)
 
         # Find main content
         main_content = None
         for selector in ['main', 'article', '.content', '.entry-content', '#content', 'body']:
-            main_content = soup_clean.select_one(selector)
+            main_content = soup.select_one(selector)
             if main_content:
                 break
 
         if not main_content:
             return None, None, [], {}
 
+        # Pages this short are discarded by the crawl loop anyway,
+        # so skip the (expensive) markdown conversion for them
+        if len(main_content.get_text(' ', strip=True)) < 100:
+            return title, '', links, relationship_metadata
+
         # Convert to markdown
         try:
-            markdown = self.h2t.handle(str(main_content))
+            markdown = self._get_h2t().handle(str(main_content))
         except:
             markdown = main_content.get_text()
 
         return title, markdown, links, relationship_metadata
 
+    def _get_h2t(self) -> html2text.HTML2Text:
+        """Return this thread's HTML to Markdown converter, creating it on first use."""
+        h2t = getattr(self._h2t_local, 'h2t', None)
+        if h2t is None:
+            h2t = html2text.HTML2Text()
+            h2t.ignore_links = False
+            h2t.ignore_images = False
+            h2t.ignore_emphasis = False
+            h2t.body_width = 0
+            self._h2t_local.h2t = h2t
+        return h2t
+
     def save_content(self, title: str, url: str, markdown: str, metadata: Dict) -> str:
         """Save content to markdown file."""
         # Create safe filename
@@ -454,95 +790,234 @@ class AuthenticatedCrawler:
 
         filepath = self.output_dir / f"{filename}.md"
 
-        # Handle duplicates
+        # Handle duplicates (including files still waiting in the write queue)
         counter = 1
-        while filepath.exists():
+        while filepath.exists() or filepath in self._claimed_paths:
             filepath = self.output_dir / f"{filename}_{counter}.md"
             counter += 1
-
-        # Build content
-        full_content = f"""# {title}
-
-**Source:** {url}
-**Crawled:** {datetime.now().isoformat()}
-**Page Type:** {metadata.get('page_type', 'content')}
-**Linked Documents:** {metadata.get('linked_document_count', 0)}
-
----
-
-{markdown}
-"""
+        self._claimed_paths.add(filepath)
+
+        # Build content as parts and join once (no repeated concatenation)
+        parts = [
+            f"# {title}\n\n"
+            f"**Source:** {url}\n"
+            f"**Crawled:** {datetime.now().isoformat()}\n"
+            f"**Page Type:** {metadata.get('page_type', 'content')}\n"
+            f"**Linked Documents:** {metadata.get('linked_document_count', 0)}\n\n"
+            "---\n\n",
+            markdown,
+            "\n"
+        ]
 
         # Add linked documents section
         if metadata.get('linked_documents'):
-            full_content += "\n\n## Related Documents\n\n"
-            for doc in metadata['linked_documents']:
-                full_content += f"- [{doc['text']}]({doc['url']})\n"
+            parts.append("\n\n## Related Documents\n\n")
+            parts.extend(
+                f"- [{doc['text']}]({doc['url']})\n"
+                for doc in metadata['linked_documents']
+            )
 
-        filepath.write_text(full_content, encoding='utf-8')
+        # Encode once; the writer only has to hand bytes to the OS
+        full_content = ''.join(parts).encode('utf-8')
+
+        if self._writer:
+            self._write_queue.put((filepath, full_content))
+        else:
+            filepath.write_bytes(full_content)
         print(f"  [OK] Saved: {filepath.name}")
 
         return str(filepath)
 
+    def _start_writer(self) -> None:
+        """Start the background thread that writes markdown files."""
+        self._writer = threading.Thread(
+            target=self._writer_loop, name='crawl-writer', daemon=True
+        )
+        self._writer.start()
+
+    def _writer_loop(self) -> None:
+        """Write queued (path, bytes) pairs until the stop sentinel arrives."""
+        while True:
+            item = self._write_queue.get()
+            if item is None:
+                break
+
+            filepath, content = item
+            try:
+                filepath.write_bytes(content)
+            except OSError as e:
+                print(f"  [ERROR] Writing {filepath.name}: {e}")
+
+    def _stop_writer(self) -> None:
+        """Flush pending writes and stop the writer thread."""
+        if self._writer:
+            self._write_queue.put(None)
+            self._writer.join()
+            self._writer = None
+
     def crawl(self) -> Dict:
-        """Main crawl loop."""
+        """
+        Main crawl loop.
+
+        Runs a bounded pool of asyncio workers over a shared queue so
+        fetches overlap instead of waiting on each other; politeness is
+        enforced per domain by wait_for_domain(). Parsing and
+        markdown conversion run in a small dedicated thread pool, which
+        keeps the event loop free for network I/O and bounds how many
+        parsed pages are held in memory at once.
+
+        Returns:
+            Summary dictionary with crawl statistics
+        """
         print(f"\n{'=' * 60}")
         print("Starting Authenticated Crawl")
         print(f"{'=' * 60}\n")
 
-        while self.queue and self.pages_crawled < self.max_pages:
-            url, depth = self.queue.pop(0)
+        return asyncio.run(self._crawl_async())
 
-            if url in self.visited or depth > self.max_depth:
-                continue
+    async def _crawl_async(self) -> Dict:
+        """Seed the work queue, run the workers, and save the summary."""
+        # Only a fresh crawl starts the index over; a continued one (even
+        # one with nothing left in its queue) keeps the earlier records
+        if self._continuing and self.files_index.exists():
+            with open(self.files_index, 'rb') as f:
+                self._previous_files = sum(1 for _ in f)
+            self._files_fp = open(self.files_index, 'ab')
+        else:
+            self._files_fp = open(self.files_index, 'wb')
+        self._start_writer()
+        self._parse_pool = ThreadPoolExecutor(
+            max_workers=self.parse_workers, thread_name_prefix='crawl-parse'
+        )
 
-            self.visited.add(url)
+        work_queue: asyncio.Queue = asyncio.Queue()
+        while self.queue:
+            work_queue.put_nowait(self.queue.popleft())
+
+        connector = aiohttp.TCPConnector(limit=64, limit_per_host=8, keepalive_timeout=30)
+        async with aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=30),
+            headers={'User-Agent': 'IntranetCrawler/1.0 (Authenticated)'}
+        ) as session:
+            self.session = session
+
+            workers = [
+                asyncio.create_task(self._worker(work_queue))
+                for _ in range(self.concurrency)
+            ]
+            await work_queue.join()
+
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        self.session = None
+        self._parse_pool.shutdown(wait=True)
+        self._parse_pool = None
 
-            print(f"\n[Depth {depth}] [{self.pages_crawled + 1}/{self.max_pages}]")
+        # Save summary
+        return self.save_summary()
 
-            # Fetch page
-            html = self.fetch_page(url)
-            if not html:
-                continue
+    async def _worker(self, work_queue: asyncio.Queue) -> None:
+        """Process URLs from the shared queue until cancelled."""
+        while True:
+            url, depth = await work_queue.get()
+            try:
+                await self._crawl_url(url, depth, work_queue)
+            except Exception as e:
+                print(f"  [ERROR] Unexpected: {e}")
+            finally:
+                work_queue.task_done()
+
+    async def _crawl_url(self, url: str, depth: int, work_queue: asyncio.Queue) -> None:
+        """Fetch, extract, and save a single URL, queueing its links."""
+        if self.pages_crawled >= self.max_pages:
+            return
+
+        # URLs are deduplicated at enqueue time, so only depth needs checking
+        if depth > self.max_depth:
+            return
+
+        print(f"\n[Depth {depth}] [{self.pages_crawled + 1}/{self.max_pages}]")
+
+        # Fetch page (failures are left unvisited, so a resume retries them)
+        html = await self.fetch_page(url)
+        if not html:
+            return
+
+        # Extract content (CPU-bound, keep it off the event loop)
+        loop = asyncio.get_running_loop()
+        title, markdown, links, metadata = await loop.run_in_executor(
+            self._parse_pool, self.extract_content, html, url
+        )
 
-            # Extract content
-            title, markdown, links, metadata = self.extract_content(html, url)
+        if not markdown or len(markdown.strip()) < 100:
+            print(f"  [WARNING] Content too short, skipping")
+            self.visited.add(url)
+            return
+
+        # Another worker may have reached the limit while we were fetching
+        # (the page stays pending for a resumed crawl)
+        if self.pages_crawled >= self.max_pages:
+            return
+
+        # Save content
+        filepath = self.save_content(title, url, markdown, metadata)
+        self.record_saved_file({
+            'url': url,
+            'title': title,
+            'file': filepath,
+            'metadata': metadata
+        })
+        self.pages_crawled += 1
+        self.visited.add(url)
+
+        # Queue new links
+        if depth < self.max_depth:
+            new_links = [l for l in links if l not in self.enqueued]
+            for link in new_links:
+                self.enqueued[link] = depth + 1
+                work_queue.put_nowait((link, depth + 1))
+            print(f"  Added {len(new_links)} links to queue")
+
+    def record_saved_file(self, entry: Dict) -> None:
+        """Append a saved-file record to files.jsonl and flush it."""
+        if HAS_ORJSON:
+            line = orjson.dumps(entry) + b'\n'
+        else:
+            line = json.dumps(entry).encode('utf-8') + b'\n'
 
-            if not markdown or len(markdown.strip()) < 100:
-                print(f"  [WARNING] Content too short, skipping")
-                continue
+        self._files_fp.write(line)
+        self._files_fp.flush()
+        self.files_saved += 1
 
-            # Save content
-            filepath = self.save_content(title, url, markdown, metadata)
-            self.saved_files.append({
-                'url': url,
-                'title': title,
-                'file': filepath,
-                'metadata': metadata
-            })
-            self.pages_crawled += 1
+    def save_summary(self) -> Dict:
+        """
+        Save crawl summary.
 
-            # Queue new links
-            if depth < self.max_depth:
-                new_links = [l for l in links if l not in self.visited]
-                for link in new_links:
-                    self.queue.append((link, depth + 1))
-                print(f"  Added {len(new_links)} links to queue")
+        Per-file records are already on disk in files.jsonl, so the
+        summary only holds aggregate stats and a pointer to that file.
+        """
+        self._stop_writer()
 
-            # Rate limiting
-            time.sleep(self.crawl_delay)
+        if self._state:
+            self._state.close()
 
-        # Save summary
-        return self.save_summary()
+        if self._files_fp:
+            self._files_fp.close()
+            self._files_fp = None
 
-    def save_summary(self) -> Dict:
-        """Save crawl summary."""
+        # Totals cover files.jsonl as a whole, including earlier runs of a
+        # continued crawl
         summary = {
             'crawled_at': datetime.now().isoformat(),
             'start_url': self.start_url,
-            'total_pages': self.pages_crawled,
-            'auth_failures_by_domain': self.auth_failures,
-            'files': self.saved_files,
+            'total_pages': self._previous_files + self.pages_crawled,
+            'pages_this_run': self.pages_crawled,
+            'files_saved': self._previous_files + self.files_saved,
+            'files_index': str(self.files_index),
+            'auth_failures_by_domain': dict(self.auth_failures),
             'config': {
                 'max_pages': self.max_pages,
                 'max_depth': self.max_depth,
@@ -558,7 +1033,9 @@ class AuthenticatedCrawler:
         print("Crawl Complete!")
         print(f"{'=' * 60}")
         print(f"  Pages crawled: {self.pages_crawled}")
-        print(f"  Files saved: {len(self.saved_files)}")
+        if self._previous_files:
+            print(f"  Earlier runs: {self._previous_files} pages")
+        print(f"  Files saved: {self._previous_files + self.files_saved}")
         print(f"  Auth failures: {sum(self.auth_failures.values())}")
         print(f"  Summary: {summary_path}")
 
@@ -642,7 +1119,9 @@ if __name__ == '__main__':
         auth_tokens=AUTH_TOKENS,
         allowed_domains=[domain],
         max_pages=100,
-        crawl_delay=2.0
+        crawl_delay=2.0,
+        concurrency=8,
+        parse_workers=2
     )
 
     try:
@@ -13,18 +13,188 @@ This module demonstrates production-ready web crawling techniques:
 Author: Scott Allen
 """
 
+import asyncio
+import heapq
+import itertools
 import json
+import os
 import re
-import time
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from urllib.parse import urljoin, urlparse
 
+import aiohttp
 import html2text
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+
+# Prefer the lxml parser (much faster); fall back to the stdlib parser
+try:
+    import lxml.html
+    from lxml import etree
+    HTML_PARSER = 'lxml'
+    HAS_LXML = True
+except ImportError:
+    HTML_PARSER = 'html.parser'
+    HAS_LXML = False
+
+# Optional: markdownify converts the parsed tree directly, without
+# serializing it back to HTML for html2text to re-parse
+try:
+    from markdownify import MarkdownConverter
+    HAS_MARKDOWNIFY = True
+except ImportError:
+    HAS_MARKDOWNIFY = False
+
+# Optional: Bloom filter for the seen-URL set on very large crawls
+try:
+    from pybloom_live import ScalableBloomFilter
+    HAS_BLOOM = True
+except ImportError:
+    HAS_BLOOM = False
+
+# Faster JSON serialization when available
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Strainers so each parse only builds the nodes it needs
+CONTENT_STRAINER = SoupStrainer(['main', 'article'])
+LINK_STRAINER = SoupStrainer(['title', 'a'])
+BODY_STRAINER = SoupStrainer('body')
+
+# Cheap text scan that tells whether CONTENT_STRAINER can match at all
+CONTENT_TAG_RE = re.compile(r'<(?:main|article)\b', re.IGNORECASE)
+
+# Precompiled patterns for markdown and filename cleanup
+BLANK_LINES_RE = re.compile(r'\n{3,}')
+PAGE_EXT_RE = re.compile(r'\.(html?|php|aspx?)$', re.IGNORECASE)
+NON_WORD_RE = re.compile(r'[^\w\-]')
+DASHES_RE = re.compile(r'-+')
+
+# <meta charset="..."> / http-equiv Content-Type declarations near the top of a page
+META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?([\w.:-]+)', re.IGNORECASE)
+
+
+def decode_html(body: bytes, charset: Optional[str] = None) -> str:
+    """
+    Decode an HTML response body without statistical charset detection.
+
+    Uses the Content-Type charset, then a <meta> charset declaration in
+    the first 2 KB, then UTF-8. Decoding once here means BeautifulSoup
+    gets text and never has to sniff the encoding itself.
+
+    Args:
+        body: Raw response bytes
+        charset: Charset from the Content-Type header, if any
+
+    Returns:
+        Decoded HTML
+    """
+    if not charset:
+        match = META_CHARSET_RE.search(body, 0, 2048)
+        if match:
+            charset = match.group(1).decode('ascii')
+
+    try:
+        return body.decode(charset or 'utf-8', errors='replace')
+    except LookupError:
+        # Unknown charset declared by the page
+        return body.decode('utf-8', errors='replace')
+
+
+def write_json(path: Path, data) -> None:
+    """Write data as indented JSON, using orjson when it is installed."""
+    if HAS_ORJSON:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_text(json.dumps(data, indent=2))
+
+
+def jsonl_line(entry: Dict) -> bytes:
+    """Serialize one record as a JSON Lines row."""
+    if HAS_ORJSON:
+        return orjson.dumps(entry) + b'\n'
+    return json.dumps(entry).encode('utf-8') + b'\n'
+
+
+def compile_patterns(patterns: List[str], suffix: bool = False, flags: int = 0) -> re.Pattern:
+    """
+    Compile literal substrings into one alternation regex.
+
+    Args:
+        patterns: Literal strings to match
+        suffix: Only match at the end of the string
+        flags: Regex flags (e.g. re.IGNORECASE)
+
+    Returns:
+        Compiled pattern (never matches if patterns is empty)
+    """
+    if not patterns:
+        return re.compile(r'(?!)')
+
+    alternation = '|'.join(map(re.escape, patterns))
+    return re.compile(f"(?:{alternation}){'$' if suffix else ''}", flags)
+
+
+# Per-process crawler copy used by parse worker processes
+_worker_crawler = None
+
+
+def _init_parse_worker(crawler: 'BaseCrawler') -> None:
+    """ProcessPoolExecutor initializer: keep a copy of the crawler's settings."""
+    global _worker_crawler
+    _worker_crawler = crawler
+
+
+def _parse_in_worker(html: str, url: str, depth: int) -> Optional[Dict]:
+    """Run the worker's crawler parse_page (top-level so it can be pickled)."""
+    return _worker_crawler.parse_page(html, url, depth)
+
+
+@lru_cache(maxsize=100_000)
+def _normalize_url(url: str) -> str:
+    """Memoized BaseCrawler.normalize_url (the same links recur on every page)."""
+    # Remove fragment
+    url = url.split('#')[0]
+
+    # Ensure https
+    url = url.replace('http://', 'https://')
+
+    # Remove trailing slash for consistency
+    url = url.rstrip('/')
+
+    return url
+
+
+@lru_cache(maxsize=100_000)
+def _url_to_filename(url: str) -> str:
+    """Memoized BaseCrawler.url_to_filename."""
+    parsed = urlparse(url)
+    path = parsed.path.strip('/')
+
+    if not path:
+        path = 'index'
+
+    # Remove file extensions
+    path = PAGE_EXT_RE.sub('', path)
+
+    # Replace path separators with dashes
+    path = path.replace('/', '-')
+
+    # Clean up: keep only alphanumeric, dash, underscore
+    path = NON_WORD_RE.sub('-', path)
+    path = DASHES_RE.sub('-', path)  # Collapse multiple dashes
+    path = path.strip('-')
+
+    return path or 'index'
 
 
 class BaseCrawler(ABC):
@@ -33,6 +203,7 @@ class BaseCrawler(ABC):
 
     Provides common functionality:
     - HTTP session management with connection pooling
+    - Concurrent fetching over a shared aiohttp session
     - URL filtering and normalization
     - Content cleaning and markdown conversion
     - Rate limiting
@@ -43,6 +214,19 @@ class BaseCrawler(ABC):
     - should_skip_url(): Custom URL filtering logic
     """
 
+    # Connections kept per host by the sync session (one per sitemap worker thread)
+    SYNC_POOL_SIZE = 8
+
+    # URLs whose should_skip_url() result is remembered before the memo is reset
+    SKIP_CACHE_SIZE = 100_000
+
+    # Crawl-time state left out when the crawler is pickled for parse workers
+    RUNTIME_STATE = (
+        'session', 'async_session', '_parse_pool', '_writer', '_h2t_local',
+        'visited', 'enqueued', 'queue', '_queue_counter', '_files_fp',
+        'errors', '_name_counter', '_claimed_names', '_skip_cache'
+    )
+
     def __init__(
         self,
         base_url: str,
@@ -50,7 +234,11 @@ class BaseCrawler(ABC):
         max_pages: int = 500,
         max_depth: int = 5,
         crawl_delay: float = 1.0,
-        user_agent: str = "DocumentCrawler/1.0"
+        user_agent: str = "DocumentCrawler/1.0",
+        concurrency: int = 4,
+        parse_workers: int = 2,
+        bloom_filter: bool = False,
+        parse_processes: bool = False
     ):
         """
         Initialize the crawler.
@@ -62,45 +250,76 @@ class BaseCrawler(ABC):
             max_depth: Maximum link depth from seed URLs
             crawl_delay: Seconds to wait between requests (be polite!)
             user_agent: User-Agent header for requests
+            concurrency: Maximum pages fetched at the same time
+            parse_workers: Threads used for HTML parsing and markdown conversion
+            bloom_filter: Track queued URLs in a Bloom filter (~0.1% of new
+                URLs wrongly treated as seen) to bound memory on huge sites
+            parse_processes: Parse in a process pool (one per CPU) instead of
+                threads, so parsing isn't serialized by the GIL
         """
         self.base_url = base_url
         self.output_dir = Path(output_dir)
         self.max_pages = max_pages
         self.max_depth = max_depth
         self.crawl_delay = crawl_delay
+        self.user_agent = user_agent
+        self.concurrency = max(1, concurrency)
+        self.parse_workers = max(1, parse_workers)
+        self.parse_processes = parse_processes
 
         # Create output directory
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
         # Tracking state
         self.visited: Set[str] = set()
-        self.queue: List[Tuple[str, int, int]] = []  # (url, depth, priority)
+        self.enqueued: Set[str] = set()  # Every URL ever queued, so each is queued once
+        if bloom_filter:
+            if HAS_BLOOM:
+                self.enqueued = ScalableBloomFilter(
+                    initial_capacity=10000,
+                    error_rate=0.001,
+                    mode=ScalableBloomFilter.LARGE_SET_GROWTH
+                )
+            else:
+                print("[WARNING] pybloom_live not installed, using an exact URL set")
+        # Min-heap of (priority, depth, counter, url); counter keeps FIFO order within ties
+        self.queue: List[Tuple[int, int, int, str]] = []
+        self._queue_counter = itertools.count()
         self.pages_crawled = 0
-        self.saved_files: List[str] = []
-        self.url_to_file: Dict[str, str] = {}
+        self.files_saved = 0
+        # Saved files are recorded line-by-line in files.jsonl, not kept in memory
+        self.files_index = self.output_dir / 'files.jsonl'
+        self._files_fp = None
         self.errors: List[Dict] = []
+        self._name_counter: Dict[str, int] = {}  # Next suffix per base filename
+        self._claimed_names: Set[str] = set()
 
-        # Initialize HTTP session with connection pooling
+        # Sync HTTP session with connection pooling (sitemaps, one-off requests)
         self.session = requests.Session()
         self.session.headers.update({'User-Agent': user_agent})
 
-        # Enable connection pooling for efficiency
+        # Enable connection pooling for efficiency. The crawl targets one host,
+        # so a single host pool sized to the threads that use it is enough;
+        # blocking (instead of opening throwaway extra connections) keeps
+        # every request on a reused keep-alive connection.
         adapter = requests.adapters.HTTPAdapter(
-            pool_connections=10,
-            pool_maxsize=20,
+            pool_connections=2,
+            pool_maxsize=self.SYNC_POOL_SIZE,
             max_retries=3,
-            pool_block=False
+            pool_block=True
         )
         self.session.mount('http://', adapter)
         self.session.mount('https://', adapter)
 
-        # Initialize HTML to Markdown converter
-        self.h2t = html2text.HTML2Text()
-        self.h2t.ignore_links = False
-        self.h2t.ignore_images = True
-        self.h2t.ignore_emphasis = False
-        self.h2t.body_width = 0  # Don't wrap lines
-        self.h2t.skip_internal_links = False
+        # Async session and parse pool for page crawling (created per crawl)
+        self.async_session: Optional[aiohttp.ClientSession] = None
+        self._parse_pool: Optional[Executor] = None
+        self._writer: Optional[ThreadPoolExecutor] = None  # Background file writes
+
+        # HTML to Markdown converters (HTML2Text is stateful: one per parse thread)
+        self._h2t_local = threading.local()
+        if HAS_MARKDOWNIFY:
+            self._md_converter = MarkdownConverter(heading_style='ATX', strip=['img'])
 
         # Common patterns to skip (override in subclass to customize)
         self.default_skip_patterns = [
@@ -123,14 +342,50 @@ class BaseCrawler(ABC):
             '.ico', '.css', '.js', '.woff', '.ttf'
         ]
 
+        # Compiled from the lists above on first use, so subclasses can
+        # still customize them in their own __init__
+        self._skip_re: Optional[re.Pattern] = None
+        self._skip_ext_re: Optional[re.Pattern] = None
+
+        # should_skip_url() results by URL, per instance (they depend on its settings)
+        self._skip_cache: Dict[str, bool] = {}
+
         print(f"Initialized {self.__class__.__name__}")
         print(f"  Base URL: {base_url}")
         print(f"  Output: {output_dir}")
         print(f"  Max pages: {max_pages}")
         print(f"  Max depth: {max_depth}")
         print(f"  Delay: {crawl_delay}s")
+        if parse_processes:
+            print(f"  Concurrency: {self.concurrency} fetches, {os.cpu_count()} parse processes")
+        else:
+            print(f"  Concurrency: {self.concurrency} fetches, {self.parse_workers} parse workers")
+        if not isinstance(self.enqueued, set):
+            print("  Seen URLs: Bloom filter")
         print("-" * 60)
 
+    def __getstate__(self) -> Dict:
+        """Pickle only settings, for shipping the crawler to parse worker processes."""
+        return {k: v for k, v in self.__dict__.items() if k not in self.RUNTIME_STATE}
+
+    def __setstate__(self, state: Dict) -> None:
+        """Restore settings with fresh, empty runtime state."""
+        self.__dict__.update(state)
+        self.session = None
+        self.async_session = None
+        self._parse_pool = None
+        self._writer = None
+        self._h2t_local = threading.local()
+        self.visited = set()
+        self.enqueued = set()
+        self.queue = []
+        self._queue_counter = itertools.count()
+        self._files_fp = None
+        self.errors = []
+        self._name_counter = {}
+        self._claimed_names = set()
+        self._skip_cache = {}
+
     @abstractmethod
     def get_seed_urls(self) -> List[str]:
         """
@@ -150,22 +405,30 @@ class BaseCrawler(ABC):
         Returns:
             True if URL should be skipped
         """
-        # Must be same domain
-        if not url.startswith(self.base_url):
-            return True
-
-        # Check default skip patterns
-        for pattern in self.default_skip_patterns:
-            if pattern in url:
-                return True
-
-        # Check file extensions
-        url_lower = url.lower()
-        for ext in self.skip_extensions:
-            if url_lower.endswith(ext):
-                return True
+        # The same links recur on every page
+        skip = self._skip_cache.get(url)
+        if skip is not None:
+            return skip
+
+        if self._skip_re is None:
+            self._skip_re = compile_patterns(self.default_skip_patterns)
+            self._skip_ext_re = compile_patterns(
+                self.skip_extensions, suffix=True, flags=re.IGNORECASE
+            )
+
+        skip = (
+            # Must be same domain
+            not url.startswith(self.base_url)
+            # Check default skip patterns
+            or self._skip_re.search(url) is not None
+            # Check file extensions
+            or self._skip_ext_re.search(url) is not None
+        )
 
-        return False
+        if len(self._skip_cache) >= self.SKIP_CACHE_SIZE:
+            self._skip_cache.clear()
+        self._skip_cache[url] = skip
+        return skip
 
     def normalize_url(self, url: str) -> str:
         """
@@ -177,16 +440,7 @@ class BaseCrawler(ABC):
         Returns:
             Normalized URL
         """
-        # Remove fragment
-        url = url.split('#')[0]
-
-        # Ensure https
-        url = url.replace('http://', 'https://')
-
-        # Remove trailing slash for consistency
-        url = url.rstrip('/')
-
-        return url
+        return _normalize_url(url)
 
     def url_to_filename(self, url: str) -> str:
         """
@@ -198,24 +452,7 @@ class BaseCrawler(ABC):
         Returns:
             Safe filename (without extension)
         """
-        parsed = urlparse(url)
-        path = parsed.path.strip('/')
-
-        if not path:
-            path = 'index'
-
-        # Remove file extensions
-        path = re.sub(r'\.(html?|php|aspx?)$', '', path, flags=re.IGNORECASE)
-
-        # Replace path separators with dashes
-        path = path.replace('/', '-')
-
-        # Clean up: keep only alphanumeric, dash, underscore
-        path = re.sub(r'[^\w\-]', '-', path)
-        path = re.sub(r'-+', '-', path)  # Collapse multiple dashes
-        path = path.strip('-')
-
-        return path or 'index'
+        return _url_to_filename(url)
 
     def clean_content(self, soup: BeautifulSoup) -> BeautifulSoup:
         """
@@ -280,12 +517,77 @@ class BaseCrawler(ABC):
         # Fallback to body
         return soup.find('body')
 
-    def extract_links(self, soup: BeautifulSoup, current_url: str) -> List[str]:
+    def parse_content(self, html: str) -> BeautifulSoup:
+        """
+        Parse only the <main>/<article> subtree of a page.
+
+        Pages without either tag (checked with a regex scan first, so no
+        strained parse is wasted on them) get their <body> parsed
+        instead, so the remaining content selectors and the <body>
+        fallback still apply.
+
+        Args:
+            html: Raw HTML
+
+        Returns:
+            BeautifulSoup object for content extraction
+        """
+        if CONTENT_TAG_RE.search(html):
+            soup = BeautifulSoup(html, HTML_PARSER, parse_only=CONTENT_STRAINER)
+            if soup.find(True) is not None:
+                return soup
+
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=BODY_STRAINER)
+        if soup.find(True) is None:
+            # No explicit <body> (html.parser doesn't imply one)
+            soup = BeautifulSoup(html, HTML_PARSER)
+        return soup
+
+    def parse_anchors(self, html: str) -> Tuple[Optional[str], List[Tuple[str, str]]]:
+        """
+        Get a page's title and every <a href> as (href, text) pairs.
+
+        With lxml this is a single C-level pass over an lxml tree, with no
+        BeautifulSoup Tag objects built; otherwise a strained
+        BeautifulSoup parse is used.
+
+        Args:
+            html: Raw HTML
+
+        Returns:
+            Tuple of (title or None, list of (href, link text))
+        """
+        if HAS_LXML:
+            try:
+                doc = lxml.html.document_fromstring(html)
+            except (ValueError, etree.ParserError):
+                doc = None  # XML encoding declaration or empty document
+
+            if doc is not None:
+                title_elem = doc.find('.//title')
+                title = title_elem.text_content().strip() if title_elem is not None else None
+                anchors = [
+                    (a.get('href'), ' '.join(a.text_content().split()))
+                    for a in doc.iter('a')
+                    if a.get('href') is not None
+                ]
+                return title, anchors
+
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=LINK_STRAINER)
+        title_elem = soup.find('title')
+        title = title_elem.get_text(strip=True) if title_elem else None
+        anchors = [
+            (a_tag['href'], a_tag.get_text(' ', strip=True))
+            for a_tag in soup.find_all('a', href=True)
+        ]
+        return title, anchors
+
+    def extract_links(self, anchors: List[Tuple[str, str]], current_url: str) -> List[str]:
         """
         Extract all valid internal links from a page.
 
         Args:
-            soup: BeautifulSoup object
+            anchors: (href, text) pairs from parse_anchors()
             current_url: The current page URL (for resolving relative links)
 
         Returns:
@@ -293,26 +595,24 @@ class BaseCrawler(ABC):
         """
         links = []
 
-        for a_tag in soup.find_all('a', href=True):
-            href = a_tag['href']
-
+        for href, _ in anchors:
             # Make absolute
             absolute_url = urljoin(current_url, href)
 
             # Normalize
             absolute_url = self.normalize_url(absolute_url)
 
-            # Skip if should skip or already visited
+            # Skip if should skip or already queued
             if self.should_skip_url(absolute_url):
                 continue
-            if absolute_url in self.visited:
+            if absolute_url in self.enqueued:
                 continue
 
             links.append(absolute_url)
 
-        return list(set(links))  # Deduplicate
+        return links  # Duplicates are dropped by enqueue()
 
-    def fetch_page(self, url: str, timeout: int = 30) -> Optional[str]:
+    async def fetch_page(self, url: str, timeout: int = 30) -> Optional[str]:
         """
         Fetch a page with error handling.
 
@@ -324,18 +624,20 @@ class BaseCrawler(ABC):
             HTML content or None if failed
         """
         try:
-            response = self.session.get(url, timeout=timeout)
-            response.raise_for_status()
-            return response.text
+            async with self.async_session.get(
+                url, timeout=aiohttp.ClientTimeout(total=timeout)
+            ) as response:
+                response.raise_for_status()
+                return decode_html(await response.read(), response.charset)
 
-        except requests.exceptions.Timeout:
+        except asyncio.TimeoutError:
             self.errors.append({'url': url, 'error': 'Timeout'})
             print(f"  [ERROR] Timeout: {url}")
             return None
 
-        except requests.exceptions.HTTPError as e:
-            self.errors.append({'url': url, 'error': f'HTTP {e.response.status_code}'})
-            print(f"  [ERROR] HTTP {e.response.status_code}: {url}")
+        except aiohttp.ClientResponseError as e:
+            self.errors.append({'url': url, 'error': f'HTTP {e.status}'})
+            print(f"  [ERROR] HTTP {e.status}: {url}")
             return None
 
         except Exception as e:
@@ -343,10 +645,13 @@ class BaseCrawler(ABC):
             print(f"  [ERROR] {e}")
             return None
 
-    def crawl_page(self, url: str, depth: int) -> None:
+    async def crawl_page(self, url: str, depth: int) -> None:
         """
         Crawl a single page.
 
+        Fetching runs on the event loop; parsing and markdown conversion
+        run in the parse pool so they don't block other in-flight fetches.
+
         Args:
             url: URL to crawl
             depth: Current depth from seed URL
@@ -362,7 +667,7 @@ class BaseCrawler(ABC):
         print(f"\n[{self.pages_crawled + 1}/{self.max_pages}] Depth {depth}: {url}")
 
         # Fetch page
-        html = self.fetch_page(url)
+        html = await self.fetch_page(url)
         if not html:
             return
 
@@ -370,27 +675,51 @@ class BaseCrawler(ABC):
         self.visited.add(url)
         self.pages_crawled += 1
 
-        # Parse HTML
-        soup = BeautifulSoup(html, 'html.parser')
+        # Parse (CPU-bound, keep it off the event loop)
+        loop = asyncio.get_running_loop()
+        parse = _parse_in_worker if self.parse_processes else self.parse_page
+        page = await loop.run_in_executor(self._parse_pool, parse, html, url, depth)
 
-        # Extract title
-        title_elem = soup.find('title')
-        title = title_elem.get_text(strip=True) if title_elem else url
+        if page:
+            self.save_page(url, depth, page)
+
+        # Be polite
+        await asyncio.sleep(self.crawl_delay)
+
+    def parse_page(self, html: str, url: str, depth: int) -> Optional[Dict]:
+        """
+        Convert a fetched page to markdown and collect its links.
+
+        Runs in a parse pool thread, so it must not modify crawler state.
+
+        Args:
+            html: Raw HTML
+            url: Page URL
+            depth: Current depth from seed URL
+
+        Returns:
+            Dict with title, markdown and links, or None if no content
+        """
+        # Title and anchors for metadata and links
+        title, anchors = self.parse_anchors(html)
+        title = title or url
+
+        new_links = self.extract_links(anchors, url) if depth < self.max_depth else []
 
         # Clean content
-        soup_clean = self.clean_content(soup)
+        soup_clean = self.clean_content(self.parse_content(html))
 
         # Find main content
         main_content = self.extract_main_content(soup_clean)
         if not main_content:
             print(f"  [WARNING] No main content found")
-            return
+            return None
 
         # Convert to markdown
-        markdown = self.h2t.handle(str(main_content))
+        markdown = self.html_to_markdown(main_content)
 
         # Clean up excessive whitespace
-        markdown = re.sub(r'\n{3,}', '\n\n', markdown)
+        markdown = BLANK_LINES_RE.sub('\n\n', markdown)
 
         # Add metadata header
         metadata = f"""---
@@ -404,43 +733,148 @@ depth: {depth}
 
 """
 
-        markdown = metadata + markdown
+        return {
+            'title': title,
+            'markdown': metadata + markdown,
+            'links': new_links
+        }
 
-        # Save to file
-        filename = self.url_to_filename(url)
-        filepath = self.output_dir / f"{filename}.md"
+    def save_page(self, url: str, depth: int, page: Dict) -> None:
+        """
+        Save a parsed page and queue its links.
 
-        # Handle duplicate filenames
-        counter = 1
-        while filepath.exists():
-            filepath = self.output_dir / f"{filename}_{counter}.md"
-            counter += 1
+        Args:
+            url: Page URL
+            depth: Current depth from seed URL
+            page: Result of parse_page()
+        """
+        # Save to file
+        filepath = self.output_dir / f"{self.claim_filename(self.url_to_filename(url))}.md"
 
-        filepath.write_text(markdown, encoding='utf-8')
-        self.saved_files.append(str(filepath))
-        self.url_to_file[url] = str(filepath)
+        if self._writer:
+            self._writer.submit(self._write_file, filepath, page['markdown'])
+        else:
+            self._write_file(filepath, page['markdown'])
+        self.record_saved_file({'url': url, 'file': str(filepath), 'title': page['title']})
 
         print(f"  [OK] Saved: {filepath.name}")
 
-        # Extract and queue new links (if within depth limit)
+        # Queue new links (if within depth limit)
         if depth < self.max_depth:
-            # Use original soup for link extraction (before cleaning)
-            soup_links = BeautifulSoup(html, 'html.parser')
-            new_links = self.extract_links(soup_links, url)
+            new_links = 0
+            for link in page['links']:
+                if self.enqueue(link, depth + 1, self.link_priority(link)):
+                    new_links += 1
+
+            print(f"  -> Found {new_links} new links")
+
+    def record_saved_file(self, entry: Dict) -> None:
+        """Append a saved-file record to files.jsonl and flush it."""
+        self._files_fp.write(jsonl_line(entry))
+        self._files_fp.flush()
+        self.files_saved += 1
+
+    def iter_saved_files(self) -> Iterator[Dict]:
+        """Yield the records written to files.jsonl by record_saved_file()."""
+        if not self.files_index.exists():
+            return
 
-            for link in new_links:
-                if link not in self.visited:
-                    self.queue.append((link, depth + 1, 1))  # priority 1
+        loads = orjson.loads if HAS_ORJSON else json.loads
+        with open(self.files_index, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    yield loads(line)
 
-            print(f"  -> Found {len(new_links)} new links")
+    def claim_filename(self, filename: str) -> str:
+        """
+        Reserve a unique output filename for this crawl.
 
-        # Be polite
-        time.sleep(self.crawl_delay)
+        Duplicates get _1, _2, ... suffixes, tracked in memory rather
+        than by checking the filesystem for each candidate.
+
+        Args:
+            filename: Base filename (without extension)
+
+        Returns:
+            Unique filename (without extension)
+        """
+        counter = self._name_counter.get(filename, 0)
+        name = filename if counter == 0 else f"{filename}_{counter}"
+        while name in self._claimed_names:
+            counter += 1
+            name = f"{filename}_{counter}"
+
+        self._name_counter[filename] = counter + 1
+        self._claimed_names.add(name)
+        return name
+
+    def _write_file(self, filepath: Path, content: str) -> None:
+        """Write a markdown file, recording failures instead of raising."""
+        try:
+            filepath.write_text(content, encoding='utf-8')
+        except OSError as e:
+            self.errors.append({'url': str(filepath), 'error': f'Write failed: {e}'})
+            print(f"  [ERROR] Could not write {filepath.name}: {e}")
+
+    def enqueue(self, url: str, depth: int, priority: int) -> bool:
+        """
+        Push a normalized URL onto the priority queue unless it was queued before.
+
+        Returns:
+            True if the URL was queued
+        """
+        if url in self.enqueued or url in self.visited:
+            return False
+
+        self.enqueued.add(url)
+        heapq.heappush(self.queue, (priority, depth, next(self._queue_counter), url))
+        return True
+
+    def link_priority(self, url: str) -> int:
+        """
+        Queue priority for a discovered link (lower is crawled first).
+        Override to prioritize URLs.
+        """
+        return 1
+
+    def html_to_markdown(self, element: BeautifulSoup) -> str:
+        """
+        Convert a parsed content element to markdown.
+
+        Uses markdownify on the existing tree when installed, otherwise
+        html2text on the serialized element.
+
+        Args:
+            element: Content element (already cleaned)
+
+        Returns:
+            Markdown text
+        """
+        if HAS_MARKDOWNIFY:
+            return self._md_converter.convert_soup(element).lstrip('\n')
+        return self.get_h2t().handle(str(element))
+
+    def get_h2t(self) -> html2text.HTML2Text:
+        """Return this thread's HTML to Markdown converter, creating it on first use."""
+        h2t = getattr(self._h2t_local, 'h2t', None)
+        if h2t is None:
+            h2t = html2text.HTML2Text()
+            h2t.ignore_links = False
+            h2t.ignore_images = True
+            h2t.ignore_emphasis = False
+            h2t.body_width = 0  # Don't wrap lines
+            h2t.skip_internal_links = False
+            self._h2t_local.h2t = h2t
+        return h2t
 
     def crawl(self) -> Dict:
         """
         Main crawl loop.
 
+        Pages are fetched in batches of up to `concurrency` over one
+        aiohttp session; each request still waits crawl_delay after it
+        completes, so concurrency=1 matches a sequential crawl.
+
         Returns:
             Summary dictionary with crawl statistics
         """
@@ -455,19 +889,12 @@ depth: {depth}
         # Initialize queue with seed URLs
         for url in seed_urls:
             if not self.should_skip_url(url):
-                self.queue.append((url, 0, 0))  # depth 0, priority 0
-
-        # Sort by priority
-        self.queue.sort(key=lambda x: x[2])
+                self.enqueue(self.normalize_url(url), 0, 0)  # depth 0, priority 0
 
         print(f"Starting crawl with {len(self.queue)} URLs in queue\n")
 
         # Process queue
-        while self.queue and self.pages_crawled < self.max_pages:
-            url, depth, _ = self.queue.pop(0)
-
-            if url not in self.visited:
-                self.crawl_page(url, depth)
+        asyncio.run(self._crawl_async())
 
         # Generate summary
         summary = self.save_summary()
@@ -475,12 +902,64 @@ depth: {depth}
         print(f"\n{'=' * 60}")
         print("Crawl Complete!")
         print(f"  Pages crawled: {self.pages_crawled}")
-        print(f"  Files saved: {len(self.saved_files)}")
+        print(f"  Files saved: {self.files_saved}")
         print(f"  Errors: {len(self.errors)}")
         print(f"{'=' * 60}")
 
         return summary
 
+    async def _crawl_async(self) -> None:
+        """Drain the queue in concurrent batches over a shared aiohttp session."""
+        if self.parse_processes:
+            # Each worker process gets a settings-only copy of this crawler
+            self._parse_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                initializer=_init_parse_worker,
+                initargs=(self,)
+            )
+        else:
+            self._parse_pool = ThreadPoolExecutor(
+                max_workers=self.parse_workers, thread_name_prefix='crawl-parse'
+            )
+        self._writer = ThreadPoolExecutor(max_workers=2, thread_name_prefix='crawl-write')
+        self._files_fp = open(self.files_index, 'wb')
+        # One connection per concurrent fetch, kept alive between batches
+        connector = aiohttp.TCPConnector(
+            limit=self.concurrency,
+            limit_per_host=self.concurrency,
+            keepalive_timeout=30
+        )
+
+        try:
+            async with aiohttp.ClientSession(
+                connector=connector,
+                headers={'User-Agent': self.user_agent}
+            ) as session:
+                self.async_session = session
+
+                while self.queue and self.pages_crawled < self.max_pages:
+                    # Never start more pages than are left to crawl
+                    batch_size = min(self.concurrency, self.max_pages - self.pages_crawled)
+                    batch = []
+
+                    # URLs are deduplicated at enqueue time, so no checks here
+                    while self.queue and len(batch) < batch_size:
+                        _, depth, _, url = heapq.heappop(self.queue)
+                        batch.append(self.crawl_page(url, depth))
+
+                    await asyncio.gather(*batch)
+        finally:
+            self.async_session = None
+            self._parse_pool.shutdown(wait=True)
+            self._parse_pool = None
+
+            # All pages must be on disk before the summary is written
+            self._writer.shutdown(wait=True)
+            self._writer = None
+
+            self._files_fp.close()
+            self._files_fp = None
+
     def save_summary(self) -> Dict:
         """
         Save crawl summary to JSON file.
@@ -492,15 +971,15 @@ depth: {depth}
             'crawl_date': datetime.now().isoformat(),
             'base_url': self.base_url,
             'pages_crawled': self.pages_crawled,
-            'files_saved': len(self.saved_files),
+            'files_saved': self.files_saved,
             'max_depth': self.max_depth,
             'urls_found': len(self.visited),
             'errors': self.errors,
-            'files': self.saved_files
+            'files_index': str(self.files_index)
         }
 
         summary_file = self.output_dir / 'crawl_summary.json'
-        summary_file.write_text(json.dumps(summary, indent=2))
+        write_json(summary_file, summary)
 
         print(f"\nSummary saved to: {summary_file}")
 
@@ -19,19 +19,58 @@ Author: Scott Allen
 """
 
 import hashlib
-import json
 import re
-import time
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import parse_qs, urljoin, urlparse
 
 import html2text
 import requests
-from base_crawler import BaseCrawler
-from bs4 import BeautifulSoup
+from base_crawler import (
+    BLANK_LINES_RE,
+    DASHES_RE,
+    NON_WORD_RE,
+    PAGE_EXT_RE,
+    BaseCrawler,
+    compile_patterns,
+    jsonl_line,
+    write_json,
+)
+
+# Standard sitemap namespace, as it appears in ElementTree tag names
+SITEMAP_NS = '{http://www.sitemaps.org/schemas/sitemap/0.9}'
+
+
+@lru_cache(maxsize=100_000)
+def _url_to_filename(url: str) -> str:
+    """Memoized DeepCrawler.url_to_filename."""
+    parsed = urlparse(url)
+    path = parsed.path.strip('/')
+
+    if not path:
+        path = 'index'
+
+    # Remove file extensions
+    path = PAGE_EXT_RE.sub('', path)
+
+    # Replace slashes with dashes
+    path = path.replace('/', '-')
+
+    # Handle query parameters (for filtered/paginated pages)
+    if parsed.query:
+        query_hash = hashlib.blake2b(parsed.query.encode(), digest_size=4).hexdigest()
+        path = f"{path}-{query_hash}"
+
+    # Clean up
+    path = NON_WORD_RE.sub('-', path)
+    path = DASHES_RE.sub('-', path)
+    path = path.strip('-')
+
+    return path or 'index'
 
 
 class DeepCrawler(BaseCrawler):
@@ -46,6 +85,15 @@ class DeepCrawler(BaseCrawler):
     - Duplicate detection via content hashing
     """
 
+    # Also left out of the copy sent to parse worker processes
+    RUNTIME_STATE = BaseCrawler.RUNTIME_STATE + ('sitemap_urls', 'pdf_links', '_pdf_fp')
+
+    # PDF links kept in memory for the crawl summary (the full list is in pdf_links.jsonl)
+    PDF_SUMMARY_LIMIT = 100
+
+    # Sub-sitemaps fetched at the same time (matches the sync session's pool size)
+    SITEMAP_WORKERS = BaseCrawler.SYNC_POOL_SIZE
+
     def __init__(
         self,
         base_url: str,
@@ -54,7 +102,11 @@ class DeepCrawler(BaseCrawler):
         max_pages: int = 2000,
         max_depth: int = 4,
         crawl_delay: float = 0.5,
-        priority_patterns: Optional[List[str]] = None
+        priority_patterns: Optional[List[str]] = None,
+        concurrency: int = 4,
+        parse_workers: int = 2,
+        bloom_filter: bool = False,
+        parse_processes: bool = False
     ):
         """
         Initialize the deep crawler.
@@ -67,6 +119,10 @@ class DeepCrawler(BaseCrawler):
             max_depth: Maximum link depth
             crawl_delay: Delay between requests
             priority_patterns: URL patterns to prioritize (crawl first)
+            concurrency: Maximum pages fetched at the same time
+            parse_workers: Threads used for HTML parsing and markdown conversion
+            bloom_filter: Track queued URLs in a Bloom filter (for huge sitemaps)
+            parse_processes: Parse in a process pool instead of threads
         """
         super().__init__(
             base_url=base_url,
@@ -74,12 +130,19 @@ class DeepCrawler(BaseCrawler):
             max_pages=max_pages,
             max_depth=max_depth,
             crawl_delay=crawl_delay,
-            user_agent='DocumentCrawler/1.0 (Deep crawl for search indexing)'
+            user_agent='DocumentCrawler/1.0 (Deep crawl for search indexing)',
+            concurrency=concurrency,
+            parse_workers=parse_workers,
+            bloom_filter=bloom_filter,
+            parse_processes=parse_processes
         )
 
         self.sitemap_url = sitemap_url or f"{base_url.rstrip('/')}/sitemap.xml"
         self.sitemap_urls: List[str] = []
-        self.pdf_links: List[Dict] = []  # Track PDF documents found
+        self.pdf_links: List[Dict] = []  # First PDF_SUMMARY_LIMIT PDF documents found
+        self.pdf_links_found = 0
+        self.pdf_index = self.output_dir / 'pdf_links.jsonl'
+        self._pdf_fp = None
 
         # URL patterns to prioritize (crawl these first)
         self.priority_patterns = priority_patterns or [
@@ -92,45 +155,70 @@ class DeepCrawler(BaseCrawler):
             '/guide/',
             '/how-to/',
         ]
+        self._priority_re: Optional[re.Pattern] = None  # Compiled on first use
 
         print(f"  Sitemap: {self.sitemap_url}")
         print(f"  Priority patterns: {len(self.priority_patterns)}")
 
     def is_priority_url(self, url: str) -> bool:
         """Check if URL matches priority patterns."""
-        url_lower = url.lower()
-        return any(pattern in url_lower for pattern in self.priority_patterns)
+        if self._priority_re is None:
+            self._priority_re = compile_patterns(self.priority_patterns, flags=re.IGNORECASE)
+        return self._priority_re.search(url) is not None
 
     def url_to_filename(self, url: str) -> str:
         """
         Convert URL to safe filename, handling query parameters.
 
         For URLs with query parameters (e.g., filtered views),
-        creates unique filenames using MD5 hash of params.
+        creates unique filenames using a short BLAKE2 hash of params.
         """
-        parsed = urlparse(url)
-        path = parsed.path.strip('/')
-
-        if not path:
-            path = 'index'
+        return _url_to_filename(url)
 
-        # Remove file extensions
-        path = re.sub(r'\.(html?|php|aspx?)$', '', path, flags=re.IGNORECASE)
+    def _stream_sitemap(self, url: str) -> Tuple[bool, List[str]]:
+        """
+        Fetch one sitemap and stream-parse its <loc> entries.
 
-        # Replace slashes with dashes
-        path = path.replace('/', '-')
+        Entries are discarded as soon as they are read, so memory stays
+        flat no matter how many URLs the sitemap lists.
 
-        # Handle query parameters (for filtered/paginated pages)
-        if parsed.query:
-            query_hash = hashlib.md5(parsed.query.encode()).hexdigest()[:8]
-            path = f"{path}-{query_hash}"
+        Args:
+            url: Sitemap URL
 
-        # Clean up
-        path = re.sub(r'[^\w\-]', '-', path)
-        path = re.sub(r'-+', '-', path)
-        path = path.strip('-')
+        Returns:
+            Tuple of (is_sitemap_index, loc values)
+        """
+        with self.session.get(url, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True  # Transparently gunzip
+
+            root = None
+            is_index = False
+            locs = []
+
+            for event, elem in ET.iterparse(response.raw, events=('start', 'end')):
+                if root is None:
+                    root = elem
+                    is_index = elem.tag == f'{SITEMAP_NS}sitemapindex'
+                elif event == 'end':
+                    if elem.tag == f'{SITEMAP_NS}loc':
+                        if elem.text:
+                            locs.append(elem.text.strip())
+                    elif elem.tag in (f'{SITEMAP_NS}url', f'{SITEMAP_NS}sitemap'):
+                        root.clear()  # Drop entries already read
+
+        return is_index, locs
+
+    def _fetch_sub_sitemap(self, sitemap_url: str) -> List[str]:
+        """Fetch one sub-sitemap's URLs, returning [] on failure."""
+        try:
+            print(f"  Fetching: {sitemap_url}")
+            _, sub_urls = self._stream_sitemap(sitemap_url)
+            return sub_urls
 
-        return path or 'index'
+        except Exception as e:
+            print(f"  [WARNING] Error parsing {sitemap_url}: {e}")
+            return []
 
     def parse_sitemap(self) -> List[str]:
         """
@@ -146,55 +234,25 @@ class DeepCrawler(BaseCrawler):
         print(f"\nFetching sitemap: {self.sitemap_url}")
 
         try:
-            response = self.session.get(self.sitemap_url, timeout=30)
-            response.raise_for_status()
-
-            content = response.content.decode('utf-8', errors='ignore')
+            is_index, locs = self._stream_sitemap(self.sitemap_url)
             urls = []
 
-            # Define namespace (standard sitemap namespace)
-            namespace = {'ns': 'http://www.sitemaps.org/schemas/sitemap/0.9'}
-
             # Check if this is a sitemap index
-            if '<sitemapindex' in content:
+            if is_index:
                 print("  Found sitemap index, parsing sub-sitemaps...")
 
-                root = ET.fromstring(response.content)
-                sub_sitemaps = []
-
-                for sitemap in root.findall('.//ns:sitemap', namespace):
-                    loc = sitemap.find('ns:loc', namespace)
-                    if loc is not None:
-                        sub_sitemaps.append(loc.text)
-
+                sub_sitemaps = locs
                 print(f"  Found {len(sub_sitemaps)} sub-sitemaps")
 
-                # Fetch each sub-sitemap
-                for sitemap_url in sub_sitemaps:
-                    try:
-                        print(f"  Fetching: {sitemap_url}")
-                        sub_response = self.session.get(sitemap_url, timeout=30)
-                        sub_response.raise_for_status()
-
-                        sub_root = ET.fromstring(sub_response.content)
-                        for url_elem in sub_root.findall('.//ns:url', namespace):
-                            loc = url_elem.find('ns:loc', namespace)
-                            if loc is not None:
-                                urls.append(loc.text)
-
-                        time.sleep(0.5)  # Be polite between sitemap fetches
-
-                    except Exception as e:
-                        print(f"  [WARNING] Error parsing {sitemap_url}: {e}")
+                # Fetch sub-sitemaps in parallel (a few at a time, to stay polite);
+                # map() keeps results in sitemap order
+                with ThreadPoolExecutor(max_workers=self.SITEMAP_WORKERS) as executor:
+                    for sub_urls in executor.map(self._fetch_sub_sitemap, sub_sitemaps):
+                        urls.extend(sub_urls)
 
             else:
                 # Regular sitemap
-                root = ET.fromstring(response.content)
-
-                for url_elem in root.findall('.//ns:url', namespace):
-                    loc = url_elem.find('ns:loc', namespace)
-                    if loc is not None:
-                        urls.append(loc.text)
+                urls = locs
 
             print(f"  Total URLs from sitemap: {len(urls)}")
             self.sitemap_urls = urls
@@ -224,7 +282,7 @@ class DeepCrawler(BaseCrawler):
         # Return priority URLs first
         return priority_urls + regular_urls
 
-    def extract_pdf_links(self, soup: BeautifulSoup) -> List[Dict]:
+    def extract_pdf_links(self, anchors: List[Tuple[str, str]]) -> List[Dict]:
         """
         Extract PDF document links from page.
 
@@ -232,75 +290,54 @@ class DeepCrawler(BaseCrawler):
         (e.g., PDF text extraction, separate indexing).
 
         Args:
-            soup: BeautifulSoup object
+            anchors: (href, text) pairs from parse_anchors()
 
         Returns:
             List of PDF link dictionaries
         """
         pdfs = []
 
-        for a_tag in soup.find_all('a', href=True):
-            href = a_tag['href']
+        for href, text in anchors:
             if href.lower().endswith('.pdf'):
                 absolute_url = urljoin(self.base_url, href)
                 pdfs.append({
                     'url': absolute_url,
-                    'text': a_tag.get_text(strip=True),
+                    'text': text,
                     'found_on': 'current_page'  # Will be updated during crawl
                 })
 
         return pdfs
 
-    def crawl_page(self, url: str, depth: int) -> None:
+    def parse_page(self, html: str, url: str, depth: int) -> Optional[Dict]:
         """
-        Crawl a single page with PDF extraction.
+        Parse a page with PDF extraction.
 
-        Extends base crawl_page to also extract PDF links.
+        Extends base parse_page to also collect PDF links and list
+        them in a Related Documents section.
         """
-        url = self.normalize_url(url)
-
-        if url in self.visited:
-            return
+        # Title and anchors for metadata and links
+        title, anchors = self.parse_anchors(html)
+        title = title or url
 
-        if self.pages_crawled >= self.max_pages:
-            return
-
-        print(f"\n[{self.pages_crawled + 1}/{self.max_pages}] Depth {depth}: {url}")
-
-        # Fetch page
-        html = self.fetch_page(url)
-        if not html:
-            return
-
-        # Mark as visited
-        self.visited.add(url)
-        self.pages_crawled += 1
-
-        # Parse HTML
-        soup = BeautifulSoup(html, 'html.parser')
-
-        # Extract PDF links before cleaning
-        pdfs = self.extract_pdf_links(soup)
+        # Extract PDF links
+        pdfs = self.extract_pdf_links(anchors)
         for pdf in pdfs:
             pdf['found_on'] = url
-            self.pdf_links.append(pdf)
 
-        # Extract title
-        title_elem = soup.find('title')
-        title = title_elem.get_text(strip=True) if title_elem else url
+        new_links = self.extract_links(anchors, url) if depth < self.max_depth else []
 
         # Clean content
-        soup_clean = self.clean_content(BeautifulSoup(html, 'html.parser'))
+        soup_clean = self.clean_content(self.parse_content(html))
 
         # Find main content
         main_content = self.extract_main_content(soup_clean)
         if not main_content:
             print(f"  [WARNING] No main content found")
-            return
+            return None
 
         # Convert to markdown
-        markdown = self.h2t.handle(str(main_content))
-        markdown = re.sub(r'\n{3,}', '\n\n', markdown)
+        markdown = self.html_to_markdown(main_content)
+        markdown = BLANK_LINES_RE.sub('\n\n', markdown)
 
         # Add metadata header
         metadata = f"""---
@@ -322,38 +359,40 @@ depth: {depth}
             for pdf in pdfs:
                 markdown += f"- [{pdf['text']}]({pdf['url']})\n"
 
-        # Save to file
-        filename = self.url_to_filename(url)
-        filepath = self.output_dir / f"{filename}.md"
-
-        counter = 1
-        while filepath.exists():
-            filepath = self.output_dir / f"{filename}_{counter}.md"
-            counter += 1
+        return {
+            'title': title,
+            'markdown': markdown,
+            'links': new_links,
+            'pdfs': pdfs
+        }
 
-        filepath.write_text(markdown, encoding='utf-8')
-        self.saved_files.append(str(filepath))
-        self.url_to_file[url] = str(filepath)
+    def save_page(self, url: str, depth: int, page: Dict) -> None:
+        """Save a parsed page and track its PDF links."""
+        for pdf in page['pdfs']:
+            self._pdf_fp.write(jsonl_line(pdf))
+        self.pdf_links_found += len(page['pdfs'])
 
-        print(f"  [OK] Saved: {filepath.name}")
-        if pdfs:
-            print(f"  [INFO] Found {len(pdfs)} PDF links")
+        room = self.PDF_SUMMARY_LIMIT - len(self.pdf_links)
+        if room > 0:
+            self.pdf_links.extend(page['pdfs'][:room])
 
-        # Extract and queue new links
-        if depth < self.max_depth:
-            new_links = self.extract_links(soup, url)
+        super().save_page(url, depth, page)
 
-            for link in new_links:
-                if link not in self.visited:
-                    # Priority URLs get priority 0, others get 1
-                    priority = 0 if self.is_priority_url(link) else 1
-                    self.queue.append((link, depth + 1, priority))
+        if page['pdfs']:
+            print(f"  [INFO] Found {len(page['pdfs'])} PDF links")
 
-            # Re-sort by priority
-            self.queue.sort(key=lambda x: x[2])
-            print(f"  -> Found {len(new_links)} new links")
+    def link_priority(self, url: str) -> int:
+        """Priority URLs get priority 0, others get 1."""
+        return 0 if self.is_priority_url(url) else 1
 
-        time.sleep(self.crawl_delay)
+    async def _crawl_async(self) -> None:
+        """Stream PDF links to pdf_links.jsonl for the duration of the crawl."""
+        self._pdf_fp = open(self.pdf_index, 'wb')
+        try:
+            await super()._crawl_async()
+        finally:
+            self._pdf_fp.close()
+            self._pdf_fp = None
 
     def save_summary(self) -> Dict:
         """Save crawl summary including PDF links."""
@@ -362,57 +401,49 @@ depth: {depth}
             'base_url': self.base_url,
             'sitemap_url': self.sitemap_url,
             'pages_crawled': self.pages_crawled,
-            'files_saved': len(self.saved_files),
-            'pdf_links_found': len(self.pdf_links),
+            'files_saved': self.files_saved,
+            'pdf_links_found': self.pdf_links_found,
             'max_depth': self.max_depth,
             'urls_in_sitemap': len(self.sitemap_urls),
             'urls_visited': len(self.visited),
             'errors': self.errors,
-            'files': self.saved_files,
-            'pdf_links': self.pdf_links[:100]  # Limit for JSON size
+            'files_index': str(self.files_index),
+            'pdf_links': self.pdf_links,  # Limited for JSON size
+            'pdf_index': str(self.pdf_index)
         }
 
         # Save main summary
         summary_file = self.output_dir / 'crawl_summary.json'
-        summary_file.write_text(json.dumps(summary, indent=2))
+        write_json(summary_file, summary)
 
-        # Save metadata for ingestion pipeline
+        # Save metadata for ingestion pipeline, built from files.jsonl
         metadata = {
             'crawledAt': datetime.now().isoformat(),
             'baseUrl': self.base_url,
             'files': [
                 {
-                    'filename': Path(filepath).name,
-                    'url': url,
-                    'title': self._extract_title_from_file(filepath)
+                    'filename': Path(entry['file']).name,
+                    'url': entry['url'],
+                    'title': entry['title'] or self._title_from_filename(entry['file'])
                 }
-                for url, filepath in self.url_to_file.items()
+                for entry in self.iter_saved_files()
             ]
         }
 
         metadata_file = self.output_dir / '_metadata.json'
-        metadata_file.write_text(json.dumps(metadata, indent=2))
+        write_json(metadata_file, metadata)
 
-        # Save PDF links separately for document processor
-        if self.pdf_links:
-            pdf_file = self.output_dir / 'pdf_links.json'
-            pdf_file.write_text(json.dumps(self.pdf_links, indent=2))
-            print(f"  PDF links saved to: {pdf_file}")
+        # PDF links for the document processor were streamed during the crawl
+        if self.pdf_links_found:
+            print(f"  PDF links saved to: {self.pdf_index}")
 
         print(f"  Summary saved to: {summary_file}")
         print(f"  Metadata saved to: {metadata_file}")
 
         return summary
 
-    def _extract_title_from_file(self, filepath: str) -> str:
-        """Extract title from markdown file frontmatter."""
-        try:
-            content = Path(filepath).read_text(encoding='utf-8')
-            match = re.search(r'^title:\s*(.+)$', content, re.MULTILINE)
-            if match:
-                return match.group(1).strip()
-        except:
-            pass
+    def _title_from_filename(self, filepath: str) -> str:
+        """Fallback title derived from a saved file's name."""
         return Path(filepath).stem.replace('-', ' ').title()
 
 
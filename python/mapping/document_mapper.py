@@ -16,15 +16,293 @@ Use cases:
 Author: Scott Allen
 """
 
+import hashlib
 import json
 import os
+import pickle
 import re
+from bisect import bisect_right
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from difflib import SequenceMatcher
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from urllib.parse import unquote, urlparse
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+
+# Prefer the lxml parser (much faster); fall back to the stdlib parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Optional: BK-tree over titles so fuzzy matching doesn't scan every title
+try:
+    import pybktree
+    from rapidfuzz.distance import Indel
+    HAS_BKTREE = True
+except ImportError:
+    HAS_BKTREE = False
+
+# Optional: C++ fuzzy scoring when the BK-tree isn't available
+try:
+    from rapidfuzz import fuzz, process
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
+# Optional: Aho-Corasick automaton to find indexed filenames inside a URL filename
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+# Optional: succinct trie for title_index (titles share long prefixes)
+try:
+    import marisa_trie
+    HAS_MARISA = True
+except ImportError:
+    HAS_MARISA = False
+
+# Optional: Hyperscan evaluates every document pattern in one SIMD scan
+try:
+    import hyperscan
+    HAS_HYPERSCAN = True
+except ImportError:
+    HAS_HYPERSCAN = False
+
+# Optional: Bloom filter of indexed names for early no-match exits
+try:
+    from pybloom_live import ScalableBloomFilter
+    HAS_BLOOM = True
+except ImportError:
+    HAS_BLOOM = False
+
+# Source URL hints in a document's opening text. Groups are named by
+# strategy; _extract_source_url ranks them yaml > dropbox > drive.
+SOURCE_URL_RE = re.compile(
+    r'^url:\s*(?P<yaml>.+)$'
+    r'|(?P<dropbox>https://[^\s\)]*dropbox\.com[^\s\)]*)'
+    r'|(?P<drive>https://drive\.google\.com[^\s\)]*)',
+    re.MULTILINE
+)
+
+# Literal bytes any SOURCE_URL_RE match must contain
+SOURCE_URL_HINTS = (b'url:', b'dropbox.com', b'drive.google.com')
+
+# Hrefs that point at documents: office/PDF files or cloud storage
+DOC_LINK_PATTERNS = [
+    r'\.pdf$',
+    r'\.docx?$',
+    r'\.xlsx?$',
+    r'\.pptx?$',
+    r'dropbox\.com',
+    r'drive\.google\.com',
+    r'sharepoint\.com'
+]
+DOC_LINK_RE = re.compile('|'.join(DOC_LINK_PATTERNS), re.IGNORECASE)
+
+# DOC_LINK_RE for a newline-joined block of hrefs, one href per line
+DOC_LINK_LINES_RE = re.compile(DOC_LINK_RE.pattern, re.IGNORECASE | re.MULTILINE)
+
+# The same patterns compiled once into a Hyperscan block database
+DOC_LINK_DB = None
+if HAS_HYPERSCAN:
+    DOC_LINK_DB = hyperscan.Database()
+    DOC_LINK_DB.compile(
+        expressions=[pattern.encode('ascii') for pattern in DOC_LINK_PATTERNS],
+        ids=list(range(len(DOC_LINK_PATTERNS))),
+        elements=len(DOC_LINK_PATTERNS),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_MULTILINE] * len(DOC_LINK_PATTERNS)
+    )
+
+# Title normalization: characters to drop, then separator runs to collapse
+SPECIAL_CHARS_RE = re.compile(r'[^\w\s-]')
+SEPARATORS_RE = re.compile(r'[-_\s]+')
+
+# The same two steps for ASCII text as one translate table: drop what
+# SPECIAL_CHARS_RE drops, turn '-' and '_' into spaces (runs collapse after)
+TITLE_TABLE = {
+    i: None for i in range(128)
+    if not (chr(i).isalnum() or chr(i).isspace() or chr(i) in '-_')
+}
+TITLE_TABLE.update({ord('-'): ' ', ord('_'): ' '})
+
+# Only anchors with an href are built when scanning a page for documents
+LINK_STRAINER = SoupStrainer('a', href=True)
+
+
+@lru_cache(maxsize=8192)
+def _normalize_title(title: str) -> str:
+    """Memoized DocumentMapper._normalize_title (nav and footer link texts repeat)."""
+    title = title.lower()
+
+    # ASCII fast path: one translate pass, then collapse whitespace.
+    # '%' is dropped either way, so unquote() would be a no-op here.
+    if title.isascii():
+        return ' '.join(title.translate(TITLE_TABLE).split())
+
+    # Remove special characters, keep alphanumeric and spaces
+    title = SPECIAL_CHARS_RE.sub('', title)
+    # Normalize separators to spaces
+    title = SEPARATORS_RE.sub(' ', title)
+    # URL decode
+    title = unquote(title)
+    return title.strip()
+
+
+def _screen_document_hrefs(hrefs: List[str]) -> List[bool]:
+    """
+    Flag which hrefs match DOC_LINK_RE, in one regex pass over all of them.
+
+    Hrefs are joined one per line and scanned by Hyperscan when it is
+    installed, otherwise by DOC_LINK_LINES_RE; each match is mapped back
+    to its href by offset. The rare href that itself contains a newline
+    is checked on its own.
+
+    Args:
+        hrefs: Anchor hrefs in page order
+
+    Returns:
+        One flag per href, True for document links
+    """
+    flags = [False] * len(hrefs)
+    lines = []
+    owners = []
+
+    for i, href in enumerate(hrefs):
+        if '\n' in href:
+            flags[i] = bool(DOC_LINK_RE.search(href))
+        else:
+            lines.append(href)
+            owners.append(i)
+
+    if DOC_LINK_DB is not None:
+        # Hyperscan reports byte offsets, so measure the encoded lines
+        encoded = [line.encode('utf-8', 'replace') for line in lines]
+        starts = _line_starts(encoded)
+
+        def on_match(pattern_id, start, end, match_flags, context):
+            flags[owners[bisect_right(starts, end - 1) - 1]] = True
+
+        DOC_LINK_DB.scan(b'\n'.join(encoded), match_event_handler=on_match)
+    else:
+        starts = _line_starts(lines)
+        for match in DOC_LINK_LINES_RE.finditer('\n'.join(lines)):
+            flags[owners[bisect_right(starts, match.start()) - 1]] = True
+
+    return flags
+
+
+def _line_starts(lines: List) -> List[int]:
+    """Offset of each line within the lines joined by single newlines."""
+    starts = []
+    offset = 0
+    for line in lines:
+        starts.append(offset)
+        offset += len(line) + 1
+    return starts
+
+
+def _iter_markdown(root: str) -> Iterator[os.DirEntry]:
+    """
+    Yield .md files under root in the same order as os.walk.
+
+    DirEntry carries the name, path and file type from the directory
+    read, so no Path objects or extra stat calls are needed per file.
+    Like os.walk, symlinked directories are not descended into.
+    """
+    try:
+        with os.scandir(root) as entries:
+            subdirs = []
+            for entry in entries:
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+                elif entry.name.endswith('.md'):
+                    yield entry
+    except OSError:
+        return
+
+    for subdir in subdirs:
+        yield from _iter_markdown(subdir)
+
+
+def _read_head(path: str) -> Optional[str]:
+    """
+    Read the first 1000 bytes of a document as text, for source URL extraction.
+
+    Uses a raw file descriptor (open, one read, close) so no buffered
+    file object or text decoder is set up per file. Heads without any
+    SOURCE_URL_HINTS can't yield a source URL, so they are never decoded.
+
+    Returns:
+        Decoded head, or None if unreadable or it has no source URL hint
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        try:
+            head = os.read(fd, 1000)
+        finally:
+            os.close(fd)
+    except OSError:
+        return None
+
+    if not any(hint in head for hint in SOURCE_URL_HINTS):
+        return None
+
+    # 'replace' keeps invalid bytes as U+FFFD rather than splicing their
+    # neighbours together, so decoding never creates a hint the bytes lacked
+    return head.decode('utf-8', 'replace')
+
+
+def _title_distance(a: str, b: str) -> int:
+    """
+    Indel distance between two titles, the BK-tree's metric.
+
+    A module-level function (rapidfuzz's own can't be pickled), so the
+    tree can be written to the index cache.
+    """
+    return Indel.distance(a, b)
+
+
+class _TitleTrie:
+    """
+    Read-only title -> path mapping backed by a marisa-trie.
+
+    Shared title prefixes are stored once; paths live in a list indexed
+    by the trie's key ids. Supports the dict operations DocumentMapper
+    uses on title_index, iterating in the original insertion order (not
+    the trie's) so fuzzy tie-breaks match a plain dict.
+    """
+
+    def __init__(self, index: Dict[str, str]):
+        self._trie = marisa_trie.Trie(index)
+        self._paths: List[str] = [''] * len(self._trie)
+        self._order: List[int] = []               # key ids in insertion order
+        for title, path in index.items():
+            key_id = self._trie[title]
+            self._paths[key_id] = path
+            self._order.append(key_id)
+
+    def __contains__(self, title: str) -> bool:
+        return title in self._trie
+
+    def __getitem__(self, title: str) -> str:
+        return self._paths[self._trie[title]]
+
+    def __len__(self) -> int:
+        return len(self._trie)
+
+    def keys(self) -> Iterator[str]:
+        return map(self._trie.restore_key, self._order)
+
+    def items(self) -> Iterator[Tuple[str, str]]:
+        return ((self._trie.restore_key(key_id), self._paths[key_id]) for key_id in self._order)
 
 
 class DocumentMapper:
@@ -33,37 +311,99 @@ class DocumentMapper:
 
     Features:
     - Multiple index types: by filename, title, and URL
-    - Fuzzy title matching using SequenceMatcher
+    - Fuzzy title matching using an Indel-distance BK-tree (rapidfuzz or
+      SequenceMatcher fallback)
     - Confidence scoring for match quality
     - Relationship metadata generation
     - Efficient indexing for fast lookups
 
     The mapper builds indices at initialization and provides
-    O(1) lookups for exact matches, with fallback to O(n) fuzzy matching.
+    O(1) lookups for exact matches, with fallback to fuzzy matching
+    (sublinear with the BK-tree, O(n) without it).
     """
 
-    def __init__(self, doc_directories: Optional[List[str]] = None):
+    # Minimum similarity for a fuzzy title match
+    FUZZY_THRESHOLD = 0.70
+
+    # Confidence at which a document link counts toward portal detection
+    HIGH_CONFIDENCE = 0.85
+
+    # Threads reading document heads while indexing (reads are I/O-bound)
+    READ_WORKERS = 16
+
+    # Built index structures, persisted together in the index cache
+    INDEX_STATE = (
+        'filename_index', 'title_index', 'url_index', 'title_bk',
+        '_trigram_index', '_filename_rank', '_filename_ac',
+        '_title_rank', '_title_max_length'
+    )
+
+    # Bump when the cached structures change shape
+    CACHE_VERSION = 2
+
+    def __init__(
+        self,
+        doc_directories: Optional[List[str]] = None,
+        cache_file: Optional[str] = None,
+        bloom_filter: bool = False
+    ):
         """
         Initialize the document mapper and build indices.
 
         Args:
             doc_directories: List of directories to scan for documents.
                            If None, uses default paths.
+            cache_file: Where to persist built indices between runs.
+                       None (the default) disables the cache. The file is
+                       unpickled, so only pass a path nobody else can write
+            bloom_filter: Return no_match straight away for links whose
+                         filename and title are definitely not indexed,
+                         skipping partial and fuzzy matching for them
+                         (needs pybloom_live)
         """
         self.doc_directories = doc_directories or [
             './docs/processed',
             './docs/crawled',
             './docs/uploads'
         ]
+        self.cache_file = Path(cache_file) if cache_file else None
 
-        # Index structures
+        # Index structures (values for one document are the same str object)
         self.filename_index: Dict[str, str] = {}  # lowercase filename -> full path
         self.title_index: Dict[str, str] = {}     # normalized title -> full path
         self.url_index: Dict[str, str] = {}       # source URL -> full path
+        self.title_bk = None                      # BK-tree over title_index keys
+
+        # Each title's position in title_index (earliest wins score ties),
+        # and the longest title, bounding the BK-tree search radius
+        self._title_rank: Dict[str, int] = {}
+        self._title_max_length = 0
+
+        # Partial filename matching: trigram -> filenames, and each
+        # filename's position in filename_index (earliest match wins)
+        self._trigram_index: Dict[str, Set[str]] = defaultdict(set)
+        self._filename_rank: Dict[str, int] = {}
+        self._filename_ac = None                  # Automaton over filename_index keys
 
         # Build indices
         self._build_indices()
 
+        # Indexed filenames and titles, for definite-negative lookups
+        self._name_bloom = None
+        if bloom_filter:
+            if HAS_BLOOM:
+                self._name_bloom = ScalableBloomFilter(
+                    initial_capacity=10000,
+                    error_rate=0.001,
+                    mode=ScalableBloomFilter.LARGE_SET_GROWTH
+                )
+                for name in self.filename_index:
+                    self._name_bloom.add(name)
+                for title in self.title_index.keys():
+                    self._name_bloom.add(title)
+            else:
+                print("[WARNING] pybloom_live not installed, matching every link in full")
+
     def _build_indices(self) -> None:
         """
         Scan directories and build lookup indices.
@@ -72,44 +412,174 @@ class DocumentMapper:
         1. Filename index: For exact filename matching
         2. Title index: For title-based lookups
         3. URL index: For source URL matching (from frontmatter)
+
+        If the cache file was written for the same set of files and
+        modification times, the indices are loaded from it instead.
         """
         print("Building document indices...")
-        total_files = 0
+        documents = []
 
         for doc_dir in self.doc_directories:
             doc_path = Path(doc_dir)
             if not doc_path.exists():
                 continue
 
-            for root, _, files in os.walk(doc_path):
-                for file in files:
-                    if file.endswith('.md'):
-                        full_path = Path(root) / file
-                        total_files += 1
-
-                        # Index by filename (lowercase for case-insensitive matching)
-                        self.filename_index[file.lower()] = str(full_path)
-
-                        # Index by normalized title (extracted from filename)
-                        title = self._normalize_title(file.replace('.md', ''))
-                        self.title_index[title] = str(full_path)
-
-                        # Try to extract source URL from file content
-                        try:
-                            with open(full_path, 'r', encoding='utf-8') as f:
-                                # Only read first 1000 chars for efficiency
-                                content = f.read(1000)
-                                source_url = self._extract_source_url(content)
-                                if source_url:
-                                    self.url_index[source_url] = str(full_path)
-                        except:
-                            pass
+            documents.extend(_iter_markdown(str(doc_path)))
+
+        total_files = len(documents)
+        signature = self._index_signature(documents)
+
+        if self._load_cache(signature):
+            print(f"  Loaded indices from cache: {self.cache_file}")
+        else:
+            self._index_documents(documents)
+            self._save_cache(signature)
 
         print(f"  Indexed {total_files} documents")
         print(f"  By filename: {len(self.filename_index)}")
         print(f"  By title: {len(self.title_index)}")
         print(f"  By URL: {len(self.url_index)}")
 
+    def _index_documents(self, documents: List[os.DirEntry]) -> None:
+        """
+        Build every index structure from the walked documents.
+
+        Args:
+            documents: Markdown files from _iter_markdown, in walk order
+        """
+        # Overlap the per-file reads; indices are only updated on this thread
+        with ThreadPoolExecutor(max_workers=self.READ_WORKERS) as executor:
+            heads = executor.map(_read_head, [entry.path for entry in documents])
+
+            for entry, content in zip(documents, heads):
+                # One path string per document, shared by all three indices
+                full_path = entry.path
+
+                # Index by filename (lowercase for case-insensitive matching)
+                self.filename_index[entry.name.lower()] = full_path
+
+                # Index by normalized title (extracted from filename)
+                title = self._normalize_title(entry.name.replace('.md', ''))
+                self.title_index[title] = full_path
+
+                # Try to extract source URL from the first 1000 bytes
+                if content:
+                    source_url = self._extract_source_url(content)
+                    if source_url:
+                        self.url_index[source_url] = full_path
+
+        for rank, title in enumerate(self.title_index):
+            self._title_rank[title] = rank
+        self._title_max_length = max(map(len, self.title_index), default=0)
+
+        # Freeze titles into a trie once the walk has settled every path
+        if HAS_MARISA:
+            self.title_index = _TitleTrie(self.title_index)
+
+        for rank, filename in enumerate(self.filename_index):
+            self._filename_rank[filename] = rank
+            for i in range(len(filename) - 2):
+                self._trigram_index[filename[i:i + 3]].add(filename)
+
+        if HAS_AHOCORASICK and self.filename_index:
+            self._filename_ac = ahocorasick.Automaton()
+            for filename in self.filename_index:
+                self._filename_ac.add_word(filename, filename)
+            self._filename_ac.make_automaton()
+
+        if HAS_BKTREE:
+            self.title_bk = pybktree.BKTree(_title_distance, self.title_index.keys())
+
+    def _index_signature(self, documents: List[os.DirEntry]) -> str:
+        """
+        Fingerprint the walked files so a stale cache is never loaded.
+
+        Covers every path and modification time, the scanned directories,
+        the cache version, and which optional index libraries are present.
+
+        Args:
+            documents: Markdown files from _iter_markdown
+
+        Returns:
+            Hex digest identifying this corpus and configuration
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr((
+            self.CACHE_VERSION, self.doc_directories,
+            HAS_BKTREE, HAS_AHOCORASICK, HAS_MARISA
+        )).encode('utf-8'))
+
+        for entry in documents:
+            try:
+                mtime = entry.stat().st_mtime_ns
+            except OSError:
+                mtime = -1
+            digest.update(f"{entry.path}\0{mtime}\0".encode('utf-8', 'surrogateescape'))
+
+        return digest.hexdigest()
+
+    def _load_cache(self, signature: str) -> bool:
+        """
+        Restore index structures from the cache file if it matches signature.
+
+        Args:
+            signature: Result of _index_signature() for the current walk
+
+        Returns:
+            True if the indices were loaded
+        """
+        if not self.cache_file or not self.cache_file.exists():
+            return False
+
+        try:
+            with open(self.cache_file, 'rb') as f:
+                cached = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError,
+                ImportError, IndexError, ValueError) as e:
+            # Truncated, or written with libraries this environment lacks
+            print(f"  [WARNING] Ignoring unreadable index cache: {e}")
+            return False
+
+        if not isinstance(cached, dict) or cached.get('signature') != signature:
+            return False
+
+        # Restore the index structures and nothing else
+        state = cached.get('state')
+        if not isinstance(state, dict) or set(state) != set(self.INDEX_STATE):
+            return False
+
+        for name in self.INDEX_STATE:
+            setattr(self, name, state[name])
+        return True
+
+    def _save_cache(self, signature: str) -> None:
+        """
+        Persist the built index structures for the next run.
+
+        Writes to a temporary file and renames it, so a crash mid-write
+        never leaves a half-written cache behind.
+
+        Args:
+            signature: Result of _index_signature() for the indexed walk
+        """
+        if not self.cache_file or not self.cache_file.parent.exists():
+            return
+
+        state = {name: getattr(self, name) for name in self.INDEX_STATE}
+        tmp_file = self.cache_file.with_name(self.cache_file.name + '.tmp')
+
+        try:
+            with open(tmp_file, 'wb') as f:
+                pickle.dump(
+                    {'signature': signature, 'state': state},
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL
+                )
+            os.replace(tmp_file, self.cache_file)
+        except (OSError, pickle.PicklingError, TypeError) as e:
+            tmp_file.unlink(missing_ok=True)
+            print(f"  [WARNING] Could not write index cache: {e}")
+
     def _normalize_title(self, title: str) -> str:
         """
         Normalize title for consistent comparison.
@@ -126,13 +596,7 @@ class DocumentMapper:
         Returns:
             Normalized title
         """
-        # Remove special characters, keep alphanumeric and spaces
-        title = re.sub(r'[^\w\s-]', '', title.lower())
-        # Normalize separators to spaces
-        title = re.sub(r'[-_\s]+', ' ', title)
-        # URL decode
-        title = unquote(title)
-        return title.strip()
+        return _normalize_title(title)
 
     def _extract_source_url(self, content: str) -> Optional[str]:
         """
@@ -149,21 +613,19 @@ class DocumentMapper:
         Returns:
             Source URL or None
         """
-        # Try YAML frontmatter
-        url_match = re.search(r'^url:\s*(.+)$', content, re.MULTILINE)
-        if url_match:
-            return url_match.group(1).strip()
-
-        # Try Dropbox URL
-        dropbox_match = re.search(r'https://[^\s\)]*dropbox\.com[^\s\)]*', content)
-        if dropbox_match:
+        # One scan finds every candidate; frontmatter wins outright,
+        # otherwise the first Dropbox URL beats the first Drive URL
+        found: Dict[str, str] = {}
+        for match in SOURCE_URL_RE.finditer(content):
+            kind = match.lastgroup
+            if kind == 'yaml':
+                return match.group('yaml').strip()
+            found.setdefault(kind, match.group(kind))
+
+        url = found.get('dropbox') or found.get('drive')
+        if url:
             # Remove query params for cleaner matching
-            return dropbox_match.group(0).split('?')[0]
-
-        # Try Google Drive URL
-        drive_match = re.search(r'https://drive\.google\.com[^\s\)]*', content)
-        if drive_match:
-            return drive_match.group(0).split('?')[0]
+            return url.split('?')[0]
 
         return None
 
@@ -182,6 +644,11 @@ class DocumentMapper:
         4. Exact title match (confidence: 0.80)
         5. Fuzzy title match (confidence: varies, min 0.70)
 
+        Links that don't look like documents (no office/PDF extension or
+        cloud storage host, per DOC_LINK_RE) return no_match without
+        being parsed. With bloom_filter enabled, links whose filename and
+        title are both definitely not indexed stop after strategy 1.
+
         Args:
             link_url: URL of the link to match
             link_text: Display text of the link
@@ -189,6 +656,17 @@ class DocumentMapper:
         Returns:
             Tuple of (local_file_path, confidence_score, match_type)
         """
+        if not DOC_LINK_RE.search(link_url):
+            return (None, 0.0, 'no_match')
+
+        return self._match_document(link_url, link_text)
+
+    def _match_document(
+        self,
+        link_url: str,
+        link_text: str
+    ) -> Tuple[Optional[str], float, str]:
+        """Run the matching strategies for a link already known to be a document."""
         # Strategy 1: Exact URL match (highest confidence)
         if 'dropbox.com' in link_url or 'drive.google.com' in link_url:
             clean_url = link_url.split('?')[0]
@@ -199,6 +677,9 @@ class DocumentMapper:
         parsed = urlparse(link_url)
         url_filename = os.path.basename(parsed.path)
 
+        if self._name_bloom is not None and not self._maybe_indexed(url_filename, link_text):
+            return (None, 0.0, 'no_match')
+
         if url_filename:
             url_filename_lower = url_filename.lower()
 
@@ -209,9 +690,9 @@ class DocumentMapper:
                     return (self.filename_index[md_filename], 0.95, 'filename_exact')
 
             # Try partial filename match
-            for filename, path in self.filename_index.items():
-                if url_filename_lower in filename or filename in url_filename_lower:
-                    return (path, 0.85, 'filename_partial')
+            filename = self._partial_filename_match(url_filename_lower)
+            if filename:
+                return (self.filename_index[filename], 0.85, 'filename_partial')
 
         # Strategy 4 & 5: Title matching (from link text)
         if link_text:
@@ -222,21 +703,158 @@ class DocumentMapper:
                 return (self.title_index[normalized_text], 0.80, 'title_exact')
 
             # Fuzzy title match
-            best_match = None
-            best_score = 0.70  # Minimum threshold
+            best_match, best_score = self._fuzzy_title_match(normalized_text)
+            if best_match:
+                return (best_match, best_score, 'title_fuzzy')
+
+        # No match found
+        return (None, 0.0, 'no_match')
+
+    def _maybe_indexed(self, url_filename: str, link_text: str) -> bool:
+        """
+        Check the Bloom filter for the link's filename (as .md) or title.
+
+        Args:
+            url_filename: Filename from the link URL
+            link_text: Display text of the link
+
+        Returns:
+            False only if neither can be in filename_index or title_index
+        """
+        md_filename = url_filename.lower()
+        if md_filename.endswith('.pdf'):
+            md_filename = md_filename.replace('.pdf', '.md')
+
+        if md_filename and md_filename in self._name_bloom:
+            return True
+        return bool(link_text) and self._normalize_title(link_text) in self._name_bloom
+
+    def _partial_filename_match(self, query: str) -> Optional[str]:
+        """
+        Find the first indexed filename that contains query or is contained in it.
+
+        Filenames containing the query must share all of its trigrams, so
+        candidates come from intersecting trigram postings. Filenames inside
+        the query come from one walk of the Aho-Corasick automaton; without
+        it, since indexed names all end in '.md', only substrings ending at
+        one of the query's '.md' occurrences are looked up.
+
+        Args:
+            query: Lowercased filename from the link URL
+
+        Returns:
+            Matching filename_index key, or None
+        """
+        candidates = []
+
+        if len(query) >= 3:
+            postings = sorted(
+                (self._trigram_index.get(query[i:i + 3], set()) for i in range(len(query) - 2)),
+                key=len
+            )
+            candidates.extend(
+                name for name in postings[0].intersection(*postings[1:])
+                if query in name
+            )
+        else:
+            candidates.extend(name for name in self.filename_index if query in name)
+
+        if self._filename_ac is not None:
+            candidates.extend(name for _, name in self._filename_ac.iter(query))
+        else:
+            end = query.find('.md')
+            while end != -1:
+                end += 3
+                candidates.extend(
+                    query[start:end] for start in range(end - 2)
+                    if query[start:end] in self._filename_rank
+                )
+                end = query.find('.md', end - 2)
+
+        if not candidates:
+            return None
+        return min(candidates, key=self._filename_rank.__getitem__)
+
+    def _fuzzy_title_match(self, normalized_text: str) -> Tuple[Optional[str], float]:
+        """
+        Find the indexed title most similar to normalized_text.
+
+        Titles are scored 1 - d / (query length + title length), with d
+        the Indel distance (insertions and deletions only), so every path
+        shares fuzz.ratio's scale. With the BK-tree, the threshold becomes
+        a search radius: a title beats it only if d < (1 - threshold) *
+        (query + title length), and d is at least the length difference,
+        so the radius allows for the longest title that could still pass.
+        Otherwise every title is scored, by rapidfuzz (which skips titles
+        that can't reach the cutoff) or by SequenceMatcher, whose cheap
+        upper bounds rule out most titles before the full ratio is
+        computed. SequenceMatcher counts only matching blocks, never more
+        than the longest common subsequence that Indel is based on, so its
+        scores are the same or lower and it can miss near-threshold
+        matches the other two paths find.
+
+        Args:
+            normalized_text: Normalized link text
+
+        Returns:
+            Tuple of (path, score), or (None, 0.0) if nothing beats FUZZY_THRESHOLD
+        """
+        best_match = None
+        best_score = self.FUZZY_THRESHOLD
+
+        if self.title_bk is not None:
+            text_length = len(normalized_text)
+            max_title_length = min(
+                self._title_max_length,
+                int(text_length * (2 - self.FUZZY_THRESHOLD) / self.FUZZY_THRESHOLD)
+            )
+            max_distance = int((1 - self.FUZZY_THRESHOLD) * (text_length + max_title_length))
+
+            best_rank = None
+            for distance, title in self.title_bk.find(normalized_text, max_distance):
+                total_length = text_length + len(title)
+                score = 1 - distance / total_length if total_length else 1.0
+                rank = self._title_rank[title]
+                if score > best_score or (score == best_score and best_rank is not None
+                                          and rank < best_rank):
+                    best_score = score
+                    best_rank = rank
+                    best_match = self.title_index[title]
+        elif HAS_RAPIDFUZZ:
+            result = process.extractOne(
+                normalized_text,
+                self.title_index.keys(),
+                scorer=fuzz.ratio,
+                score_cutoff=best_score * 100
+            )
+            if result and result[1] > best_score * 100:
+                best_score = result[1] / 100
+                best_match = self.title_index[result[0]]
+        else:
+            # One matcher for the query; only the title side changes
+            matcher = SequenceMatcher(None, normalized_text)
+            text_length = len(normalized_text)
 
             for title, path in self.title_index.items():
+                # ratio() <= 2 * shorter / total: skip titles whose length rules them out
+                total_length = text_length + len(title)
+                if 2.0 * min(text_length, len(title)) / total_length <= best_score:
+                    continue
+
+                # ratio() <= quick_ratio() (shared characters, ignoring order)
+                matcher.set_seq2(title)
+                if matcher.quick_ratio() <= best_score:
+                    continue
+
                 # Use SequenceMatcher for fuzzy comparison
-                score = SequenceMatcher(None, normalized_text, title).ratio()
+                score = matcher.ratio()
                 if score > best_score:
                     best_score = score
                     best_match = path
 
-            if best_match:
-                return (best_match, best_score, 'title_fuzzy')
-
-        # No match found
-        return (None, 0.0, 'no_match')
+        if best_match is None:
+            return (None, 0.0)
+        return (best_match, best_score)
 
     def extract_document_links(self, html_content: str, page_url: str) -> List[Dict]:
         """
@@ -254,41 +872,28 @@ class DocumentMapper:
         Returns:
             List of document link dictionaries with match info
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, HTML_PARSER, parse_only=LINK_STRAINER)
         document_links = []
 
-        # Patterns indicating document links
-        doc_patterns = [
-            r'\.pdf$',
-            r'\.docx?$',
-            r'\.xlsx?$',
-            r'\.pptx?$',
-            r'dropbox\.com',
-            r'drive\.google\.com',
-            r'sharepoint\.com'
-        ]
-
-        for a_tag in soup.find_all('a', href=True):
-            href = a_tag['href']
-            text = a_tag.get_text(strip=True)
+        anchors = soup.find_all('a', href=True)
+        hrefs = [a_tag['href'] for a_tag in anchors]
 
-            # Check if this matches any document pattern
-            is_document = any(
-                re.search(pattern, href, re.IGNORECASE)
-                for pattern in doc_patterns
-            )
+        for a_tag, href, is_document in zip(anchors, hrefs, _screen_document_hrefs(hrefs)):
+            # Skip anything that doesn't match a document pattern
+            if not is_document:
+                continue
 
-            if is_document:
-                # Find matching local file
-                local_file, confidence, match_type = self.find_matching_document(href, text)
+            # Find matching local file
+            text = a_tag.get_text(strip=True)
+            local_file, confidence, match_type = self._match_document(href, text)
 
-                document_links.append({
-                    'url': href,
-                    'text': text,
-                    'local_file': local_file,
-                    'confidence': confidence,
-                    'match_type': match_type
-                })
+            document_links.append({
+                'url': href,
+                'text': text,
+                'local_file': local_file,
+                'confidence': confidence,
+                'match_type': match_type
+            })
 
         return document_links
 
@@ -313,21 +918,22 @@ class DocumentMapper:
         Returns:
             Relationship metadata dictionary
         """
-        linked_docs = []
-        high_confidence_matches = []
-
-        for link in document_links:
-            if link['local_file']:
-                linked_docs.append({
-                    'document_url': link['url'],
-                    'document_text': link['text'],
-                    'local_file': link['local_file'],
-                    'confidence': link['confidence'],
-                    'match_type': link['match_type']
-                })
-
-                if link['confidence'] >= 0.85:
-                    high_confidence_matches.append(link['local_file'])
+        linked_docs = [
+            {
+                'document_url': link['url'],
+                'document_text': link['text'],
+                'local_file': link['local_file'],
+                'confidence': link['confidence'],
+                'match_type': link['match_type']
+            }
+            for link in document_links
+            if link['local_file']
+        ]
+
+        high_confidence_matches = [
+            doc['local_file'] for doc in linked_docs
+            if doc['confidence'] >= self.HIGH_CONFIDENCE
+        ]
 
         # Determine page type based on document link density
         is_portal = len(high_confidence_matches) >= 3
@@ -4,33 +4,201 @@ Cloud Storage Processor - Dropbox API integration for document processing
 
 This module provides complete Dropbox API integration for:
 - Listing files recursively with pagination
-- Downloading with temporary links
-- Shared link creation/retrieval
-- Batch processing with document conversion
+- Downloading in one request through files/download
+- Shared link creation/retrieval, cached on disk between runs
+- Resume support: unchanged files are skipped without any API call
+- Duplicate files (same content_hash) are downloaded and converted once
+- Concurrent batch processing with document conversion
 
 Production features:
-- Token validation and permission checking
+- Token validation and permission checking (remembered for a few hours)
 - Pagination handling for large folders
-- Rate limiting and error recovery
+- Adaptive rate limiting with 429/Retry-After backoff
 - File size limits
 - Comprehensive summary generation
 
 Author: Scott Allen
 """
 
+import asyncio
+import hashlib
+import io
 import json
 import os
+import random
 import sys
 import time
-from datetime import datetime
+from collections import defaultdict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple
 
+import aiohttp
 import requests
+from urllib3.util.retry import Retry
+
+# Faster JSON parsing and serialization when available
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Optional: download writes that don't block the event loop
+try:
+    import aiofiles
+    HAS_AIOFILES = True
+except ImportError:
+    HAS_AIOFILES = False
 
 from .document_processor import DocumentProcessor
 
 
+@asynccontextmanager
+async def async_file_writer(
+    path: Path,
+    mode: str = 'wb',
+    offset: int = 0
+) -> AsyncIterator[Callable[[bytes], Awaitable[None]]]:
+    """
+    Open a file for writing from a coroutine.
+
+    With aiofiles installed, writes run in its thread pool so a slow disk
+    doesn't stall other downloads; otherwise they happen inline.
+
+    Args:
+        path: File to write
+        mode: Open mode ('wb', or 'r+b' to write into an existing file)
+        offset: Position to start writing at
+
+    Yields:
+        Coroutine function writing one chunk
+    """
+    if HAS_AIOFILES:
+        async with aiofiles.open(path, mode) as f:
+            if offset:
+                await f.seek(offset)
+            yield f.write
+    else:
+        with open(path, mode) as f:
+            if offset:
+                f.seek(offset)
+
+            async def write(chunk: bytes) -> None:
+                f.write(chunk)
+
+            yield write
+
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket that only slows down when Dropbox pushes back.
+
+    Requests start at the configured rate. Each HTTP 429 halves the rate
+    and pauses every caller for Retry-After (plus jitter); after a run of
+    consecutive successes the rate climbs back by 10% up to the ceiling.
+    """
+
+    # Consecutive successes before the rate is raised again
+    RECOVER_AFTER = 20
+
+    # Never throttle below this many requests per second
+    MIN_RATE = 0.5
+
+    def __init__(self, tokens_per_sec: float):
+        """
+        Initialize the limiter.
+
+        Args:
+            tokens_per_sec: Starting (and maximum) requests per second
+        """
+        self.max_rate = max(self.MIN_RATE, tokens_per_sec)
+        self.tokens_per_sec = self.max_rate
+        self._tokens = 1.0
+        self._updated = 0.0
+        self._paused_until = 0.0
+        self._successes = 0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        loop = asyncio.get_running_loop()
+
+        # Waiters queue on the lock, so tokens are handed out in order
+        async with self._lock:
+            now = loop.time()
+            if now < self._paused_until:
+                await asyncio.sleep(self._paused_until - now)
+                now = loop.time()
+
+            # Refill; the bucket holds at most one second of requests
+            if self._updated:
+                self._tokens = min(
+                    self.tokens_per_sec,
+                    self._tokens + (now - self._updated) * self.tokens_per_sec
+                )
+            self._updated = now
+
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.tokens_per_sec)
+                self._tokens = 1.0
+                self._updated = loop.time()
+            self._tokens -= 1
+
+    def success(self) -> None:
+        """Record a request that wasn't throttled."""
+        self._successes += 1
+        if self._successes >= self.RECOVER_AFTER and self.tokens_per_sec < self.max_rate:
+            self.tokens_per_sec = min(self.max_rate, self.tokens_per_sec * 1.1)
+            self._successes = 0
+
+    async def backoff(self, retry_after: Optional[str], attempt: int) -> None:
+        """
+        Slow down after an HTTP 429.
+
+        Args:
+            retry_after: Retry-After header value (seconds), if sent
+            attempt: 0-based retry count for this request
+        """
+        try:
+            delay = float(retry_after)
+        except (TypeError, ValueError):
+            delay = float(min(2 ** attempt, 60))  # Exponential when no hint
+        delay += random.uniform(0, 0.5)
+
+        # Requests already in flight when the first 429 arrived are
+        # rejected too; halve once per pause rather than once per request
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        if now >= self._paused_until:
+            self.tokens_per_sec = max(self.MIN_RATE, self.tokens_per_sec / 2)
+            self._tokens = min(self._tokens, 1.0)
+        self._successes = 0
+
+        # Pause every caller, not just the one that was throttled
+        self._paused_until = max(self._paused_until, now + delay)
+        await asyncio.sleep(delay)
+
+
+class DropboxFile(NamedTuple):
+    """
+    One supported file from a folder listing.
+
+    A tuple rather than a dict, so large listings stay compact.
+    """
+    name: str
+    path: str  # path_display
+    id: str
+    size: int
+    modified: str  # client_modified, "" if Dropbox didn't send one
+    type: str  # Lowercase extension without the dot
+    subfolder: str  # Second path component, or "root"
+    subfolder_safe: str  # subfolder as a local directory name
+    content_hash: str  # Dropbox content hash, "" if not sent
+
+
 class CloudStorageProcessor:
     """
     Process files from Dropbox using the official API.
@@ -40,22 +208,71 @@ class CloudStorageProcessor:
     - Recursive folder listing with pagination
     - Temporary and shared link generation
     - Integration with DocumentProcessor for text extraction
-    - Batch processing with summary generation
+    - Concurrent batch processing over one aiohttp session
+    - Summary generation
 
     This class handles all Dropbox API interactions and delegates
     document processing to DocumentProcessor.
     """
 
-    # Supported file types for processing
-    SUPPORTED_EXTENSIONS = ['.pdf', '.docx', '.doc', '.pptx', '.ppt', '.xlsx', '.xls', '.txt']
+    # Supported file types for processing (lowercase, no leading dot)
+    SUPPORTED_EXTENSIONS = frozenset({'pdf', 'docx', 'doc', 'pptx', 'ppt', 'xlsx', 'xls', 'txt'})
 
     # Maximum file size (50MB)
     MAX_FILE_SIZE = 50 * 1024 * 1024
 
+    # Files smaller than this (8MB) are parsed from memory, not re-read from disk
+    IN_MEMORY_LIMIT = 8 * 1024 * 1024
+
+    # Files downloaded and linked at the same time
+    # (override with DROPBOX_MAX_CONCURRENT)
+    MAX_CONCURRENT_REQUESTS = 10
+
+    # Starting and maximum API request rate
+    # (override with DROPBOX_REQUESTS_PER_SECOND)
+    REQUESTS_PER_SECOND = 50.0
+
+    # Retries for a request throttled with HTTP 429
+    MAX_RETRIES = 5
+
+    # Returns file contents directly; the path goes in Dropbox-API-Arg
+    DOWNLOAD_URL = "https://content.dropboxapi.com/2/files/download"
+
+    # Read size when streaming a download to disk (1MB)
+    DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+    # Files larger than this (25MB) are fetched as parallel byte ranges
+    RANGED_DOWNLOAD_THRESHOLD = 25 * 1024 * 1024
+    RANGED_DOWNLOAD_PARTS = 4
+
+    # Connections kept open to the Dropbox hosts (per session)
+    CONNECTION_POOL_SIZE = 20
+
+    # Shared-link cache format version (bump if the layout changes)
+    LINK_CACHE_VERSION = 1
+
+    # New cache entries (links, processed files) collected before the
+    # cache file is rewritten
+    LINK_CACHE_FLUSH_EVERY = 50
+
+    # How long a successful token check is trusted (4 hours, the lifetime
+    # of a short-lived Dropbox token, counted from the check); any HTTP 401
+    # drops it early
+    TOKEN_CHECK_TTL = 4 * 60 * 60
+
+    # Successful token checks by token hash, shared between runs
+    TOKEN_CHECK_CACHE = Path.home() / '.cache' / 'dropbox' / 'token_valid.json'
+
+    # Seconds between progress lines when verbose is off
+    PROGRESS_INTERVAL = 1.0
+
     def __init__(
         self,
         access_token: str,
-        output_dir: str = "./output/cloud-storage"
+        output_dir: str = "./output/cloud-storage",
+        parse_workers: Optional[int] = None,
+        parse_processes: bool = False,
+        verbose: bool = True
     ):
         """
         Initialize the cloud storage processor.
@@ -63,8 +280,16 @@ class CloudStorageProcessor:
         Args:
             access_token: Dropbox API access token
             output_dir: Directory to save processed files
+            parse_workers: Documents converted at the same time
+                (default: one per CPU)
+            parse_processes: Convert in a process pool instead of threads,
+                so PDF/Office parsing isn't serialized by the GIL
+            verbose: Print every step for every file; when off, batches
+                print a progress line every PROGRESS_INTERVAL seconds plus
+                warnings and errors (useful for large folders or slow consoles)
         """
         self.access_token = access_token
+        self.verbose = verbose
         self.headers = {
             "Authorization": f"Bearer {access_token}",
             "Content-Type": "application/json"
@@ -72,8 +297,57 @@ class CloudStorageProcessor:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Concurrency and rate limits for batch processing
+        self.max_concurrent = max(1, int(
+            os.getenv('DROPBOX_MAX_CONCURRENT', self.MAX_CONCURRENT_REQUESTS)
+        ))
+        self.requests_per_second = float(
+            os.getenv('DROPBOX_REQUESTS_PER_SECOND', self.REQUESTS_PER_SECOND)
+        )
+        self._limiter: Optional[AdaptiveRateLimiter] = None  # Created per session
+
+        # Document conversion runs in a pool so it overlaps with downloads
+        self.parse_workers = max(1, parse_workers or os.cpu_count() or 1)
+        self.parse_processes = parse_processes
+        self._parse_pool: Optional[Executor] = None  # Created per batch
+
+        # Sync HTTP session with connection pooling (token check, one-off calls).
+        # Headers stay per request: downloads and temp links need different ones.
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=self.CONNECTION_POOL_SIZE,
+            pool_maxsize=self.CONNECTION_POOL_SIZE,
+            max_retries=Retry(
+                total=self.MAX_RETRIES,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=frozenset(['GET', 'POST']),  # Dropbox RPC calls are POSTs
+                raise_on_status=False  # Hand the last response back to the caller
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # Shared links, and the last successful conversion of each file,
+        # by Dropbox file id (ids survive renames and moves)
+        self._link_cache_path = self.output_dir / '.link_cache.json'
+        self._link_cache, self._processed_cache = self._load_link_cache()
+        self._link_cache_pending = 0  # Entries not yet written to disk
+
+        # Every shared link on the account by lowercase path, fetched
+        # once per batch (None until a full listing has succeeded)
+        self._link_index: Optional[Dict[str, str]] = None
+
+        # First successful result per content_hash, reused for duplicates
+        self._hash_results: Dict[str, Dict] = {}
+
+        # Last successful token check (epoch seconds) and root folder listing
+        self._token_hash = hashlib.sha256(access_token.encode('utf-8')).hexdigest()
+        self._token_checked_at = self._load_token_check()
+        self._root_folders: Optional[List[str]] = None
+
         # Initialize document processor for file conversion
-        self.processor = DocumentProcessor(output_dir=str(self.output_dir))
+        self.processor = DocumentProcessor(output_dir=str(self.output_dir), verbose=verbose)
 
         # Statistics
         self.stats = {
@@ -81,10 +355,14 @@ class CloudStorageProcessor:
             'files_processed': 0,
             'files_skipped': 0,
             'files_failed': 0,
-            'bytes_processed': 0
+            'files_up_to_date': 0,
+            'files_skipped_cached': 0,
+            'files_deduplicated': 0,
+            'bytes_processed': 0,
+            'requests_throttled': 0
         }
 
-    def validate_token(self) -> bool:
+    def validate_token(self, force: bool = False) -> bool:
         """
         Test if the token is valid and has proper permissions.
 
@@ -93,41 +371,125 @@ class CloudStorageProcessor:
         - Account is accessible
         - Required scopes are available
 
+        A successful check is trusted for TOKEN_CHECK_TTL, in this process
+        and (via TOKEN_CHECK_CACHE) in later runs with the same token.
+
+        Args:
+            force: Ask Dropbox even if a recent check succeeded
+
         Returns:
             True if token is valid, False otherwise
         """
+        age = time.time() - self._token_checked_at
+        if not force and 0 <= age < self.TOKEN_CHECK_TTL:
+            print(f"[OK] Token validated {int(age // 60)} min ago")
+            return True
+
         url = "https://api.dropboxapi.com/2/users/get_current_account"
 
         try:
             # This endpoint doesn't need Content-Type header
             headers = {"Authorization": f"Bearer {self.access_token}"}
-            response = requests.post(url, headers=headers)
+            response = self._post(url, headers=headers)
 
             if response.status_code == 200:
                 user_info = response.json()
                 email = user_info.get('email', 'Unknown')
                 print(f"[OK] Token valid for: {email}")
+                self._save_token_check(time.time())
                 return True
             else:
                 print(f"[FAIL] Token validation failed: {response.status_code}")
                 print(f"  Response: {response.text[:200]}")
+                self._save_token_check(None)
                 return False
 
         except Exception as e:
             print(f"[ERROR] Token validation error: {e}")
             return False
 
+    def _post(self, url: str, **kwargs) -> requests.Response:
+        """
+        Send a one-off API request on the sync session.
+
+        An HTTP 401 means the token no longer works, so the last
+        successful check is forgotten and the next validate_token() asks
+        Dropbox instead of trusting it for the rest of its TTL.
+
+        Args:
+            url: Request URL
+            **kwargs: Passed to session.post
+
+        Returns:
+            The response
+        """
+        response = self.session.post(url, **kwargs)
+        if response.status_code == 401:
+            self._forget_token_check()
+        return response
+
+    def _forget_token_check(self) -> None:
+        """Drop a trusted token check (no-op if none is held)."""
+        if self._token_checked_at:
+            self._save_token_check(None)
+
+    def _load_token_check(self) -> float:
+        """
+        Look up when this token last passed validation.
+
+        Returns:
+            Epoch seconds of the last successful check, 0.0 if none
+        """
+        try:
+            checks = json.loads(self.TOKEN_CHECK_CACHE.read_text(encoding='utf-8'))
+            return float(checks.get(self._token_hash, 0.0))
+        except (OSError, ValueError, TypeError, AttributeError):
+            return 0.0
+
+    def _save_token_check(self, checked_at: Optional[float]) -> None:
+        """
+        Record (or with None, forget) a successful token check.
+
+        Only a hash of the token is written to disk.
+
+        Args:
+            checked_at: Epoch seconds of the check, or None to drop it
+        """
+        self._token_checked_at = checked_at or 0.0
+
+        try:
+            checks = json.loads(self.TOKEN_CHECK_CACHE.read_text(encoding='utf-8'))
+            if not isinstance(checks, dict):
+                checks = {}
+        except (OSError, ValueError):
+            checks = {}
+
+        if checked_at is None:
+            if checks.pop(self._token_hash, None) is None:
+                return
+        else:
+            checks[self._token_hash] = checked_at
+
+        try:
+            self.TOKEN_CHECK_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.TOKEN_CHECK_CACHE.with_name(self.TOKEN_CHECK_CACHE.name + '.tmp')
+            tmp_path.write_text(json.dumps(checks), encoding='utf-8')
+            os.replace(tmp_path, self.TOKEN_CHECK_CACHE)
+        except OSError as e:
+            print(f"[WARNING] Could not save token check: {e}")
+
     def list_folder(
         self,
         folder_path: str = "",
         recursive: bool = True
-    ) -> List[Dict]:
+    ) -> List[DropboxFile]:
         """
         List all files in a folder.
 
         Features:
         - Recursive listing (optional)
-        - Automatic pagination handling
+        - Automatic pagination handling, fetching the next page while
+          the current one is filtered
         - Filters to supported file types only
         - Metadata extraction (size, modified date)
 
@@ -136,11 +498,43 @@ class CloudStorageProcessor:
             recursive: Whether to list recursively
 
         Returns:
-            List of file metadata dictionaries
+            List of supported files
+        """
+        print(f"Listing files in: {folder_path or '(root)'}")
+
+        all_files = asyncio.run(self._list_folder_async(folder_path, recursive))
+        if all_files is None:
+            return []
+
+        print(f"  Found {len(all_files)} supported files")
+        self.stats['files_found'] = len(all_files)
+        return all_files
+
+    async def _list_folder_async(
+        self,
+        folder_path: str,
+        recursive: bool
+    ) -> Optional[List[DropboxFile]]:
+        """
+        Page through list_folder, keeping the next page request in flight.
+
+        The continue cursor is sequential, so pages can't be fetched in
+        parallel; instead page N+1 is requested before page N's entries
+        are filtered.
+
+        Args:
+            folder_path: Path to folder (empty string for root)
+            recursive: Whether to list recursively
+
+        Returns:
+            List of supported files, or None on error
         """
         all_files = []
+        append = all_files.append
+        supported = self.SUPPORTED_EXTENSIONS
 
         url = "https://api.dropboxapi.com/2/files/list_folder"
+        continue_url = "https://api.dropboxapi.com/2/files/list_folder/continue"
         data = {
             "path": folder_path,
             "recursive": recursive,
@@ -149,70 +543,55 @@ class CloudStorageProcessor:
             "include_has_explicit_shared_members": False
         }
 
-        print(f"Listing files in: {folder_path or '(root)'}")
-
-        try:
-            response = requests.post(url, headers=self.headers, json=data)
-            response.raise_for_status()
-            result = response.json()
-
-            # Process entries
-            for entry in result.get("entries", []):
-                if entry[".tag"] == "file":
-                    name = entry["name"]
-                    ext = Path(name).suffix.lower()
-
-                    if ext in self.SUPPORTED_EXTENSIONS:
-                        all_files.append({
-                            "name": name,
-                            "path": entry["path_display"],
-                            "id": entry["id"],
-                            "size": entry.get("size", 0),
-                            "modified": entry.get("client_modified", ""),
-                            "type": ext[1:]  # Remove leading dot
-                        })
-
-            # Handle pagination
-            has_more = result.get("has_more", False)
-            cursor = result.get("cursor")
-
-            while has_more:
-                continue_url = "https://api.dropboxapi.com/2/files/list_folder/continue"
-                continue_response = requests.post(
-                    continue_url,
-                    headers=self.headers,
-                    json={"cursor": cursor}
-                )
-                continue_response.raise_for_status()
-                continue_result = continue_response.json()
-
-                for entry in continue_result.get("entries", []):
-                    if entry[".tag"] == "file":
-                        name = entry["name"]
-                        ext = Path(name).suffix.lower()
-
-                        if ext in self.SUPPORTED_EXTENSIONS:
-                            all_files.append({
-                                "name": name,
-                                "path": entry["path_display"],
-                                "id": entry["id"],
-                                "size": entry.get("size", 0),
-                                "modified": entry.get("client_modified", ""),
-                                "type": ext[1:]
-                            })
-
-                has_more = continue_result.get("has_more", False)
-                cursor = continue_result.get("cursor")
-
-            print(f"  Found {len(all_files)} supported files")
-            self.stats['files_found'] = len(all_files)
-            return all_files
-
-        except requests.exceptions.RequestException as e:
-            print(f"[ERROR] Listing folder: {e}")
-            if hasattr(e, 'response') and e.response:
-                print(f"  Response: {e.response.text[:200]}")
-            return []
+        async with self._new_session() as session:
+            next_page = asyncio.create_task(self._post_json(session, url, data))
+
+            try:
+                while next_page is not None:
+                    result = await next_page
+
+                    # Start fetching the next page before filtering this one
+                    next_page = None
+                    if result.get("has_more", False):
+                        next_page = asyncio.create_task(self._post_json(
+                            session, continue_url, {"cursor": result.get("cursor")}
+                        ))
+
+                    # Process entries
+                    for entry in result.get("entries", []):
+                        if entry[".tag"] == "file":
+                            name = entry["name"]
+                            # rpartition avoids building a Path per entry; an
+                            # empty stem skips dotfiles, as Path.suffix does
+                            stem, _, ext = name.rpartition('.')
+                            ext = ext.lower()
+
+                            if stem and ext in supported:
+                                path = entry["path_display"]
+                                # /<folder>/<subfolder>/... groups output by subfolder
+                                parts = path.split("/", 3)
+                                subfolder = parts[2] if len(parts) > 3 else "root"
+                                append(DropboxFile(
+                                    name,
+                                    path,
+                                    entry["id"],
+                                    entry.get("size", 0),
+                                    entry.get("client_modified", ""),
+                                    ext,
+                                    subfolder,
+                                    subfolder.replace(' ', '_').lower(),
+                                    entry.get("content_hash", "")
+                                ))
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                print(f"[ERROR] Listing folder: {e}")
+                return None
+
+            finally:
+                if next_page is not None and not next_page.done():
+                    next_page.cancel()
+
+        return all_files
 
     def get_temporary_link(self, file_path: str) -> Optional[str]:
         """
@@ -230,32 +609,51 @@ class CloudStorageProcessor:
         data = {"path": file_path}
 
         try:
-            response = requests.post(url, headers=self.headers, json=data)
+            response = self._post(url, headers=self.headers, json=data)
             response.raise_for_status()
             return response.json().get("link")
         except requests.exceptions.RequestException as e:
             print(f"  [ERROR] Getting temporary link: {e}")
             return None
 
-    def get_or_create_shared_link(self, file_path: str) -> Optional[str]:
+    def get_or_create_shared_link(
+        self,
+        file_path: str,
+        file_id: Optional[str] = None
+    ) -> Optional[str]:
         """
         Get or create a permanent shared link for a file.
 
-        First tries to get existing links, then creates if none exist.
+        Links are cached by file id, so a cached file needs no API calls.
+        Otherwise tries to get existing links, then creates if none exist.
         Handles 409 conflict errors (link already exists).
 
         Args:
             file_path: Dropbox path to the file
+            file_id: Dropbox file id ("id:..."), enables the link cache
 
         Returns:
             Shareable URL or None
         """
+        if file_id and file_id in self._link_cache:
+            return self._link_cache[file_id]
+
+        url = self._link_index.get(file_path.lower()) if self._link_index else None
+        if not url:
+            url = self._request_shared_link(file_path)
+        if url and file_id:
+            self._remember_link(file_id, url)
+            self.save_link_cache()
+        return url
+
+    def _request_shared_link(self, file_path: str) -> Optional[str]:
+        """Look up or create a shared link through the API (no cache)."""
         # Try to get existing links first
         list_url = "https://api.dropboxapi.com/2/sharing/list_shared_links"
         list_data = {"path": file_path}
 
         try:
-            response = requests.post(list_url, headers=self.headers, json=list_data)
+            response = self._post(list_url, headers=self.headers, json=list_data)
             if response.status_code == 200:
                 links = response.json().get("links", [])
                 if links:
@@ -275,14 +673,14 @@ class CloudStorageProcessor:
         }
 
         try:
-            response = requests.post(create_url, headers=self.headers, json=create_data)
+            response = self._post(create_url, headers=self.headers, json=create_data)
 
             if response.status_code == 200:
                 return response.json().get("url")
 
             elif response.status_code == 409:
                 # Link already exists - try to get it again
-                response = requests.post(list_url, headers=self.headers, json=list_data)
+                response = self._post(list_url, headers=self.headers, json=list_data)
                 if response.status_code == 200:
                     links = response.json().get("links", [])
                     if links:
@@ -293,9 +691,28 @@ class CloudStorageProcessor:
 
         return None
 
+    def _download_headers(self, file_path: str) -> Dict[str, str]:
+        """
+        Headers for a files/download call.
+
+        No Content-Type: the request has no body, and Dropbox rejects
+        application/json here. json.dumps escapes non-ASCII characters,
+        which HTTP headers can't carry.
+
+        Args:
+            file_path: Dropbox path to the file
+
+        Returns:
+            Request headers
+        """
+        return {
+            "Authorization": f"Bearer {self.access_token}",
+            "Dropbox-API-Arg": json.dumps({"path": file_path})
+        }
+
     def download_file(self, file_path: str, output_path: Path) -> bool:
         """
-        Download a file using temporary link.
+        Download a file in a single files/download request.
 
         Args:
             file_path: Dropbox path to the file
@@ -304,32 +721,592 @@ class CloudStorageProcessor:
         Returns:
             True if successful, False otherwise
         """
-        temp_link = self.get_temporary_link(file_path)
-        if not temp_link:
+        try:
+            # iter_content wraps urllib3 read errors in requests exceptions;
+            # the with block releases the connection on every path
+            with self._post(
+                self.DOWNLOAD_URL, headers=self._download_headers(file_path), stream=True
+            ) as response:
+                response.raise_for_status()
+
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(output_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+
+            return True
+
+        except requests.exceptions.RequestException as e:
+            print(f"  [ERROR] Download failed: {e}")
             return False
 
+    def download_to_buffer(self, file_path: str) -> Optional[io.BytesIO]:
+        """
+        Download a file into memory in a single files/download request.
+
+        Args:
+            file_path: Dropbox path to the file
+
+        Returns:
+            Buffer positioned at the start of the file, or None
+        """
+        try:
+            # Same streaming as download_file, into memory
+            with self._post(
+                self.DOWNLOAD_URL, headers=self._download_headers(file_path), stream=True
+            ) as response:
+                response.raise_for_status()
+
+                buffer = io.BytesIO()
+                for chunk in response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
+                    buffer.write(chunk)
+
+            buffer.seek(0)
+            return buffer
+
+        except requests.exceptions.RequestException as e:
+            print(f"  [ERROR] Download failed: {e}")
+            return None
+
+    def _load_link_cache(self) -> Tuple[Dict[str, str], Dict[str, Dict]]:
+        """
+        Read the shared-link cache written by earlier runs.
+
+        Returns:
+            ({file_id: share_url}, {file_id: processing record}), empty if
+            missing or unreadable
+        """
+        try:
+            cached = json.loads(self._link_cache_path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return {}, {}
+        except (OSError, ValueError) as e:
+            print(f"[WARNING] Ignoring unreadable link cache: {e}")
+            return {}, {}
+
+        if not isinstance(cached, dict) or cached.get('version') != self.LINK_CACHE_VERSION:
+            return {}, {}
+        links = cached.get('links')
+        processed = cached.get('processed')  # Absent in caches from older runs
+        return (
+            links if isinstance(links, dict) else {},
+            processed if isinstance(processed, dict) else {}
+        )
+
+    def _remember_link(self, file_id: str, url: str) -> None:
+        """Add a shared link to the in-memory cache."""
+        if self._link_cache.get(file_id) != url:
+            self._link_cache[file_id] = url
+            self._link_cache_pending += 1
+
+    def _remember_processed(self, file_info: DropboxFile, result: Dict) -> None:
+        """
+        Record a successful conversion so unchanged files skip the next run.
+
+        Args:
+            file_info: File from list_folder
+            result: Processing result (kept for the next run's summary)
+        """
+        if not file_info.id or not file_info.modified:
+            return
+
+        self._processed_cache[file_info.id] = {
+            "modified": file_info.modified,
+            "size": file_info.size,
+            "result": result
+        }
+        self._link_cache_pending += 1
+        if self._link_cache_pending >= self.LINK_CACHE_FLUSH_EVERY:
+            self.save_link_cache()
+
+    def _cached_result(self, file_info: DropboxFile) -> Optional[Dict]:
+        """
+        Look up the last run's result for a file that hasn't changed since.
+
+        A file counts as unchanged when its path, client_modified and size
+        match what was recorded after its last successful conversion and
+        that conversion's output is still on disk. No API call is made.
+
+        Args:
+            file_info: File from list_folder
+
+        Returns:
+            The earlier processing result, or None if the file needs work
+        """
+        record = self._processed_cache.get(file_info.id)
+        if not isinstance(record, dict):
+            return None
+        if record.get("modified") != file_info.modified or record.get("size") != file_info.size:
+            return None
+
+        result = record.get("result")
+        if not isinstance(result, dict) or not result.get("output_path"):
+            return None
+        if result.get("cloud_path") != file_info.path:
+            return None  # Moved or renamed: output belongs somewhere else now
+        return result if Path(result["output_path"]).exists() else None
+
+    def save_link_cache(self) -> None:
+        """
+        Write pending shared links and processing records to the cache file.
+
+        Writes to a temporary file and renames it, so a crash mid-write
+        never leaves a half-written cache behind.
+        """
+        if not self._link_cache_pending:
+            return
+
+        cached = {
+            'version': self.LINK_CACHE_VERSION,
+            'links': self._link_cache,
+            'processed': self._processed_cache
+        }
+        tmp_path = self._link_cache_path.with_name(self._link_cache_path.name + '.tmp')
+
         try:
-            response = requests.get(temp_link, stream=True)
+            tmp_path.write_text(json.dumps(cached), encoding='utf-8')
+            os.replace(tmp_path, self._link_cache_path)
+            self._link_cache_pending = 0
+        except OSError as e:
+            print(f"[WARNING] Could not save link cache: {e}")
+
+    def _new_session(self) -> aiohttp.ClientSession:
+        """
+        Open a pooled aiohttp session with a fresh rate limiter.
+
+        Must be called from a running event loop.
+
+        Returns:
+            ClientSession (use as an async context manager)
+        """
+        self._limiter = AdaptiveRateLimiter(self.requests_per_second)
+        connector = aiohttp.TCPConnector(
+            limit=self.CONNECTION_POOL_SIZE,
+            limit_per_host=self.CONNECTION_POOL_SIZE
+        )
+        return aiohttp.ClientSession(connector=connector)
+
+    async def _post_json(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        data: Dict
+    ) -> Dict:
+        """
+        POST a Dropbox API call and return the decoded JSON response.
+
+        Args:
+            session: aiohttp session
+            url: API endpoint
+            data: JSON request body
+
+        Returns:
+            Decoded response
+
+        Raises:
+            aiohttp.ClientResponseError: On a non-2xx response
+        """
+        async with self._request(session, 'POST', url, headers=self.headers, json=data) as response:
+            if response.status >= 400:
+                print(f"  Response: {(await response.text())[:200]}")
             response.raise_for_status()
+            return await response.json(loads=orjson.loads if HAS_ORJSON else json.loads)
+
+    @asynccontextmanager
+    async def _request(
+        self,
+        session: aiohttp.ClientSession,
+        method: str,
+        url: str,
+        **kwargs
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """
+        Send a batch request through the rate limiter.
+
+        Throttled (HTTP 429) requests are retried up to MAX_RETRIES times
+        after the limiter backs off; any other response is yielded as is
+        (an HTTP 401 also drops the trusted token check).
+
+        Args:
+            session: Batch aiohttp session
+            method: HTTP method
+            url: Request URL
+            **kwargs: Passed to session.request
 
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+        Yields:
+            The response (released on exit)
+        """
+        for attempt in range(self.MAX_RETRIES + 1):
+            await self._limiter.acquire()
+            response = await session.request(method, url, **kwargs)
+
+            if response.status != 429:
+                self._limiter.success()
+                if response.status == 401:
+                    self._forget_token_check()
+                break
+            if attempt == self.MAX_RETRIES:
+                break
+
+            self.stats['requests_throttled'] += 1
+            retry_after = response.headers.get('Retry-After')
+            response.release()
+            await self._limiter.backoff(retry_after, attempt)
+
+        try:
+            yield response
+        finally:
+            response.release()
+
+    async def _list_shared_link_async(
+        self,
+        session: aiohttp.ClientSession,
+        file_path: str
+    ) -> Optional[str]:
+        """Return the first existing shared link for a file, if any."""
+        list_url = "https://api.dropboxapi.com/2/sharing/list_shared_links"
+
+        async with self._request(
+            session, 'POST', list_url, headers=self.headers, json={"path": file_path}
+        ) as response:
+            if response.status == 200:
+                links = (await response.json()).get("links", [])
+                if links:
+                    return links[0].get("url")
+        return None
+
+    async def _prefetch_shared_links(
+        self,
+        session: aiohttp.ClientSession
+    ) -> Optional[Dict[str, str]]:
+        """
+        List every shared link on the account in one paginated call.
+
+        Replaces a list_shared_links lookup per file with a few pages
+        for the whole batch.
+
+        Args:
+            session: Batch aiohttp session
+
+        Returns:
+            {path_lower: url} (first link per path), or None on error
+        """
+        url = "https://api.dropboxapi.com/2/sharing/list_shared_links"
+        index: Dict[str, str] = {}
+        data: Dict = {}
+
+        try:
+            while True:
+                result = await self._post_json(session, url, data)
+
+                for link in result.get("links", []):
+                    path = link.get("path_lower")
+                    if path and link.get("url"):
+                        index.setdefault(path, link["url"])
+
+                if not result.get("has_more") or not result.get("cursor"):
+                    return index
+                data = {"cursor": result["cursor"]}
+
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            print(f"  [WARN] Could not prefetch shared links: {e}")
+            return None
+
+    async def _get_or_create_shared_link_async(
+        self,
+        session: aiohttp.ClientSession,
+        file_path: str,
+        file_id: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Async get_or_create_shared_link over a shared session.
+
+        Checks the link cache, then the prefetched link index; when the
+        index is loaded, a file missing from it has no link, so one is
+        created without a per-file lookup. New links are added to the
+        cache, which is flushed every LINK_CACHE_FLUSH_EVERY links (and
+        at the end of the batch).
+
+        Args:
+            session: Batch aiohttp session
+            file_path: Dropbox path to the file
+            file_id: Dropbox file id ("id:..."), enables the link cache
+
+        Returns:
+            Shareable URL or None
+        """
+        if file_id and file_id in self._link_cache:
+            return self._link_cache[file_id]
+
+        if self._link_index is not None:
+            url = self._link_index.get(file_path.lower())
+            if not url:
+                url = await self._request_shared_link_async(session, file_path, lookup=False)
+        else:
+            url = await self._request_shared_link_async(session, file_path)
+        if url and file_id:
+            self._remember_link(file_id, url)
+            if self._link_cache_pending >= self.LINK_CACHE_FLUSH_EVERY:
+                self.save_link_cache()
+        return url
+
+    async def _request_shared_link_async(
+        self,
+        session: aiohttp.ClientSession,
+        file_path: str,
+        lookup: bool = True
+    ) -> Optional[str]:
+        """
+        Async _request_shared_link: look up or create a link (no cache).
+
+        Args:
+            session: Batch aiohttp session
+            file_path: Dropbox path to the file
+            lookup: Check for an existing link before creating one
+
+        Returns:
+            Shareable URL or None
+        """
+        # Try to get existing links first
+        if lookup:
+            try:
+                url = await self._list_shared_link_async(session, file_path)
+                if url:
+                    return url
+            except Exception:
+                pass  # Fall through to create
+
+        # Create new shared link
+        create_url = "https://api.dropboxapi.com/2/sharing/create_shared_link_with_settings"
+        create_data = {
+            "path": file_path,
+            "settings": {
+                "requested_visibility": "public",
+                "audience": "public",
+                "access": "viewer"
+            }
+        }
+
+        try:
+            async with self._request(
+                session, 'POST', create_url, headers=self.headers, json=create_data
+            ) as response:
+                if response.status == 200:
+                    return (await response.json()).get("url")
+                conflict = response.status == 409
+
+            if conflict:
+                # Link already exists - try to get it again
+                return await self._list_shared_link_async(session, file_path)
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"  [WARN] Could not create share link: {e}")
+
+        return None
+
+    async def _download_file_async(
+        self,
+        session: aiohttp.ClientSession,
+        file_path: str,
+        output_path: Path,
+        size: int = 0
+    ) -> bool:
+        """
+        Async download_file over a shared session.
+
+        Files over RANGED_DOWNLOAD_THRESHOLD are split into byte ranges
+        fetched in parallel, falling back to one stream if that fails.
+
+        Args:
+            session: Batch aiohttp session
+            file_path: Dropbox path to the file
+            output_path: Local path to save the file
+            size: Size reported by list_folder (0 if unknown)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if size > self.RANGED_DOWNLOAD_THRESHOLD:
+            try:
+                await self._download_ranges(session, file_path, output_path, size)
+                return True
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                output_path.unlink(missing_ok=True)  # Drop the partly written file
+                print(f"  [WARN] Ranged download failed, retrying as one stream: {e}")
+
+        try:
+            async with self._request(
+                session, 'POST', self.DOWNLOAD_URL, headers=self._download_headers(file_path)
+            ) as response:
+                response.raise_for_status()
+
+                async with async_file_writer(output_path) as write:
+                    async for chunk in response.content.iter_chunked(self.DOWNLOAD_CHUNK_SIZE):
+                        await write(chunk)
 
             return True
 
-        except requests.exceptions.RequestException as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             print(f"  [ERROR] Download failed: {e}")
             return False
 
-    def list_root_folders(self) -> List[str]:
+    async def _download_ranges(
+        self,
+        session: aiohttp.ClientSession,
+        file_path: str,
+        output_path: Path,
+        size: int
+    ) -> None:
+        """
+        Download a file as RANGED_DOWNLOAD_PARTS parallel Range requests.
+
+        The file is sized up front and each part writes through its own
+        handle, starting at its offset.
+
+        Args:
+            session: Batch aiohttp session
+            file_path: Dropbox path to the file
+            output_path: Local path to save the file
+            size: Expected file size in bytes
+
+        Raises:
+            aiohttp.ClientError: On a failed request
+            ValueError: If the server ignores the range or the size is off
+        """
+        part_size = -(-size // self.RANGED_DOWNLOAD_PARTS)  # Ceiling division
+        ranges = [
+            (start, min(start + part_size, size) - 1)
+            for start in range(0, size, part_size)
+        ]
+
+        async def fetch(start: int, end: int) -> None:
+            headers = {**self._download_headers(file_path), "Range": f"bytes={start}-{end}"}
+            async with self._request(session, 'POST', self.DOWNLOAD_URL, headers=headers) as response:
+                response.raise_for_status()
+                if response.status != 206:
+                    raise ValueError(f"range request answered with HTTP {response.status}")
+
+                offset = start
+                async with async_file_writer(output_path, 'r+b', start) as write:
+                    async for chunk in response.content.iter_chunked(self.DOWNLOAD_CHUNK_SIZE):
+                        await write(chunk)
+                        offset += len(chunk)
+
+            if offset != end + 1:
+                raise ValueError(f"got {offset - start} of {end + 1 - start} bytes for {start}-{end}")
+
+        with open(output_path, 'wb') as f:
+            f.truncate(size)
+
+        tasks = [asyncio.create_task(fetch(start, end)) for start, end in ranges]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            # One failed part fails the file; stop the others writing
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    @staticmethod
+    def _remote_mtime(file_info: DropboxFile) -> Optional[float]:
+        """
+        Parse a file's client_modified time.
+
+        Args:
+            file_info: File from list_folder
+
+        Returns:
+            POSIX timestamp, or None if missing or malformed
+        """
+        modified = file_info.modified
+        if not modified:
+            return None
+        try:
+            # Dropbox sends UTC as "2024-01-31T12:00:00Z"
+            parsed = datetime.strptime(modified, "%Y-%m-%dT%H:%M:%SZ")
+        except ValueError:
+            return None
+        return parsed.replace(tzinfo=timezone.utc).timestamp()
+
+    def _is_file_in_sync(self, local_path: Path, file_info: DropboxFile) -> bool:
+        """
+        Check whether a local download still matches the Dropbox file.
+
+        The local copy matches when its size equals the remote size and its
+        mtime equals client_modified (set by _mark_in_sync after download).
+
+        Args:
+            local_path: Local download path
+            file_info: File from list_folder
+
+        Returns:
+            True if the file doesn't need downloading again
+        """
+        mtime = self._remote_mtime(file_info)
+        if mtime is None:
+            return False
+
+        try:
+            stat = local_path.stat()
+        except OSError:
+            return False
+
+        return stat.st_size == file_info.size and int(stat.st_mtime) == int(mtime)
+
+    def _mark_in_sync(self, local_path: Path, file_info: DropboxFile) -> None:
+        """Stamp a fresh download with the file's client_modified time."""
+        mtime = self._remote_mtime(file_info)
+        if mtime is None:
+            return
+        try:
+            os.utime(local_path, (mtime, mtime))
+        except OSError as e:
+            print(f"  [WARN] Could not set modified time: {e}")
+
+    async def _download_bytes_async(
+        self,
+        session: aiohttp.ClientSession,
+        file_path: str
+    ) -> Optional[bytes]:
+        """
+        Async download_to_buffer over a shared session.
+
+        Args:
+            session: Batch aiohttp session
+            file_path: Dropbox path to the file
+
+        Returns:
+            File contents, or None if the download failed
+        """
+        try:
+            async with self._request(
+                session, 'POST', self.DOWNLOAD_URL, headers=self._download_headers(file_path)
+            ) as response:
+                response.raise_for_status()
+                return await response.read()
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"  [ERROR] Download failed: {e}")
+            return None
+
+    def list_root_folders(self, force: bool = False) -> List[str]:
         """
         List folders in the root for exploration.
 
+        The listing is requested once per processor; later calls return it
+        without printing.
+
+        Args:
+            force: Ask Dropbox again instead of using the earlier listing
+
         Returns:
             List of folder paths
         """
+        if self._root_folders is not None and not force:
+            return list(self._root_folders)
+
         url = "https://api.dropboxapi.com/2/files/list_folder"
         data = {
             "path": "",
@@ -340,7 +1317,7 @@ class CloudStorageProcessor:
         folders = []
 
         try:
-            response = requests.post(url, headers=self.headers, json=data)
+            response = self._post(url, headers=self.headers, json=data)
             if response.status_code == 200:
                 print("\nAvailable folders:")
                 print("-" * 40)
@@ -350,25 +1327,27 @@ class CloudStorageProcessor:
                         folders.append(path)
                         print(f"  {path}")
                 print("-" * 40)
+                self._root_folders = list(folders)
         except Exception as e:
             print(f"[ERROR] Listing root: {e}")
 
         return folders
 
-    def process_folder(self, folder_path: str = "") -> Dict:
+    def process_folder(self, folder_path: str = "", force: bool = False) -> Dict:
         """
         List and process all files from a folder.
 
         Complete workflow:
         1. Validate token
         2. List all files recursively
-        3. Download each file
+        3. Download each file (skipping files unchanged since the last run)
         4. Get/create shared links
         5. Process with DocumentProcessor
         6. Generate summary
 
         Args:
             folder_path: Dropbox folder path
+            force: Process every file, even ones unchanged since the last run
 
         Returns:
             Processing summary dictionary
@@ -399,14 +1378,9 @@ class CloudStorageProcessor:
             return {"status": "error", "message": "No files found"}
 
         # Organize by subfolder
-        files_by_folder: Dict[str, List] = {}
+        files_by_folder: Dict[str, List[DropboxFile]] = defaultdict(list)
         for file_info in all_files:
-            path_parts = file_info["path"].split("/")
-            subfolder = path_parts[2] if len(path_parts) > 3 else "root"
-
-            if subfolder not in files_by_folder:
-                files_by_folder[subfolder] = []
-            files_by_folder[subfolder].append(file_info)
+            files_by_folder[file_info.subfolder].append(file_info)
 
         print("\nFiles by folder:")
         for folder, files in files_by_folder.items():
@@ -420,72 +1394,15 @@ class CloudStorageProcessor:
         print("Processing files...")
         print("=" * 60)
 
-        for i, file_info in enumerate(all_files, 1):
-            file_name = file_info["name"]
-            file_path = file_info["path"]
-            file_size = file_info["size"]
-
-            # Skip large files
-            if file_size > self.MAX_FILE_SIZE:
-                size_mb = file_size / 1024 / 1024
-                print(f"\n[{i}/{len(all_files)}] Skipping (too large): {file_name}")
-                print(f"  Size: {size_mb:.1f} MB (max: 50 MB)")
-                errors.append(f"{file_name}: Too large ({size_mb:.1f} MB)")
-                self.stats['files_skipped'] += 1
-                continue
-
-            print(f"\n[{i}/{len(all_files)}] {file_name}")
-            print(f"  Size: {file_size / 1024:.1f} KB")
-
-            # Determine output subfolder
-            path_parts = file_path.split("/")
-            subfolder = path_parts[2].replace(' ', '_').lower() if len(path_parts) > 3 else "root"
-
-            # Download file
-            download_dir = self.output_dir / "downloads" / subfolder
-            download_dir.mkdir(parents=True, exist_ok=True)
-            download_path = download_dir / file_name
-
-            if self.download_file(file_path, download_path):
-                print("  [OK] Downloaded")
-
-                # Get shareable link
-                share_url = self.get_or_create_shared_link(file_path)
-                if share_url:
-                    print(f"  [OK] Share URL obtained")
-                else:
-                    share_url = f"dropbox://{file_path}"
-                    print(f"  [WARN] Using fallback URL")
-
-                # Process document
-                try:
-                    self.processor.output_dir = self.output_dir / subfolder
-                    self.processor.output_dir.mkdir(parents=True, exist_ok=True)
-
-                    result = self.processor.process_file(download_path, source_url=share_url)
-
-                    if result.get('status') == 'success':
-                        result['folder'] = subfolder
-                        result['cloud_path'] = file_path
-                        result['share_url'] = share_url
-                        processed_files.append(result)
-                        self.stats['files_processed'] += 1
-                        self.stats['bytes_processed'] += file_size
-                        print(f"  [OK] Processed")
-                    else:
-                        errors.append(f"{file_name}: Processing failed")
-                        self.stats['files_failed'] += 1
-
-                except Exception as e:
-                    errors.append(f"{file_name}: {str(e)}")
-                    self.stats['files_failed'] += 1
-                    print(f"  [ERROR] {e}")
-            else:
-                errors.append(f"{file_name}: Download failed")
-                self.stats['files_failed'] += 1
-
-            # Rate limiting
-            time.sleep(0.5)
+        try:
+            for result, error in asyncio.run(self._process_files_async(all_files, force)):
+                if result:
+                    processed_files.append(result)
+                if error:
+                    errors.append(error)
+        finally:
+            # Keep every link fetched so far, even if the batch was interrupted
+            self.save_link_cache()
 
         # Save summary
         summary = {
@@ -498,8 +1415,11 @@ class CloudStorageProcessor:
         }
 
         summary_path = self.output_dir / "processing_summary.json"
-        with open(summary_path, 'w') as f:
-            json.dump(summary, f, indent=2)
+        if HAS_ORJSON:
+            summary_path.write_bytes(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
+        else:
+            with open(summary_path, 'w') as f:
+                json.dump(summary, f, indent=2)
 
         # Print summary
         print("\n" + "=" * 60)
@@ -508,7 +1428,13 @@ class CloudStorageProcessor:
         print(f"Files found: {self.stats['files_found']}")
         print(f"Processed: {self.stats['files_processed']}")
         print(f"Skipped: {self.stats['files_skipped']}")
+        if self.stats['files_skipped_cached']:
+            print(f"Unchanged since last run: {self.stats['files_skipped_cached']}")
+        if self.stats['files_deduplicated']:
+            print(f"Duplicates reused: {self.stats['files_deduplicated']}")
         print(f"Failed: {self.stats['files_failed']}")
+        if self.stats['requests_throttled']:
+            print(f"Throttled requests retried: {self.stats['requests_throttled']}")
         print(f"Total data: {self.stats['bytes_processed'] / 1024 / 1024:.1f} MB")
 
         if errors:
@@ -523,9 +1449,336 @@ class CloudStorageProcessor:
 
         return summary
 
+    async def _process_files_async(
+        self,
+        all_files: List[DropboxFile],
+        force: bool = False
+    ) -> List[Tuple[Optional[Dict], Optional[str]]]:
+        """
+        Download, link and process all files over one aiohttp session.
+
+        Up to max_concurrent files are downloaded at once, with every
+        request going through an AdaptiveRateLimiter, while downloaded
+        files are converted in the parse pool. Files that share a download
+        path or markdown name are chained so they still run in listing
+        order, keeping duplicate suffixes stable. Files with the same
+        content_hash wait for the first one and reuse its conversion.
+        Files unchanged since their last successful conversion reuse that
+        result without any request.
+
+        Args:
+            all_files: Files from list_folder
+            force: Process unchanged files too
+
+        Returns:
+            One (result, error) pair per file, in listing order
+        """
+        sem = asyncio.Semaphore(self.max_concurrent)
+        # Downloads keep going while parse_workers files convert, but no
+        # further, so finished downloads can't pile up in memory
+        pipeline = asyncio.Semaphore(self.max_concurrent + self.parse_workers)
+        last_by_name: Dict[Tuple[str, str], asyncio.Task] = {}
+        first_by_hash: Dict[str, asyncio.Task] = {}
+        tasks = []
+
+        # Unchanged files are settled before anything touches the network
+        results: List = []
+        pending: List[Tuple[int, Dict]] = []
+        for i, file_info in enumerate(all_files, 1):
+            cached = None if force else self._cached_result(file_info)
+            if cached is not None:
+                if self.verbose:
+                    print(f"\n[{i}/{len(all_files)}] Unchanged since last run: {file_info.name}")
+                self.stats['files_skipped_cached'] += 1
+                results.append((cached, None))
+            else:
+                results.append(None)
+                pending.append((i, file_info))
+
+        if not pending:
+            return results
+
+        if self.parse_processes:
+            self._parse_pool = ProcessPoolExecutor(max_workers=self.parse_workers)
+        else:
+            self._parse_pool = ThreadPoolExecutor(
+                max_workers=self.parse_workers, thread_name_prefix='dropbox-parse'
+            )
+
+        try:
+            async with self._new_session() as session:
+                # Only worth listing every link if some file isn't cached yet
+                if any(f.id not in self._link_cache for _, f in pending):
+                    self._link_index = await self._prefetch_shared_links(session)
+                    if self._link_index is not None:
+                        print(f"Prefetched {len(self._link_index)} shared links\n")
+
+                for i, file_info in pending:
+                    key = (file_info.subfolder_safe, Path(file_info.name).stem.lower())
+
+                    task = asyncio.create_task(self._process_one(
+                        session, sem, pipeline, i, len(all_files), file_info,
+                        last_by_name.get(key), first_by_hash.get(file_info.content_hash)
+                    ))
+                    last_by_name[key] = task
+                    if file_info.content_hash:
+                        first_by_hash.setdefault(file_info.content_hash, task)
+                    tasks.append(task)
+
+                if not self.verbose:
+                    self._track_progress(tasks, len(all_files))
+
+                for (i, _), outcome in zip(pending, await asyncio.gather(*tasks)):
+                    results[i - 1] = outcome
+                return results
+        finally:
+            # Every task has finished (or failed) by now, so this doesn't wait long
+            self._parse_pool.shutdown(wait=True)
+            self._parse_pool = None
+
+    def _track_progress(self, tasks: List[asyncio.Task], total: int) -> None:
+        """
+        Print a one-line progress report as file tasks finish.
+
+        A line is printed at most every PROGRESS_INTERVAL seconds (and once
+        the last task is done) instead of several lines per file.
+
+        Args:
+            tasks: Per-file tasks of the batch
+            total: Files in the listing, including ones already settled
+        """
+        done = total - len(tasks)
+        last_report = 0.0
+
+        def on_done(_task: asyncio.Task) -> None:
+            nonlocal done, last_report
+            done += 1
+            now = time.monotonic()
+            if done == total or now - last_report >= self.PROGRESS_INTERVAL:
+                last_report = now
+                print(
+                    f"  Progress: {done}/{total} files "
+                    f"({self.stats['files_processed']} processed, "
+                    f"{self.stats['files_failed']} failed)"
+                )
+
+        for task in tasks:
+            task.add_done_callback(on_done)
+
+    async def _process_one(
+        self,
+        session: aiohttp.ClientSession,
+        sem: asyncio.Semaphore,
+        pipeline: asyncio.Semaphore,
+        index: int,
+        total: int,
+        file_info: DropboxFile,
+        after: Optional[asyncio.Task] = None,
+        same_content: Optional[asyncio.Task] = None
+    ) -> Tuple[Optional[Dict], Optional[str]]:
+        """
+        Download, link and process a single file.
+
+        A duplicate of an already converted file only gets its own shared
+        link; the download and conversion are reused.
+
+        Args:
+            session: Batch aiohttp session
+            sem: Semaphore bounding concurrent downloads
+            pipeline: Semaphore bounding files downloaded or converting
+            index: 1-based position in the listing (for progress output)
+            total: Number of files in the listing
+            file_info: File from list_folder
+            after: Earlier file with the same local name to wait for
+            same_content: Earlier file with the same content_hash
+
+        Returns:
+            (result, error) - result on success, error message otherwise
+        """
+        file_name = file_info.name
+        file_path = file_info.path
+        file_size = file_info.size
+
+        # Skip large files
+        if file_size > self.MAX_FILE_SIZE:
+            size_mb = file_size / 1024 / 1024
+            print(f"\n[{index}/{total}] Skipping (too large): {file_name}")
+            print(f"  Size: {size_mb:.1f} MB (max: 50 MB)")
+            self.stats['files_skipped'] += 1
+            return None, f"{file_name}: Too large ({size_mb:.1f} MB)"
+
+        # Same bytes as a file converted earlier: reuse its output
+        if same_content is not None:
+            await asyncio.wait([same_content])
+        source = self._hash_results.get(file_info.content_hash) if file_info.content_hash else None
+        if source is not None and Path(source["output_path"]).exists():
+            return await self._reuse_result(session, sem, index, total, file_info, source)
+
+        if after is not None:
+            await asyncio.wait([after])
+
+        # Bounds the files held between download and conversion
+        async with pipeline:
+            async with sem:
+                if self.verbose:
+                    print(f"\n[{index}/{total}] {file_name}")
+                    print(f"  Size: {file_size / 1024:.1f} KB")
+
+                subfolder = file_info.subfolder_safe
+
+                # Download file
+                download_dir = self.output_dir / "downloads" / subfolder
+                download_dir.mkdir(parents=True, exist_ok=True)
+                download_path = download_dir / file_name
+
+                data = None  # Contents of small files, parsed without re-reading
+
+                # The link lookup runs alongside the download, so its round
+                # trip is hidden behind the transfer
+                link_task = asyncio.create_task(self._get_or_create_shared_link_async(
+                    session, file_path, file_info.id
+                ))
+
+                # A download left by an earlier run is reused if it still matches
+                if self._is_file_in_sync(download_path, file_info):
+                    downloaded = True
+                    self.stats['files_up_to_date'] += 1
+                    if self.verbose:
+                        print(f"  [OK] Already downloaded: {file_name}")
+                elif file_size < self.IN_MEMORY_LIMIT:
+                    data = await self._download_bytes_async(session, file_path)
+                    downloaded = data is not None
+                    if downloaded:
+                        # Still saved once, for the summary and the next run's resume check
+                        async with async_file_writer(download_path) as write:
+                            await write(data)
+                        self._mark_in_sync(download_path, file_info)
+                        if self.verbose:
+                            print(f"  [OK] Downloaded: {file_name}")
+                else:
+                    downloaded = await self._download_file_async(
+                        session, file_path, download_path, file_size
+                    )
+                    if downloaded:
+                        self._mark_in_sync(download_path, file_info)
+                        if self.verbose:
+                            print(f"  [OK] Downloaded: {file_name}")
+
+                if not downloaded:
+                    link_task.cancel()
+                    self.stats['files_failed'] += 1
+                    return None, f"{file_name}: Download failed"
+
+                # Get shareable link
+                share_url = await link_task
+                if share_url:
+                    if self.verbose:
+                        print(f"  [OK] Share URL obtained: {file_name}")
+                else:
+                    share_url = f"dropbox://{file_path}"
+                    print(f"  [WARN] Using fallback URL: {file_name}")
+
+            # Process document (CPU-bound: runs in the parse pool, freeing the
+            # download slot for the next file)
+            result = None
+            error = None
+
+            try:
+                output_dir = self.output_dir / subfolder
+                output_dir.mkdir(parents=True, exist_ok=True)
+
+                loop = asyncio.get_running_loop()
+                if data is not None:
+                    result = await loop.run_in_executor(
+                        self._parse_pool, self.processor.process_bytes,
+                        download_path, data, share_url, output_dir
+                    )
+                else:
+                    result = await loop.run_in_executor(
+                        self._parse_pool, self.processor.process_file,
+                        download_path, share_url, output_dir
+                    )
+
+                if result.get('status') == 'success':
+                    result['folder'] = subfolder
+                    result['cloud_path'] = file_path
+                    result['share_url'] = share_url
+                    self.stats['files_processed'] += 1
+                    self.stats['bytes_processed'] += file_size
+                    self._remember_processed(file_info, result)
+                    if file_info.content_hash:
+                        self._hash_results.setdefault(file_info.content_hash, result)
+                    if self.verbose:
+                        print(f"  [OK] Processed: {file_name}")
+                else:
+                    result = None
+                    error = f"{file_name}: Processing failed"
+                    self.stats['files_failed'] += 1
+
+            except Exception as e:
+                result = None
+                error = f"{file_name}: {str(e)}"
+                self.stats['files_failed'] += 1
+                print(f"  [ERROR] {e}")
+
+        return result, error
+
+    async def _reuse_result(
+        self,
+        session: aiohttp.ClientSession,
+        sem: asyncio.Semaphore,
+        index: int,
+        total: int,
+        file_info: DropboxFile,
+        source: Dict
+    ) -> Tuple[Optional[Dict], Optional[str]]:
+        """
+        Point a duplicate file at the conversion of its twin.
+
+        Args:
+            session: Batch aiohttp session
+            sem: Semaphore bounding concurrent requests
+            index: 1-based position in the listing (for progress output)
+            total: Number of files in the listing
+            file_info: Duplicate file from list_folder
+            source: Result of the file with the same content_hash
+
+        Returns:
+            (result, None)
+        """
+        async with sem:
+            share_url = await self._get_or_create_shared_link_async(
+                session, file_info.path, file_info.id
+            )
+        if not share_url:
+            share_url = f"dropbox://{file_info.path}"
+            print(f"  [WARN] Using fallback URL: {file_info.name}")
+
+        result = dict(
+            source,
+            folder=file_info.subfolder_safe,
+            cloud_path=file_info.path,
+            share_url=share_url,
+            duplicate_of=source.get("duplicate_of", source["cloud_path"])
+        )
+        self.stats['files_deduplicated'] += 1
+        self._remember_processed(file_info, result)
+
+        if self.verbose:
+            print(f"\n[{index}/{total}] {file_info.name}")
+            print(f"  [OK] Same content as {result['duplicate_of']}, reusing its output")
+
+        return result, None
+
 
 def main():
     """Command-line interface."""
+    # --force reprocesses files unchanged since the last run;
+    # --quiet prints progress lines instead of every step for every file
+    force = '--force' in sys.argv[1:]
+    quiet = '--quiet' in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg not in ('--force', '--quiet')]
+
     # Get token from environment
     token = os.getenv('DROPBOX_ACCESS_TOKEN')
 
@@ -534,17 +1787,17 @@ def main():
         print("\nSet in environment or .env file:")
         print("  DROPBOX_ACCESS_TOKEN=your_token_here")
 
-        if len(sys.argv) > 1:
-            token = sys.argv[1]
+        if args:
+            token = args[0]
         else:
             sys.exit(1)
 
     # Get folder path from arguments
-    folder_path = sys.argv[2] if len(sys.argv) > 2 else ""
+    folder_path = args[1] if len(args) > 1 else ""
 
     # Process
-    processor = CloudStorageProcessor(token)
-    result = processor.process_folder(folder_path)
+    processor = CloudStorageProcessor(token, verbose=not quiet)
+    result = processor.process_folder(folder_path, force=force)
 
     if result.get("status") == "error":
         sys.exit(1)
@@ -8,30 +8,163 @@ Supports: PDF, DOCX, PPTX, XLSX, and plain text files.
 Production features:
 - Robust error handling per file
 - Table extraction with markdown formatting
+- Native PDFium text extraction when pypdfium2 is installed
 - Slide-by-slide PowerPoint processing
 - Speaker notes extraction
 - Heading detection from document styles
-- Batch processing with summary generation
+- Batch processing across a process pool, with summary generation
 
 Author: Scott Allen
 """
 
 import argparse
+import io
 import json
 import os
 import re
+import shutil
 import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain, islice
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
 
 import PyPDF2
 import requests
+from urllib3.util.retry import Retry
 from docx import Document
 from openpyxl import load_workbook
 # Document processing libraries
 from pptx import Presentation
 
+# Optional: faster JSON serialization for batch summaries
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Optional: native PDFium text extraction, much faster than PyPDF2
+try:
+    import pypdfium2 as pdfium
+    HAS_PDFIUM = True
+except ImportError:
+    HAS_PDFIUM = False
+
+# A document on disk, or one already read into a binary file object
+Source = Union[Path, BinaryIO]
+
+# Precompiled patterns for slide bullets and Word heading styles
+BULLET_RE = re.compile(r'^[•\-*▪►○●]\s*')
+HEADING_LEVEL_RE = re.compile(r'\d+')
+
+
+def _source_arg(source: Source) -> Union[str, BinaryIO]:
+    """Return what the parsing libraries accept: a path string or the file object."""
+    return source if hasattr(source, 'read') else str(source)
+
+
+def _md_row(cells: Iterable[str]) -> str:
+    """Format one markdown table row."""
+    return "| " + " | ".join(cells) + " |"
+
+
+@lru_cache(maxsize=64)
+def _md_separator(columns: int) -> str:
+    """Markdown header separator row for a table with this many columns."""
+    return _md_row(["---"] * columns)
+
+
+def _md_table(headers: List[str], rows: Iterable[Iterable[str]]) -> str:
+    """Format headers, separator and rows as markdown table lines in one join."""
+    separator = _md_separator(len(headers))
+    return '\n'.join(chain((_md_row(headers), separator), map(_md_row, rows)))
+
+
+def _table_markdown(table) -> str:
+    """
+    Format a python-pptx or python-docx table as a markdown section.
+
+    The first row is used as headers. Rows are iterated rather than sliced,
+    which python-pptx's row collection doesn't support.
+    """
+    rows = iter(table.rows)
+    first = next(rows, None)
+    headers = [cell.text.strip() for cell in first.cells] if first is not None else []
+    if not headers:
+        return "\n### Table\n"
+
+    data_rows = ([cell.text.strip() for cell in row.cells] for row in rows)
+    return "\n### Table\n\n" + _md_table(headers, data_rows)
+
+
+# Per-process DocumentProcessor for process_batch workers
+_worker_processor: Optional['DocumentProcessor'] = None
+
+
+def _init_worker(output_dir: str, verbose: bool) -> None:
+    """Create the worker process's DocumentProcessor (pool initializer)."""
+    global _worker_processor
+    _worker_processor = DocumentProcessor(output_dir=output_dir, verbose=verbose)
+
+
+def _dispatch(item: str, source_url: Optional[str] = None) -> Dict:
+    """Process one batch item in a worker process."""
+    return _worker_processor.process_item(item, source_url)
+
+
+def _extract_page_range(data: bytes, start: int, stop: int) -> List[str]:
+    """
+    Extract the text of pages [start, stop) with a reader of its own.
+
+    PdfReader seeks and reads a shared stream while pages are decoded, so each
+    thread parses its own copy instead of sharing one reader.
+    """
+    pages = PyPDF2.PdfReader(io.BytesIO(data)).pages
+    return [pages[i].extract_text() or '' for i in range(start, stop)]
+
+
+# PDFium is a process-wide C library that must never be entered from two
+# threads at once, even for different documents (callers such as
+# CloudStorageProcessor convert files on a thread pool). Reentrant so a
+# document closed during garbage collection can't deadlock its own thread.
+_PDFIUM_LOCK = threading.RLock()
+
+
+def _pdfium_page_texts(source: Source) -> Iterator[str]:
+    """
+    Yield the text of every page with PDFium, one page loaded at a time.
+
+    Every PDFium call (open, each page, close) holds _PDFIUM_LOCK. The lock
+    is released between pages, so a suspended iterator never blocks other
+    threads.
+    """
+    with _PDFIUM_LOCK:
+        pdf = pdfium.PdfDocument(_source_arg(source))
+        num_pages = len(pdf)
+    try:
+        for index in range(num_pages):
+            with _PDFIUM_LOCK:
+                page = pdf[index]
+                try:
+                    textpage = page.get_textpage()
+                    try:
+                        text = textpage.get_text_range()
+                    finally:
+                        textpage.close()
+                finally:
+                    page.close()
+            # PDFium ends lines with CRLF; match PyPDF2's output
+            yield text.replace('\r\n', '\n')
+    finally:
+        with _PDFIUM_LOCK:
+            pdf.close()
+
 
 class DocumentProcessor:
     """
@@ -47,19 +180,77 @@ class DocumentProcessor:
     All output is formatted as markdown for downstream RAG processing.
     """
 
-    def __init__(self, output_dir: str = "./output/documents"):
+    # URL downloads: bytes per read/write, pooled connections per host,
+    # retries for connection errors and transient server responses
+    DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+    CONNECTION_POOL_SIZE = 16
+    MAX_RETRIES = 3
+    DOWNLOAD_WORKERS = 8  # Concurrent downloads per batch
+
+    # Quiet batches print a progress line at most this often (seconds)
+    PROGRESS_INTERVAL = 1.0
+
+    # Extension -> method returning the document's markdown (PDF and plain
+    # text are streamed into the output file by _process_source instead)
+    CONTENT_HANDLERS = {
+        '.ppt': 'process_pptx',
+        '.pptx': 'process_pptx',
+        '.doc': 'process_docx',
+        '.docx': 'process_docx',
+        '.xls': 'process_xlsx',
+        '.xlsx': 'process_xlsx',
+    }
+    TEXT_EXTENSIONS = frozenset(['.txt', '.md'])
+
+    # Characters per read when copying text files into their markdown
+    TEXT_CHUNK_SIZE = 1024 * 1024
+
+    # Markdown output buffer: streamed pages and chunks reach the disk in
+    # large writes rather than 8 KB ones
+    OUTPUT_BUFFER_SIZE = 1024 * 1024
+
+    # Between PDF pages in the markdown output
+    PAGE_SEPARATOR = '\n\n---\n\n'
+
+    # PyPDF2 fallback: PDFs with at least this many pages are split across threads
+    PDF_PARALLEL_MIN_PAGES = 32
+    PDF_PAGE_WORKERS = 4
+
+    def __init__(self, output_dir: str = "./output/documents", verbose: bool = True):
         """
         Initialize the document processor.
 
         Args:
             output_dir: Directory to save processed markdown files
+            verbose: Print lines per converted or downloaded file (errors
+                always print); quiet batches report periodic progress instead
         """
+        self.verbose = verbose
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.downloads_dir = self.output_dir / "downloads"
         self.downloads_dir.mkdir(exist_ok=True)
 
-    def process_pptx(self, file_path: Path) -> str:
+        # Next output-name suffix to try, by (output dir, stem)
+        self._stem_counter: Dict[Tuple[Path, str], int] = {}
+
+        # Reused across URL downloads for keep-alive connections (requests
+        # already asks for gzip/deflate; download_file decodes it)
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=self.CONNECTION_POOL_SIZE,
+            pool_maxsize=self.CONNECTION_POOL_SIZE,
+            max_retries=Retry(
+                total=self.MAX_RETRIES,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                raise_on_status=False  # raise_for_status reports the last response
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def process_pptx(self, file_path: Source) -> str:
         """
         Extract text from PowerPoint presentation.
 
@@ -71,13 +262,13 @@ class DocumentProcessor:
         - Speaker notes extraction
 
         Args:
-            file_path: Path to the PPTX file
+            file_path: Path to (or binary file object of) the PPTX file
 
         Returns:
             Extracted text content formatted as markdown
         """
         try:
-            prs = Presentation(str(file_path))
+            prs = Presentation(_source_arg(file_path))
             content = []
 
             # Extract title from metadata
@@ -88,19 +279,29 @@ class DocumentProcessor:
             for slide_num, slide in enumerate(prs.slides, 1):
                 slide_content = []
 
+                # python-pptx rebuilds shape lookups and text from the XML on
+                # every access, so each is read once into a local
+                shapes = slide.shapes
+
                 # Extract slide title
-                if slide.shapes.title:
-                    title_text = slide.shapes.title.text.strip()
+                title_shape = shapes.title
+                if title_shape:
+                    title_text = title_shape.text.strip()
                     if title_text:
                         slide_content.append(f"## Slide {slide_num}: {title_text}\n")
                 else:
                     slide_content.append(f"## Slide {slide_num}\n")
 
-                # Extract text from all shapes
-                for shape in slide.shapes:
-                    if hasattr(shape, "text") and shape.text:
-                        text = shape.text.strip()
-                        if text and text not in slide_content:
+                # Extract text and tables in one pass over the shapes; tables
+                # still follow the text (seen mirrors the texts added to
+                # slide_content, for constant-time duplicate checks)
+                seen = set()
+                tables = []
+                for shape in shapes:
+                    text = getattr(shape, "text", None)
+                    if text:
+                        text = text.strip()
+                        if text and text not in seen:
                             # Format multi-line text as bullet points
                             if '\n' in text:
                                 lines = text.split('\n')
@@ -109,35 +310,20 @@ class DocumentProcessor:
                                     line = line.strip()
                                     if line:
                                         # Normalize bullet characters
-                                        if line.startswith(('•', '-', '*', '▪', '►', '○', '●')):
-                                            formatted_lines.append(f"- {line[1:].strip()}")
-                                        else:
-                                            formatted_lines.append(f"- {line}")
+                                        formatted_lines.append(f"- {BULLET_RE.sub('', line, count=1)}")
                                 text = '\n'.join(formatted_lines)
+                            seen.add(text)
                             slide_content.append(text)
 
-                # Extract tables
-                for shape in slide.shapes:
                     if shape.has_table:
-                        table = shape.table
-                        table_content = ["\n### Table\n"]
-
-                        # Create markdown table
-                        if table.rows:
-                            headers = [cell.text.strip() for cell in table.rows[0].cells]
-                            if headers:
-                                table_content.append("| " + " | ".join(headers) + " |")
-                                table_content.append("| " + " | ".join(["---"] * len(headers)) + " |")
-
-                                for row in table.rows[1:]:
-                                    row_data = [cell.text.strip() for cell in row.cells]
-                                    table_content.append("| " + " | ".join(row_data) + " |")
+                        tables.append(_table_markdown(shape.table))
 
-                        slide_content.append('\n'.join(table_content))
+                slide_content.extend(tables)
 
                 # Extract speaker notes
-                if slide.has_notes_slide and slide.notes_slide.notes_text_frame:
-                    notes_text = slide.notes_slide.notes_text_frame.text.strip()
+                notes_frame = slide.notes_slide.notes_text_frame if slide.has_notes_slide else None
+                if notes_frame:
+                    notes_text = notes_frame.text.strip()
                     if notes_text:
                         slide_content.append(f"\n**Speaker Notes:**\n{notes_text}")
 
@@ -151,7 +337,7 @@ class DocumentProcessor:
             print(f"  [ERROR] Processing PPTX: {e}")
             return f"[Error processing PowerPoint file: {e}]"
 
-    def process_docx(self, file_path: Path) -> str:
+    def process_docx(self, file_path: Source) -> str:
         """
         Extract text from Word document.
 
@@ -161,13 +347,13 @@ class DocumentProcessor:
         - Table extraction with markdown formatting
 
         Args:
-            file_path: Path to the DOCX file
+            file_path: Path to (or binary file object of) the DOCX file
 
         Returns:
             Extracted text content formatted as markdown
         """
         try:
-            doc = Document(str(file_path))
+            doc = Document(_source_arg(file_path))
             content = []
 
             # Extract paragraphs with heading detection
@@ -177,7 +363,7 @@ class DocumentProcessor:
                     # Detect headings based on style
                     if para.style.name.startswith('Heading'):
                         # Extract heading level (Heading 1, Heading 2, etc.)
-                        level_match = re.search(r'\d+', para.style.name)
+                        level_match = HEADING_LEVEL_RE.search(para.style.name)
                         level = int(level_match.group()) if level_match else 1
                         prefix = '#' * level
                         content.append(f"{prefix} {text}\n")
@@ -186,21 +372,7 @@ class DocumentProcessor:
 
             # Extract tables
             for table in doc.tables:
-                table_content = ["\n### Table\n"]
-
-                if table.rows:
-                    # First row as headers
-                    headers = [cell.text.strip() for cell in table.rows[0].cells]
-
-                    if headers:
-                        table_content.append("| " + " | ".join(headers) + " |")
-                        table_content.append("| " + " | ".join(["---"] * len(headers)) + " |")
-
-                        for row in table.rows[1:]:
-                            row_data = [cell.text.strip() for cell in row.cells]
-                            table_content.append("| " + " | ".join(row_data) + " |")
-
-                content.append('\n'.join(table_content))
+                content.append(_table_markdown(table))
 
             return '\n\n'.join(content)
 
@@ -208,84 +380,133 @@ class DocumentProcessor:
             print(f"  [ERROR] Processing DOCX: {e}")
             return f"[Error processing Word document: {e}]"
 
-    def process_pdf(self, file_path: Path) -> str:
+    def process_pdf(self, file_path: Source) -> str:
         """
         Extract text from PDF document.
 
-        Page-by-page extraction with page number markers.
+        Page-by-page extraction with page number markers. Uses PDFium when
+        pypdfium2 is installed, otherwise PyPDF2.
 
         Args:
-            file_path: Path to the PDF file
+            file_path: Path to (or binary file object of) the PDF file
 
         Returns:
             Extracted text content
         """
         try:
-            content = []
-
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                num_pages = len(pdf_reader.pages)
-
-                for page_num, page in enumerate(pdf_reader.pages, 1):
-                    page_text = page.extract_text()
-                    if page_text:
-                        page_text = page_text.strip()
-                        if page_text:
-                            content.append(f"### Page {page_num}\n\n{page_text}")
-
-            return '\n\n---\n\n'.join(content)
+            return self.PAGE_SEPARATOR.join(self.iter_pdf_pages(file_path))
 
         except Exception as e:
             print(f"  [ERROR] Processing PDF: {e}")
             return f"[Error processing PDF: {e}]"
 
-    def process_xlsx(self, file_path: Path) -> str:
+    def iter_pdf_pages(self, file_path: Source) -> Iterator[str]:
+        """
+        Yield the markdown for each non-empty PDF page as it's extracted.
+
+        Args:
+            file_path: Path to (or binary file object of) the PDF file
+
+        Yields:
+            One "### Page N" section per page with text
+        """
+        if HAS_PDFIUM:
+            page_texts = _pdfium_page_texts(file_path)
+        else:
+            page_texts = self._pypdf2_page_texts(file_path)
+
+        for page_num, page_text in enumerate(page_texts, 1):
+            if page_text:
+                page_text = page_text.strip()
+                if page_text:
+                    yield f"### Page {page_num}\n\n{page_text}"
+
+    def _pypdf2_page_texts(self, file_path: Source) -> Iterator[str]:
+        """
+        Yield the text of every page with PyPDF2.
+
+        Large PDFs are split into page ranges extracted on a small thread pool.
+        (PDFium isn't thread-safe, and is fast enough serially.)
+        """
+        # File objects are read in place; paths are opened (and closed) here
+        opened = nullcontext(file_path) if hasattr(file_path, 'read') else open(file_path, 'rb')
+
+        with opened as file:
+            pdf_reader = PyPDF2.PdfReader(file)
+            num_pages = len(pdf_reader.pages)
+
+            if num_pages < self.PDF_PARALLEL_MIN_PAGES:
+                for page in pdf_reader.pages:
+                    yield page.extract_text()
+                return
+
+            file.seek(0)
+            data = file.read()
+
+        step = -(-num_pages // self.PDF_PAGE_WORKERS)
+        with ThreadPoolExecutor(max_workers=self.PDF_PAGE_WORKERS) as executor:
+            ranges = executor.map(
+                lambda start: _extract_page_range(data, start, min(start + step, num_pages)),
+                range(0, num_pages, step)
+            )
+            for texts in ranges:
+                yield from texts
+
+    def process_xlsx(self, file_path: Source) -> str:
         """
         Extract text from Excel spreadsheet.
 
         Sheet-by-sheet extraction with markdown table formatting.
 
         Args:
-            file_path: Path to the XLSX file
+            file_path: Path to (or binary file object of) the XLSX file
 
         Returns:
             Extracted text content formatted as markdown
         """
         try:
-            wb = load_workbook(str(file_path), data_only=True)
-            content = []
+            # Read-only mode streams rows from the sheet XML instead of
+            # building every cell object up front
+            wb = load_workbook(_source_arg(file_path), data_only=True, read_only=True)
+            try:
+                content = []
+
+                for sheet_name in wb.sheetnames:
+                    sheet = wb[sheet_name]
+
+                    # The stored <dimension> can understate the used range,
+                    # and read-only mode would stop rows at it
+                    sheet.reset_dimensions()
+
+                    # Collect rows
+                    rows = []
+                    for row in sheet.iter_rows(values_only=True):
+                        # Filter out completely empty rows
+                        if any(cell is not None for cell in row):
+                            rows.append([
+                                str(cell) if cell is not None else ""
+                                for cell in row
+                            ])
+
+                    if rows:
+                        # Read-only rows can be ragged: pad each to the widest
+                        width = max(len(row) for row in rows)
+
+                        # First row as headers
+                        headers = rows[0] + [""] * (width - len(rows[0]))
+
+                        # Data rows
+                        data_rows = (
+                            row + [""] * (width - len(row))
+                            for row in islice(rows, 1, None)
+                        )
+                        content.append(f"## Sheet: {sheet_name}\n\n" + _md_table(headers, data_rows))
+                    else:
+                        content.append(f"## Sheet: {sheet_name}\n")
 
-            for sheet_name in wb.sheetnames:
-                sheet = wb[sheet_name]
-                sheet_content = [f"## Sheet: {sheet_name}\n"]
-
-                # Collect rows
-                rows = []
-                for row in sheet.iter_rows(values_only=True):
-                    # Filter out completely empty rows
-                    if any(cell is not None for cell in row):
-                        rows.append([
-                            str(cell) if cell is not None else ""
-                            for cell in row
-                        ])
-
-                if rows:
-                    # First row as headers
-                    headers = rows[0]
-                    sheet_content.append("| " + " | ".join(headers) + " |")
-                    sheet_content.append("| " + " | ".join(["---"] * len(headers)) + " |")
-
-                    # Data rows
-                    for row in rows[1:]:
-                        # Ensure row has same number of columns as headers
-                        while len(row) < len(headers):
-                            row.append("")
-                        sheet_content.append("| " + " | ".join(row[:len(headers)]) + " |")
-
-                content.append('\n'.join(sheet_content))
-
-            return '\n\n---\n\n'.join(content)
+                return '\n\n---\n\n'.join(content)
+            finally:
+                wb.close()
 
         except Exception as e:
             print(f"  [ERROR] Processing XLSX: {e}")
@@ -310,58 +531,120 @@ class DocumentProcessor:
                 url = url.replace('www.dropbox.com', 'dl.dropboxusercontent.com')
                 url = url.replace('dl=0', 'raw=1')
 
-            print(f"  Downloading: {url[:60]}...")
+            if self.verbose:
+                print(f"  Downloading: {url[:60]}...")
 
-            response = requests.get(url, stream=True, timeout=60)
-            response.raise_for_status()
+            with self.session.get(url, stream=True, timeout=60) as response:
+                response.raise_for_status()
 
-            with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+                # Copy the raw stream in large reads (still gunzipped if the
+                # server compressed it) rather than 8 KB iter_content chunks
+                response.raw.decode_content = True
+                with open(output_path, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f, length=self.DOWNLOAD_CHUNK_SIZE)
 
-            print(f"  [OK] Downloaded to: {output_path.name}")
+            if self.verbose:
+                print(f"  [OK] Downloaded to: {output_path.name}")
             return True
 
         except Exception as e:
             print(f"  [ERROR] Download failed: {e}")
             return False
 
-    def process_file(self, file_path: Path, source_url: Optional[str] = None) -> Dict:
+    def process_file(
+        self,
+        file_path: Path,
+        source_url: Optional[str] = None,
+        output_dir: Optional[Path] = None
+    ) -> Dict:
         """
         Process any supported document type.
 
         Args:
             file_path: Path to the document file
             source_url: Optional source URL for metadata
+            output_dir: Where to save the markdown (default: self.output_dir);
+                lets concurrent callers target different folders
 
         Returns:
             Dictionary with processing results
         """
         file_path = Path(file_path)
+        return self._process_source(file_path, file_path, source_url, output_dir)
+
+    def process_bytes(
+        self,
+        file_name: Union[str, Path],
+        data: bytes,
+        source_url: Optional[str] = None,
+        output_dir: Optional[Path] = None
+    ) -> Dict:
+        """
+        Process a document that is already in memory.
+
+        Gives the same markdown and result as process_file on a file with
+        these contents, without reading it from disk.
+
+        Args:
+            file_name: File name or path (sets the type, title and file_path)
+            data: Raw file contents
+            source_url: Optional source URL for metadata
+            output_dir: Where to save the markdown (default: self.output_dir)
+
+        Returns:
+            Dictionary with processing results
+        """
+        return self._process_source(Path(file_name), io.BytesIO(data), source_url, output_dir)
+
+    def _process_source(
+        self,
+        file_path: Path,
+        source: Source,
+        source_url: Optional[str],
+        output_dir: Optional[Path] = None
+    ) -> Dict:
+        """
+        Extract, format and save one document.
+
+        Args:
+            file_path: Document path (names the output and sets its type)
+            source: Where to read the contents from (file_path or a buffer)
+            source_url: Optional source URL for metadata
+            output_dir: Where to save the markdown (default: self.output_dir)
+
+        Returns:
+            Dictionary with processing results
+        """
+        output_dir = Path(output_dir) if output_dir is not None else self.output_dir
         extension = file_path.suffix.lower()
 
-        print(f"Processing {extension.upper()}: {file_path.name}")
+        if self.verbose:
+            print(f"Processing {extension.upper()}: {file_path.name}")
 
-        # Extract content based on file type
+        # Extract content based on file type (PDF pages and text files are
+        # streamed into the output file below, rather than joined here)
         content = ""
-        if extension in ['.ppt', '.pptx']:
-            content = self.process_pptx(file_path)
-        elif extension in ['.doc', '.docx']:
-            content = self.process_docx(file_path)
+        pdf_pages = None
+        text_file = None
+        handler = self.CONTENT_HANDLERS.get(extension)
+        if handler:
+            content = getattr(self, handler)(source)
         elif extension == '.pdf':
-            content = self.process_pdf(file_path)
-        elif extension in ['.xls', '.xlsx']:
-            content = self.process_xlsx(file_path)
-        elif extension in ['.txt', '.md']:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
+            pdf_pages = self.iter_pdf_pages(source)
+        elif extension in self.TEXT_EXTENSIONS:
+            # Opened here so open errors fail before an output file exists
+            if hasattr(source, 'read'):
+                # Same decoding and newline handling as text-mode open()
+                text_file = io.TextIOWrapper(source, encoding='utf-8', errors='ignore')
+            else:
+                text_file = open(source, 'r', encoding='utf-8', errors='ignore')
         else:
             content = f"[Unsupported file type: {extension}]"
 
         # Create markdown document with metadata
         title = file_path.stem.replace('-', ' ').replace('_', ' ').title()
 
-        markdown = f"""# {title}
+        header = f"""# {title}
 
 **Source:** {source_url or 'Local file'}
 **Type:** {extension[1:].upper()}
@@ -369,21 +652,38 @@ class DocumentProcessor:
 
 ---
 
-{content}
 """
 
-        # Save markdown file
-        output_file = self.output_dir / f"{file_path.stem}.md"
-
-        # Handle duplicates
-        counter = 1
-        while output_file.exists():
-            output_file = self.output_dir / f"{file_path.stem}_{counter}.md"
-            counter += 1
-
-        output_file.write_text(markdown, encoding='utf-8')
-
-        print(f"  [OK] Saved: {output_file.name}")
+        # Save markdown file, handling duplicates ('x' claims a name
+        # atomically, so parallel workers can never pick the same file).
+        # Probing resumes at the stem's next known-free suffix.
+        stem = file_path.stem
+        counter = self._stem_counter.get((output_dir, stem), 0)
+        with text_file if text_file is not None else nullcontext():
+            while True:
+                output_file = output_dir / (f"{stem}_{counter}.md" if counter else f"{stem}.md")
+                try:
+                    with open(output_file, 'x', encoding='utf-8', buffering=self.OUTPUT_BUFFER_SIZE) as f:
+                        f.write(header)
+                        if pdf_pages is not None:
+                            content_length = self._write_pdf_pages(f, pdf_pages)
+                        elif text_file is not None:
+                            content_length = 0
+                            for chunk in iter(lambda: text_file.read(self.TEXT_CHUNK_SIZE), ''):
+                                f.write(chunk)
+                                content_length += len(chunk)
+                        else:
+                            f.write(content)
+                            content_length = len(content)
+                        f.write('\n')
+                    break
+                except FileExistsError:
+                    counter += 1
+
+        self._stem_counter[(output_dir, stem)] = counter + 1
+
+        if self.verbose:
+            print(f"  [OK] Saved: {output_file.name}")
 
         return {
             'title': title,
@@ -391,10 +691,40 @@ class DocumentProcessor:
             'output_path': str(output_file),
             'extension': extension,
             'source_url': source_url,
-            'content_length': len(content),
+            'content_length': content_length,
             'status': 'success'
         }
 
+    def _write_pdf_pages(self, out: TextIO, pages: Iterator[str]) -> int:
+        """
+        Write PDF page sections to an open file as they're extracted.
+
+        Args:
+            out: Output markdown file, positioned after the header
+            pages: Page sections from iter_pdf_pages
+
+        Returns:
+            Number of content characters written
+        """
+        written = 0
+
+        def write(chunk: str) -> None:
+            nonlocal written
+            if written:
+                out.write(self.PAGE_SEPARATOR)
+                written += len(self.PAGE_SEPARATOR)
+            out.write(chunk)
+            written += len(chunk)
+
+        try:
+            for page in pages:
+                write(page)
+        except Exception as e:
+            print(f"  [ERROR] Processing PDF: {e}")
+            write(f"[Error processing PDF: {e}]")
+
+        return written
+
     def process_url(self, url: str) -> Dict:
         """
         Download and process a file from URL.
@@ -405,6 +735,16 @@ class DocumentProcessor:
         Returns:
             Dictionary with processing results
         """
+        # Download file
+        download_path = self.downloads_dir / self._url_filename(url)
+
+        if self.download_file(url, download_path):
+            return self.process_file(download_path, source_url=url)
+        else:
+            return self._download_failed(url)
+
+    def _url_filename(self, url: str) -> str:
+        """Local filename for a URL download (defaults to .pdf when unknown)."""
         # Extract filename from URL
         url_parts = url.split('/')
         filename_part = url_parts[-1] if url_parts else 'document'
@@ -414,56 +754,147 @@ class DocumentProcessor:
         if not any(filename.lower().endswith(ext) for ext in ['.pdf', '.docx', '.pptx', '.xlsx', '.txt']):
             filename += '.pdf'  # Default assumption
 
-        # Download file
-        download_path = self.downloads_dir / filename
+        return filename
 
-        if self.download_file(url, download_path):
-            return self.process_file(download_path, source_url=url)
-        else:
+    def _download_failed(self, url: str) -> Dict:
+        """Result for a URL that couldn't be downloaded."""
+        return {
+            'url': url,
+            'status': 'failed',
+            'error': 'Download failed'
+        }
+
+    def _download_urls(self, urls: List[str]) -> List[Optional[Path]]:
+        """
+        Download URLs concurrently into downloads_dir.
+
+        Downloads are I/O-bound, so they run on threads sharing this
+        processor's keep-alive session. URLs with the same filename go to
+        numbered subfolders so concurrent writes never collide.
+
+        Args:
+            urls: URLs to download
+
+        Returns:
+            Download path for each URL (None where the download failed)
+        """
+        paths = []
+        taken: Dict[str, int] = {}
+        for url in urls:
+            filename = self._url_filename(url)
+            n = taken.get(filename.lower(), 0)
+            taken[filename.lower()] = n + 1
+
+            folder = self.downloads_dir / str(n) if n else self.downloads_dir
+            folder.mkdir(exist_ok=True)
+            paths.append(folder / filename)
+
+        with ThreadPoolExecutor(max_workers=min(self.DOWNLOAD_WORKERS, len(urls))) as executor:
+            downloaded = list(executor.map(self.download_file, urls, paths))
+
+        return [path if ok else None for path, ok in zip(paths, downloaded)]
+
+    def process_item(self, item: str, source_url: Optional[str] = None) -> Dict:
+        """
+        Process one file path or URL, turning exceptions into a failed result.
+
+        Args:
+            item: File path or URL
+            source_url: URL a local item was downloaded from (for metadata)
+
+        Returns:
+            Dictionary with processing results
+        """
+        try:
+            if item.startswith('http'):
+                return self.process_url(item)
+            return self.process_file(Path(item), source_url=source_url)
+
+        except Exception as e:
+            print(f"  [ERROR] {e}")
             return {
-                'url': url,
-                'status': 'failed',
-                'error': 'Download failed'
+                'item': item,
+                'error': str(e),
+                'status': 'failed'
             }
 
-    def process_batch(self, items: List[str]) -> Dict:
+    def process_batch(self, items: List[str], workers: Optional[int] = None) -> Dict:
         """
         Process multiple files or URLs.
 
+        URLs are downloaded first, concurrently on threads. Documents are
+        independent, so they are then converted in a process pool (one
+        worker per CPU, minus one for this process). Results keep the order
+        of items.
+
         Args:
             items: List of file paths or URLs
+            workers: Worker processes (default: DOC_PROC_WORKERS, or CPUs - 1);
+                1 processes everything in this process
 
         Returns:
             Dictionary with processing summary
         """
-        results = []
-        errors = []
+        if workers is None:
+            workers = int(os.getenv('DOC_PROC_WORKERS', (os.cpu_count() or 2) - 1))
+        workers = max(1, min(workers, len(items)))
 
         print(f"\n{'=' * 60}")
         print(f"Processing {len(items)} items")
+        if workers > 1:
+            print(f"  Workers: {workers} processes")
         print(f"{'=' * 60}\n")
 
-        for i, item in enumerate(items, 1):
-            print(f"\n[{i}/{len(items)}]")
-
-            try:
-                if item.startswith('http'):
-                    result = self.process_url(item)
-                else:
-                    result = self.process_file(Path(item))
-
-                if result.get('status') == 'success':
-                    results.append(result)
+        outcomes: List[Optional[Dict]] = [None] * len(items)
+
+        # (path or URL, source URL) to convert for each item; downloaded
+        # URLs become local files, so conversion never waits on the network
+        jobs: List[Tuple[str, Optional[str]]] = [(item, None) for item in items]
+        url_indexes = [i for i, item in enumerate(items) if item.startswith('http')]
+        if url_indexes:
+            downloads = self._download_urls([items[i] for i in url_indexes])
+            for i, path in zip(url_indexes, downloads):
+                if path is None:
+                    outcomes[i] = self._download_failed(items[i])
                 else:
-                    errors.append(result)
+                    jobs[i] = (str(path), items[i])
+
+        pending = [i for i, outcome in enumerate(outcomes) if outcome is None]
+        first_done = len(items) - len(pending) + 1
+        last_report = 0.0
+
+        def report_progress(done: int) -> None:
+            """Quiet mode: one line at most every PROGRESS_INTERVAL seconds."""
+            nonlocal last_report
+            now = time.monotonic()
+            if done == len(items) or now - last_report >= self.PROGRESS_INTERVAL:
+                last_report = now
+                print(f"  Progress: {done}/{len(items)} items")
+
+        if workers == 1:
+            for done, i in enumerate(pending, first_done):
+                if self.verbose:
+                    print(f"\n[{i + 1}/{len(items)}]")
+                outcomes[i] = self.process_item(*jobs[i])
+                if not self.verbose:
+                    report_progress(done)
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(str(self.output_dir), self.verbose)
+            ) as pool:
+                futures = {pool.submit(_dispatch, *jobs[i]): i for i in pending}
+                for done, future in enumerate(as_completed(futures), first_done):
+                    i = futures[future]
+                    if self.verbose:
+                        print(f"[{done}/{len(items)}] Finished: {items[i]}")
+                    else:
+                        report_progress(done)
+                    outcomes[i] = future.result()
 
-            except Exception as e:
-                errors.append({
-                    'item': item,
-                    'error': str(e),
-                    'status': 'failed'
-                })
-                print(f"  [ERROR] {e}")
+        results = [r for r in outcomes if r.get('status') == 'success']
+        errors = [r for r in outcomes if r.get('status') != 'success']
 
         # Save processing summary
         summary = {
@@ -476,8 +907,11 @@ class DocumentProcessor:
         }
 
         summary_path = self.output_dir / 'processing_summary.json'
-        with open(summary_path, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2)
+        if HAS_ORJSON:
+            summary_path.write_bytes(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
+        else:
+            with open(summary_path, 'w', encoding='utf-8') as f:
+                json.dump(summary, f, indent=2)
 
         print(f"\n{'=' * 60}")
         print(f"Processing Complete")
@@ -510,18 +944,29 @@ def main():
         action='store_true',
         help='Test mode - process first item only'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Worker processes (default: DOC_PROC_WORKERS or CPU count - 1)'
+    )
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='Periodic progress lines instead of per-file output (errors still print)'
+    )
 
     args = parser.parse_args()
 
     # Create processor
-    processor = DocumentProcessor(output_dir=args.output_dir)
+    processor = DocumentProcessor(output_dir=args.output_dir, verbose=not args.quiet)
 
     # Process items
     items = args.items[:1] if args.test else args.items
     if args.test:
         print("Test mode: Processing first item only")
 
-    summary = processor.process_batch(items)
+    summary = processor.process_batch(items, workers=args.workers)
 
     # Exit with error code if any failed
     sys.exit(1 if summary['failed'] > 0 else 0)
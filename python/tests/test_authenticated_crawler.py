@@ -0,0 +1,47 @@
+"""
+Tests for AuthenticatedCrawler content extraction.
+
+Run from the python/ directory:
+    python -m unittest discover tests
+
+Author: Scott Allen
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'crawlers'))
+
+from authenticated_crawler import AuthenticatedCrawler  # noqa: E402
+
+
+class ExtractContentTest(unittest.TestCase):
+    """Main content selection in extract_content."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.crawler = AuthenticatedCrawler('https://example.com/', self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_content_inside_header_is_not_selected(self):
+        page_text = 'Real page text about soil testing. ' * 10
+        html = (
+            '<html><head><title>Soil</title></head><body>'
+            '<header><div class="content">Logo</div></header>'
+            f'<div id="content"><p>{page_text}</p></div>'
+            '</body></html>'
+        )
+
+        title, markdown, _, _ = self.crawler.extract_content(html, 'https://example.com/soil')
+
+        self.assertEqual(title, 'Soil')
+        self.assertIn('Real page text about soil testing.', markdown)
+        self.assertNotIn('Logo', markdown)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Tests for CloudStorageProcessor token validation.
+
+Run from the python/ directory:
+    python -m unittest discover tests
+
+Author: Scott Allen
+"""
+
+import json
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from processors.cloud_storage_processor import CloudStorageProcessor  # noqa: E402
+
+
+class FakeDropbox(requests.adapters.BaseAdapter):
+    """Transport adapter answering each API path with a fixed status."""
+
+    def __init__(self, statuses):
+        super().__init__()
+        self.statuses = statuses
+        self.calls = []
+
+    def send(self, request, **kwargs):
+        path = request.path_url
+        self.calls.append(path)
+
+        response = requests.Response()
+        response.status_code = self.statuses.get(path, 404)
+        response._content = json.dumps({'email': 'user@example.com'}).encode('utf-8')
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+class TokenCheckTest(unittest.TestCase):
+    """Trusted token checks and what invalidates them."""
+
+    ACCOUNT = '/2/users/get_current_account'
+    TEMP_LINK = '/2/files/get_temporary_link'
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        tmp = Path(self._tmp.name)
+        patcher = mock.patch.object(
+            CloudStorageProcessor, 'TOKEN_CHECK_CACHE', tmp / 'token_valid.json'
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.output_dir = str(tmp / 'out')
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _processor(self, statuses):
+        processor = CloudStorageProcessor('token', output_dir=self.output_dir, verbose=False)
+        fake = FakeDropbox(statuses)
+        processor.session.mount('https://', fake)
+        return processor, fake
+
+    def test_cached_check_skips_request(self):
+        self._processor({})[0]._save_token_check(time.time())
+
+        processor, fake = self._processor({self.ACCOUNT: 200})
+
+        self.assertTrue(processor.validate_token())
+        self.assertEqual(fake.calls, [])
+
+    def test_unauthorized_after_cached_check_forces_fresh_check(self):
+        self._processor({})[0]._save_token_check(time.time())
+
+        processor, fake = self._processor({self.TEMP_LINK: 401, self.ACCOUNT: 200})
+        self.assertIsNone(processor.get_temporary_link('/a.pdf'))
+
+        # The 401 dropped the trusted check, in memory and for later runs
+        checks = json.loads(CloudStorageProcessor.TOKEN_CHECK_CACHE.read_text(encoding='utf-8'))
+        self.assertNotIn(processor._token_hash, checks)
+
+        self.assertTrue(processor.validate_token())
+        self.assertEqual(fake.calls, [self.TEMP_LINK, self.ACCOUNT])
+
+if __name__ == '__main__':
+    unittest.main()